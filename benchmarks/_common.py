@@ -0,0 +1,58 @@
+import os
+import time
+from qtpy.QtCore import QEvent
+from qtpy.QtWidgets import QApplication
+
+_application = None
+
+
+def application() -> QApplication:
+    """Get the running QApplication, creating a headless one if necessary.
+    The offscreen platform is only chosen when a new application is created and no platform is set,
+    so importing the benchmarks (e.g. from the tests) never changes the platform of a running session
+
+    :return: application instance
+    """
+
+    global _application
+
+    app = QApplication.instance()
+    if app is None:
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        app = QApplication([])
+
+        # Kept alive for the lifetime of the process, so several runs share one application
+        _application = app
+    return app
+
+
+def delete_widgets(widgets: list):
+    """Deletes widgets right away (processEvents() does not run scheduled deletions) and empties the list
+
+    :param widgets: widgets to delete
+    """
+
+    for widget in widgets:
+        widget.deleteLater()
+    widgets.clear()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def measure(function, repeat: int = 5, teardown=None) -> float:
+    """Runs a function several times and returns the fastest run
+
+    :param function: callable to measure
+    :param repeat: number of runs
+    :param teardown: callable run after every run without being measured, e.g. to delete created widgets
+    :return: fastest run in milliseconds
+    """
+
+    best = float('inf')
+    for i in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, (time.perf_counter() - start) * 1000)
+        if teardown is not None:
+            teardown()
+    return best
+
@@ -0,0 +1,65 @@
+"""Compares building a form of 1,000 styled fields setter by setter with createMany()."""
+
+from benchmarks._common import application, measure
+from qtpy.QtCore import QMargins
+from qtpy.QtGui import QColor
+from qtpy.QtWidgets import QWidget
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+
+COUNT = 1000
+
+STYLE = {
+    'placeholder_font_size_inner': 11,
+    'placeholder_font_size_outer': 8,
+    'placeholder_color': QColor(120, 120, 120),
+    'color': QColor(20, 20, 20),
+    'background_color': QColor(250, 250, 250),
+    'border_color': QColor(200, 200, 200),
+    'border_width': 1,
+    'border_radius': 4,
+    'padding': QMargins(12, 0, 12, 0),
+    'hovered_border_color': QColor(120, 120, 120),
+    'focused_border_color': QColor(0, 120, 215),
+    'focused_border_width': 2,
+}
+
+SPECS = ['Field %d' % i for i in range(COUNT)]
+
+
+def create_with_setters():
+    """Builds the form by constructing every widget and calling each setter"""
+
+    parent = QWidget()
+    for text in SPECS:
+        widget = AnimatedLineEdit(text, parent)
+        widget.setPlaceholderFontSizeInner(STYLE['placeholder_font_size_inner'])
+        widget.setPlaceholderFontSizeOuter(STYLE['placeholder_font_size_outer'])
+        widget.setPlaceholderColor(STYLE['placeholder_color'])
+        widget.setColor(STYLE['color'])
+        widget.setBackgroundColor(STYLE['background_color'])
+        widget.setBorderColor(STYLE['border_color'])
+        widget.setBorderWidth(STYLE['border_width'])
+        widget.setBorderRadius(STYLE['border_radius'])
+        widget.setPadding(STYLE['padding'])
+        widget.setHoveredBorderColor(STYLE['hovered_border_color'])
+        widget.setFocusedBorderColor(STYLE['focused_border_color'])
+        widget.setFocusedBorderWidth(STYLE['focused_border_width'])
+    return parent
+
+
+def create_many():
+    """Builds the form with a single createMany() call"""
+
+    parent = QWidget()
+    AnimatedLineEdit.createMany(SPECS, parent, style=STYLE)
+    return parent
+
+
+if __name__ == '__main__':
+    app = application()
+
+    setters = measure(create_with_setters, repeat=3)
+    bulk = measure(create_many, repeat=3)
+
+    print('Setter by setter: %8.2f ms for %d fields (%6.2f us/field)' % (setters, COUNT, setters * 1000 / COUNT))
+    print('createMany():     %8.2f ms for %d fields (%6.2f us/field)' % (bulk, COUNT, bulk * 1000 / COUNT))
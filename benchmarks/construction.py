@@ -0,0 +1,49 @@
+"""Measures the construction cost of AnimatedLineEdit and the cost of the
+transition machinery that is only built once a widget gets focused."""
+
+from benchmarks._common import application, measure
+from qtpy.QtCore import QEasingCurve, QTimeLine
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+
+COUNT = 500
+
+
+def construct_widgets():
+    """Constructs COUNT widgets (transition machinery is created lazily)"""
+
+    return [AnimatedLineEdit('Placeholder') for i in range(COUNT)]
+
+
+def create_transitions(widgets):
+    """Creates the transition machinery of already constructed widgets"""
+
+    for widget in widgets:
+        widget._AnimatedLineEdit__ensure_transition()
+
+
+def create_eager_timelines():
+    """Builds the four configured QTimeLines every widget used to create in its constructor"""
+
+    timelines = []
+    for i in range(COUNT):
+        for j in range(4):
+            timeline = QTimeLine(250)
+            timeline.setFrameRange(0, 10)
+            timeline.setEasingCurve(QEasingCurve(QEasingCurve.Type.InOutCubic))
+            timeline.valueChanged.connect(timelines.append)
+            timelines.append(timeline)
+    return timelines
+
+
+if __name__ == '__main__':
+    app = application()
+
+    construction = measure(construct_widgets)
+    batches = iter([construct_widgets() for i in range(5)])
+    transitions = measure(lambda: create_transitions(next(batches)))
+    timelines = measure(create_eager_timelines)
+
+    print('Construction (lazy):               %8.2f us/widget' % (construction * 1000 / COUNT))
+    print('Transition created on first focus: %8.2f us/widget' % (transitions * 1000 / COUNT))
+    print('Previous eager QTimeLine setup:    %8.2f us/widget (saved for never focused widgets)'
+          % (timelines * 1000 / COUNT))
@@ -0,0 +1,51 @@
+"""Measures painting a view using AnimatedLineEditDelegate with a growing number of rows.
+
+Only the visible rows are painted and no widget exists per row, so the repaint cost stays flat."""
+
+from benchmarks._common import application, measure
+from qtpy.QtGui import QStandardItem, QStandardItemModel
+from qtpy.QtWidgets import QTableView
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+from src.pyqt_animated_line_edit.animated_line_edit_delegate import AnimatedLineEditDelegate
+
+ROW_COUNTS = (1000, 10000, 100000)
+REPAINTS = 20
+
+
+def create_view(rows: int) -> QTableView:
+    """Creates a shown view with a single column of alternately empty and filled items"""
+
+    model = QStandardItemModel(rows, 1)
+    model.setHorizontalHeaderLabels(['Name'])
+    for row in range(rows):
+        model.setItem(row, 0, QStandardItem('Row %d' % row if row % 2 else ''))
+
+    view = QTableView()
+    view.setItemDelegate(AnimatedLineEditDelegate(view))
+    view.setModel(model)
+    view.verticalHeader().setDefaultSectionSize(45)
+    view.horizontalHeader().setStretchLastSection(True)
+    view.resize(300, 600)
+    view.show()
+    return view
+
+
+if __name__ == '__main__':
+    app = application()
+
+    for rows in ROW_COUNTS:
+        view = create_view(rows)
+        app.processEvents()
+        viewport = view.viewport()
+
+        def repaint():
+            for i in range(REPAINTS):
+                viewport.repaint()
+
+        duration = measure(repaint) / REPAINTS
+        widgets = len(viewport.findChildren(AnimatedLineEdit))
+        print('%6d rows: %6.3f ms per repaint, %d widgets' % (rows, duration, widgets))
+
+        view.close()
+        view.deleteLater()
+        app.processEvents()
@@ -0,0 +1,53 @@
+"""Measures the import cost of the package with `python -X importtime` and the cost of the
+first access of AnimatedLineEdit, which is the point where Qt gets imported."""
+
+import os
+import subprocess
+import sys
+
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+PACKAGE = 'pyqt_animated_line_edit'
+
+
+def measure_imports(statement: str) -> dict:
+    """Runs a statement in a fresh interpreter with -X importtime
+
+    :param statement: Python statement to run
+    :return: dict mapping the names of all imported modules to their cumulative import time in microseconds
+    """
+
+    environment = dict(os.environ, PYTHONPATH=SOURCE_PATH)
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                             env=environment, capture_output=True, text=True, check=True)
+    modules = {}
+
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(cumulative)
+
+    return modules
+
+
+def measure_first_access() -> float:
+    """Measures the first access of AnimatedLineEdit in a fresh interpreter after importing the package
+
+    :return: duration of the first access in milliseconds
+    """
+
+    environment = dict(os.environ, PYTHONPATH=SOURCE_PATH)
+    statement = ('import time, %s; start = time.perf_counter(); %s.AnimatedLineEdit; '
+                 'print((time.perf_counter() - start) * 1000)' % (PACKAGE, PACKAGE))
+    process = subprocess.run([sys.executable, '-c', statement],
+                             env=environment, capture_output=True, text=True, check=True)
+    return float(process.stdout)
+
+
+if __name__ == '__main__':
+    modules = measure_imports('import %s' % PACKAGE)
+
+    print('import %s:    %8.2f ms (Qt imported: %s)'
+          % (PACKAGE, modules[PACKAGE] / 1000, 'qtpy' in modules))
+    print('first access of AnimatedLineEdit:   %8.2f ms' % measure_first_access())
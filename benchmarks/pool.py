@@ -0,0 +1,78 @@
+"""Compares fresh construction of AnimatedLineEdits with recycling them through an AnimatedLineEditPool,
+both for the widget lifecycle alone and for building and tearing down shown wizard pages."""
+
+from benchmarks._common import application, measure
+from qtpy.QtCore import QEvent
+from qtpy.QtWidgets import QApplication, QVBoxLayout, QWidget
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+from src.pyqt_animated_line_edit.animated_line_edit_pool import AnimatedLineEditPool
+
+COUNT = 50
+PAGES = 10
+
+
+def delete_later():
+    """Deletes the widgets scheduled for deletion (processEvents() does not)"""
+
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def cycle_fresh(parent):
+    """Constructs COUNT widgets and deletes them again"""
+
+    widgets = [AnimatedLineEdit('Field %d' % i, parent) for i in range(COUNT)]
+    for widget in widgets:
+        widget.deleteLater()
+    delete_later()
+
+
+def cycle_pooled(pool, parent):
+    """Acquires COUNT widgets from the pool and releases them again"""
+
+    widgets = [pool.acquire('Field %d' % i, parent) for i in range(COUNT)]
+    for widget in widgets:
+        pool.release(widget)
+
+
+def show_page(window, create, release=None):
+    """Builds a page of COUNT fields in a window, types into one of them and tears the page down again"""
+
+    page = QWidget(window)
+    layout = QVBoxLayout(page)
+    widgets = [create('Field %d' % i, page) for i in range(COUNT)]
+    for widget in widgets:
+        layout.addWidget(widget)
+    page.show()
+    widgets[0].setText('Text')
+    QApplication.processEvents()
+
+    page.hide()
+    if release is not None:
+        for widget in widgets:
+            release(widget)
+    page.deleteLater()
+    delete_later()
+
+
+if __name__ == '__main__':
+    app = application()
+
+    window = QWidget()
+    window.resize(300, COUNT * 40)
+    window.show()
+
+    pool = AnimatedLineEditPool(COUNT)
+    fresh = measure(lambda: [cycle_fresh(window) for i in range(PAGES)])
+    pooled = measure(lambda: [cycle_pooled(pool, window) for i in range(PAGES)])
+
+    print('Widget lifecycle (%d widgets):' % (COUNT * PAGES))
+    print('  Fresh widgets: %8.2f ms' % fresh)
+    print('  Pooled:        %8.2f ms' % pooled)
+
+    fresh = measure(lambda: [show_page(window, AnimatedLineEdit) for i in range(PAGES)])
+    pooled = measure(lambda: [show_page(window, pool.acquire, pool.release) for i in range(PAGES)])
+
+    print('Shown pages (%d pages of %d fields):' % (PAGES, COUNT))
+    print('  Fresh widgets: %8.2f ms' % fresh)
+    print('  Pooled:        %8.2f ms' % pooled)
+    print('Pool statistics: %s' % pool.getStatistics())
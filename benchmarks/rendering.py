@@ -0,0 +1,108 @@
+"""Compares paint and hover costs of the stylesheet and the painter rendering mode."""
+
+from benchmarks._common import application, measure
+from qtpy.QtCore import QEvent, QMargins, QPointF, Qt
+from qtpy.QtGui import QColor, QEnterEvent, QPixmapCache
+from qtpy.QtWidgets import QApplication, QWidget
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+from src.pyqt_animated_line_edit.animation_scheduler import AnimationScheduler
+
+COUNT = 50
+REPAINTS = 20
+
+
+def create_form(painter_rendering: bool):
+    """Creates a shown window containing COUNT styled widgets"""
+
+    window = QWidget()
+    window.resize(300, COUNT * 40)
+    widgets = []
+
+    for i in range(COUNT):
+        widget = AnimatedLineEdit('Placeholder %d' % i, window)
+        widget.setGeometry(10, i * 40, 200, 35)
+        widget.applyStyle(border_radius=4, padding=QMargins(12, 0, 12, 0),
+                          hovered_border_color=QColor(0, 0, 255), hovered_background_color=QColor(240, 240, 255))
+        widget.setPainterRenderingEnabled(painter_rendering)
+        widgets.append(widget)
+
+    window.show()
+    QApplication.processEvents()
+    return window, widgets
+
+
+def repaint(widgets):
+    """Repaints every widget synchronously"""
+
+    for i in range(REPAINTS):
+        for widget in widgets:
+            widget.repaint()
+
+
+def hover(widgets):
+    """Moves the (simulated) mouse into and out of every widget, repainting after each change"""
+
+    for widget in widgets:
+        for under_mouse in (True, False):
+            widget.setAttribute(Qt.WidgetAttribute.WA_UnderMouse, under_mouse)
+            if under_mouse:
+                QApplication.sendEvent(widget, QEnterEvent(QPointF(5, 5), QPointF(5, 5), QPointF(5, 5)))
+            else:
+                QApplication.sendEvent(widget, QEvent(QEvent.Type.Leave))
+            widget.repaint()
+
+
+def hover_frames(widgets, cold: bool = False):
+    """Runs the animated hover color transition of every widget frame by frame (painter rendering mode)
+
+    :param cold: whether every transition starts with an empty pixmap cache (e.g. the first hover of a form)
+    """
+
+    scheduler = AnimationScheduler.instance()
+
+    for widget in widgets:
+        # The focused widget keeps its focused colors while hovered
+        if widget.hasFocus():
+            continue
+
+        if cold:
+            QPixmapCache.clear()
+
+        widget.setAttribute(Qt.WidgetAttribute.WA_UnderMouse, True)
+        QApplication.sendEvent(widget, QEnterEvent(QPointF(5, 5), QPointF(5, 5), QPointF(5, 5)))
+        transition = widget._AnimatedLineEdit__state_transition
+        scheduler.stop(transition)
+
+        now = transition.start_time
+        finished = False
+        while not finished:
+            now += transition.frame_interval
+            finished, rect = transition.advance(now)
+            if rect is not None:
+                widget.repaint(rect)
+
+        widget.setAttribute(Qt.WidgetAttribute.WA_UnderMouse, False)
+        QApplication.sendEvent(widget, QEvent(QEvent.Type.Leave))
+
+
+if __name__ == '__main__':
+    app = application()
+
+    for painter_rendering in (False, True):
+        window, widgets = create_form(painter_rendering)
+        paint = measure(lambda: repaint(widgets))
+        hovering = measure(lambda: hover(widgets))
+
+        print('%-10s paint: %8.2f us/widget   hover in+out: %8.2f us/widget'
+              % ('painter' if painter_rendering else 'stylesheet',
+                 paint * 1000 / (COUNT * REPAINTS), hovering * 1000 / COUNT))
+
+        if painter_rendering:
+            AnimatedLineEdit.setReducedMotion(False)
+            frames = measure(lambda: hover_frames(widgets))
+            cold_frames = measure(lambda: hover_frames(widgets, True))
+            AnimatedLineEdit.setReducedMotion(None)
+            print('painter    animated hover in: %8.2f us/widget   cold pixmap cache: %8.2f us/widget'
+                  % (frames * 1000 / (COUNT - 1), cold_frames * 1000 / (COUNT - 1)))
+
+        window.close()
@@ -0,0 +1,308 @@
+"""Headless benchmark suite for the hot paths of AnimatedLineEdit.
+
+Measures construction, every setter, stylesheet updates, geometry calculation, painting and a full
+focus-in/focus-out transition, writes the results as JSON and fails (exit code 1) if a measurement
+regresses past the stored baseline by more than the allowed threshold. Every measurement is the median
+of several rounds of the whole suite, and regressions are confirmed by a second run.
+
+    python -m benchmarks.suite                        # compare against benchmarks/baseline.json
+    python -m benchmarks.suite --output results.json  # also write the results
+    python -m benchmarks.suite --update-baseline      # store the results as the new baseline
+
+Baselines are machine dependent and should be regenerated on the machine running the gate."""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from benchmarks._common import application, delete_widgets, measure
+from qtpy.QtCore import QEasingCurve, QMargins
+from qtpy.QtGui import QColor, QFocusEvent
+from qtpy.QtWidgets import QApplication
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+from src.pyqt_animated_line_edit.animation_scheduler import AnimationScheduler
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_THRESHOLD = 1.5
+
+# Differences below this many microseconds are timer noise and never count as a regression
+MINIMUM_DIFFERENCE = 1.0
+
+COUNT = 200
+CALLS = 200
+
+# Runs per measurement (the fastest one counts) and rounds of the whole suite (the median round counts).
+# Interleaving the rounds spreads a burst of load on the machine over several measurements of a round
+# instead of all runs of one measurement, so it does not show up as a regression
+REPEAT = 3
+ROUNDS = 7
+
+# Every setter with two alternating values, so each call actually changes the widget
+SETTERS = (
+    ('setColor', QColor(10, 10, 10), QColor(20, 20, 20)),
+    ('setPlaceholderColor', QColor(10, 10, 10), QColor(20, 20, 20)),
+    ('setPlaceholderColorOutside', QColor(10, 10, 10), QColor(20, 20, 20)),
+    ('setBackgroundColor', QColor(250, 250, 250), QColor(240, 240, 240)),
+    ('setBorderColor', QColor(10, 10, 10), QColor(20, 20, 20)),
+    ('setBorderWidth', 1, 2),
+    ('setBorderRadius', 2, 4),
+    ('setPlaceholderFontFamily', 'Arial', 'Verdana'),
+    ('setPlaceholderFontSizeInner', 10, 12),
+    ('setPlaceholderFontSizeOuter', 7, 8),
+    ('setPlaceholderFontBold', True, False),
+    ('setPlaceholderFontItalic', True, False),
+    ('setPadding', QMargins(4, 0, 4, 0), QMargins(8, 0, 8, 0)),
+    ('setTransitionDuration', 200, 250),
+    ('setEasingCurve', QEasingCurve.Type.Linear, QEasingCurve.Type.InOutCubic),
+    ('setHoveredColor', QColor(10, 10, 10), QColor(20, 20, 20)),
+    ('setHoveredBackgroundColor', QColor(250, 250, 250), QColor(240, 240, 240)),
+    ('setHoveredBorderColor', QColor(10, 10, 10), QColor(20, 20, 20)),
+    ('setHoveredBorderWidth', 1, 2),
+    ('setFocusedColor', QColor(10, 10, 10), QColor(20, 20, 20)),
+    ('setFocusedBackgroundColor', QColor(250, 250, 250), QColor(240, 240, 240)),
+    ('setFocusedBorderColor', QColor(10, 10, 10), QColor(20, 20, 20)),
+    ('setFocusedBorderWidth', 1, 2),
+    ('setDisabledColor', QColor(10, 10, 10), QColor(20, 20, 20)),
+    ('setDisabledBackgroundColor', QColor(250, 250, 250), QColor(240, 240, 240)),
+    ('setDisabledBorderColor', QColor(10, 10, 10), QColor(20, 20, 20)),
+    ('setDisabledBorderWidth', 1, 2),
+)
+
+
+def create_widget() -> AnimatedLineEdit:
+    """Creates a shown widget with a realistic size"""
+
+    widget = AnimatedLineEdit('Placeholder')
+    widget.resize(200, 35)
+    widget.show()
+    QApplication.processEvents()
+    return widget
+
+
+def per_call(milliseconds: float, calls: int) -> float:
+    """Converts the duration of a batch to microseconds per call"""
+
+    return milliseconds * 1000 / calls
+
+
+def benchmark_construction(count: int, repeat: int) -> dict:
+    """Constructs widgets one by one and with createMany()"""
+
+    widgets = []
+
+    def construct():
+        widgets.extend(AnimatedLineEdit('Placeholder') for i in range(count))
+
+    def construct_many():
+        widgets.extend(AnimatedLineEdit.createMany(['Placeholder'] * count, style={
+            'border_width': 2, 'border_radius': 4, 'padding': QMargins(8, 0, 8, 0),
+            'placeholder_font_size_outer': 8, 'focused_border_color': QColor(0, 120, 215)}))
+
+    # The widgets of every run are deleted before the next one, so no measurement runs with
+    # thousands of live widgets registered with the default style
+    def teardown():
+        delete_widgets(widgets)
+
+    return {'construction': per_call(measure(construct, repeat, teardown), count),
+            'create_many': per_call(measure(construct_many, repeat, teardown), count)}
+
+
+def benchmark_setters(widget: AnimatedLineEdit, calls: int, repeat: int) -> dict:
+    """Calls every setter with alternating values"""
+
+    results = {}
+
+    for name, first, second in SETTERS:
+        setter = getattr(widget, name)
+
+        def call():
+            for i in range(calls // 2):
+                setter(first)
+                setter(second)
+
+        results['setter.' + name] = per_call(measure(call, repeat), calls)
+
+    def update_style_sheet():
+        for i in range(calls):
+            widget._AnimatedLineEdit__update_style_sheet()
+
+    results['update_style_sheet'] = per_call(measure(update_style_sheet, repeat), calls)
+    return results
+
+
+def benchmark_geometry(widget: AnimatedLineEdit, calls: int, repeat: int) -> dict:
+    """Resizes the widget and calculates its geometry directly"""
+
+    def resize():
+        for i in range(calls // 2):
+            widget.resize(220, 35)
+            widget.resize(200, 35)
+
+    def calculate_geometry():
+        for i in range(calls):
+            widget._AnimatedLineEdit__calculate_geometry()
+
+    return {'resize_event': per_call(measure(resize, repeat), calls),
+            'calculate_geometry': per_call(measure(calculate_geometry, repeat), calls)}
+
+
+def benchmark_paint(widget: AnimatedLineEdit, calls: int, repeat: int) -> dict:
+    """Repaints the widget synchronously"""
+
+    def paint():
+        for i in range(calls):
+            widget.repaint()
+
+    return {'paint_event': per_call(measure(paint, repeat), calls)}
+
+
+def run_transition(widget: AnimatedLineEdit, event_type: QFocusEvent.Type):
+    """Runs one transition to completion, advancing it frame by frame without waiting for the timer"""
+
+    QApplication.sendEvent(widget, QFocusEvent(event_type))
+    transition = widget._AnimatedLineEdit__transition
+    AnimationScheduler.instance().stop(transition)
+
+    now = transition.start_time
+    finished = False
+
+    while not finished:
+        now += transition.frame_interval
+        finished, rect = transition.advance(now)
+        if rect is not None:
+            widget.repaint(rect)
+
+    transition.finished_callback()
+
+
+def benchmark_transition(widget: AnimatedLineEdit, repeat: int) -> dict:
+    """Runs a full focus-in/focus-out transition"""
+
+    def transition():
+        run_transition(widget, QFocusEvent.Type.FocusIn)
+        run_transition(widget, QFocusEvent.Type.FocusOut)
+
+    reduced_motion = AnimatedLineEdit.isReducedMotion()
+    AnimatedLineEdit.setReducedMotion(False)
+    try:
+        return {'transition': per_call(measure(transition, repeat), 1)}
+    finally:
+        AnimatedLineEdit.setReducedMotion(reduced_motion)
+
+
+def run_round(count: int, calls: int, repeat: int) -> dict:
+    """Runs all benchmarks once
+
+    :param count: number of widgets constructed per run
+    :param calls: number of calls per run of the setter, geometry and paint benchmarks
+    :param repeat: number of runs per measurement
+    :return: measurements in microseconds per operation
+    """
+
+    app = application()
+    results = benchmark_construction(count, repeat)
+
+    widget = create_widget()
+    results.update(benchmark_setters(widget, calls, repeat))
+    delete_widgets([widget])
+
+    widget = create_widget()
+    results.update(benchmark_geometry(widget, calls, repeat))
+    results.update(benchmark_paint(widget, calls, repeat))
+    results.update(benchmark_transition(widget, repeat))
+    delete_widgets([widget])
+    app.processEvents()
+
+    return results
+
+
+def run(count: int = COUNT, calls: int = CALLS, repeat: int = REPEAT, rounds: int = ROUNDS) -> dict:
+    """Runs all benchmarks in several rounds
+
+    :param count: number of widgets constructed per run
+    :param calls: number of calls per run of the setter, geometry and paint benchmarks
+    :param repeat: number of runs per measurement
+    :param rounds: number of rounds
+    :return: median measurements of all rounds in microseconds per operation
+    """
+
+    measurements = [run_round(count, calls, repeat) for i in range(rounds)]
+    return {name: statistics.median(results[name] for results in measurements) for name in measurements[0]}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Compares measurements with a baseline
+
+    :param results: measurements in microseconds per operation
+    :param baseline: baseline measurements in microseconds per operation
+    :param threshold: allowed ratio between a measurement and its baseline
+    :return: list of (name, baseline, measurement) tuples of all regressed measurements
+    """
+
+    regressions = []
+
+    for name, value in results.items():
+        expected = baseline.get(name)
+        if expected is not None and value > expected * threshold and value - expected > MINIMUM_DIFFERENCE:
+            regressions.append((name, expected, value))
+
+    return regressions
+
+
+def main(arguments=None) -> int:
+    """Runs the suite and checks the results against the baseline
+
+    :param arguments: command line arguments (sys.argv if None)
+    :return: exit code (1 if a measurement regressed)
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline JSON file')
+    parser.add_argument('--threshold', type=float,
+                        help='allowed ratio between a measurement and its baseline (default: stored with the baseline)')
+    parser.add_argument('--update-baseline', action='store_true', help='store the results as the new baseline')
+    arguments = parser.parse_args(arguments)
+
+    results = run()
+
+    for name, value in results.items():
+        print('%-45s %10.2f us' % (name, value))
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump({'unit': 'us', 'results': results}, file, indent=2, sort_keys=True)
+
+    if arguments.update_baseline:
+        threshold = arguments.threshold or DEFAULT_THRESHOLD
+        with open(arguments.baseline, 'w') as file:
+            json.dump({'unit': 'us', 'threshold': threshold, 'results': results}, file, indent=2, sort_keys=True)
+        print('Baseline written to %s' % arguments.baseline)
+        return 0
+
+    if not os.path.exists(arguments.baseline):
+        print('No baseline found at %s, run with --update-baseline to create one' % arguments.baseline)
+        return 0
+
+    with open(arguments.baseline) as file:
+        baseline = json.load(file)
+
+    threshold = arguments.threshold or baseline.get('threshold', DEFAULT_THRESHOLD)
+    regressions = compare(results, baseline['results'], threshold)
+
+    # Regressions have to show up in a second run as well (the faster measurement of both counts)
+    if regressions:
+        print('Confirming %d regression(s) with a second run' % len(regressions))
+        second_results = run()
+        results = {name: min(value, second_results[name]) for name, value in results.items()}
+        regressions = compare(results, baseline['results'], threshold)
+
+    for name, expected, value in regressions:
+        print('REGRESSION %s: %.2f us (baseline %.2f us, threshold %.2fx)' % (name, value, expected, threshold))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
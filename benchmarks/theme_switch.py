@@ -0,0 +1,62 @@
+"""Compares switching the theme of a form setter by setter with changing a shared AnimatedLineEditStyle."""
+
+from benchmarks._common import application, measure
+from qtpy.QtGui import QColor
+from qtpy.QtWidgets import QWidget
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+from src.pyqt_animated_line_edit.animated_line_edit_style import AnimatedLineEditStyle
+
+COUNT = 500
+
+THEMES = (
+    {'color': QColor(20, 20, 20), 'background_color': QColor(250, 250, 250), 'border_color': QColor(200, 200, 200),
+     'hovered_border_color': QColor(120, 120, 120), 'focused_border_color': QColor(0, 120, 215),
+     'disabled_background_color': QColor(230, 230, 230)},
+    {'color': QColor(230, 230, 230), 'background_color': QColor(30, 30, 30), 'border_color': QColor(80, 80, 80),
+     'hovered_border_color': QColor(140, 140, 140), 'focused_border_color': QColor(90, 170, 255),
+     'disabled_background_color': QColor(50, 50, 50)},
+)
+
+
+def switch_with_setters(widgets, themes):
+    """Applies the next theme by calling every setter on every widget"""
+
+    theme = next(themes)
+    for widget in widgets:
+        widget.setColor(theme['color'])
+        widget.setBackgroundColor(theme['background_color'])
+        widget.setBorderColor(theme['border_color'])
+        widget.setHoveredBorderColor(theme['hovered_border_color'])
+        widget.setFocusedBorderColor(theme['focused_border_color'])
+        widget.setDisabledBackgroundColor(theme['disabled_background_color'])
+
+
+def switch_with_style(style, themes):
+    """Applies the next theme by changing the shared style once"""
+
+    style.applyStyle(**next(themes))
+
+
+def alternate():
+    """Endlessly alternates between the themes"""
+
+    while True:
+        yield from THEMES
+
+
+if __name__ == '__main__':
+    app = application()
+
+    themes = alternate()
+
+    window = QWidget()
+    widgets = AnimatedLineEdit.createMany(['Field %d' % i for i in range(COUNT)], window)
+    setters = measure(lambda: switch_with_setters(widgets, themes), repeat=4)
+
+    style = AnimatedLineEditStyle()
+    styled_window = QWidget()
+    AnimatedLineEdit.createMany(['Field %d' % i for i in range(COUNT)], styled_window, style=style)
+    shared = measure(lambda: switch_with_style(style, themes), repeat=4)
+
+    print('Setter by setter: %8.2f ms for %d fields' % (setters, COUNT))
+    print('Shared style:     %8.2f ms for %d fields' % (shared, COUNT))
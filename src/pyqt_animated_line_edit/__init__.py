@@ -1 +1,33 @@
-from .animated_line_edit import AnimatedLineEdit
\ No newline at end of file
+import importlib
+
+
+# Public classes and the modules defining them. The modules (and with them Qt) are only
+# imported on first access, so importing the package alone stays cheap
+_LAZY_EXPORTS = {
+    'AnimatedLineEdit': '.animated_line_edit',
+    'AnimatedLineEditStyle': '.animated_line_edit_style',
+    'AnimatedLineEditDelegate': '.animated_line_edit_delegate',
+    'AnimatedLineEditPool': '.animated_line_edit_pool',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Imports a public class on first access
+
+    :param name: name of the requested attribute
+    :return: the public class
+    """
+
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
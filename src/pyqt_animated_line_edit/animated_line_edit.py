@@ -1,11 +1,128 @@
 import math
-from qtpy.QtGui import QColor, QFont, QPalette, QPainter, QFontMetrics
-from qtpy.QtCore import QEasingCurve, QTimeLine, QPoint, Qt, QMargins
-from qtpy.QtWidgets import QLineEdit
+import os
+import time
+from contextlib import contextmanager
+from qtpy.QtGui import QColor, QFont, QPalette, QPainter, QPainterPath, QPixmap, QPixmapCache, QStaticText
+from qtpy.QtCore import QEasingCurve, QEvent, QCoreApplication, QPoint, QRect, QRectF, Qt, QMargins, Signal
+from qtpy.QtWidgets import QApplication, QLineEdit
+from .animated_line_edit_style import AnimatedLineEditStyle, GEOMETRY_VALUE_NAMES, PALETTE_VALUE_ROLES, resolve_style
+from .animation_scheduler import AnimationScheduler, Transition
+from .color_ramp import ColorRampCache, get_ramp_color
+from .font_cache import FontCache
+from .instrumentation import InstrumentationCollector, TimingAggregate, TransitionTimings
+from .style_sheet_cache import StyleSheetCache
+from .trace_recorder import TraceRecorder
+
+
+# Environment variable enabling (1, true, yes, on) or disabling (0, false, no, off) reduced motion
+REDUCED_MOTION_ENVIRONMENT_VARIABLE = 'PYQT_ANIMATED_LINE_EDIT_REDUCED_MOTION'
+
+# Platforms without a visible screen, where reduced motion is enabled automatically
+REDUCED_MOTION_PLATFORMS = ('offscreen', 'minimal')
+
+# Event type used to recalculate deferred geometry once per event loop pass
+GEOMETRY_EVENT_TYPE = QEvent.Type(QEvent.registerEventType())
+
+
+def draw_frame(painter: QPainter, rect: QRectF, border_radius: int, border_width: int,
+               border_color: QColor, background_color: QColor):
+    """Draws border and background of a line edit.
+    Both are filled instead of stroking the border, which is several times faster to rasterize
+
+    :param painter: painter to draw with
+    :param rect: outer bounds of the frame
+    :param border_radius: radius of the border
+    :param border_width: width of the border
+    :param border_color: color of the border
+    :param background_color: color of the background
+    """
+
+    if border_radius <= 0:
+        # Square corners are pixel aligned and need no antialiasing
+        painter.fillRect(rect, background_color)
+        if border_width > 0:
+            inner = rect.adjusted(border_width, border_width, -border_width, -border_width)
+            painter.fillRect(QRectF(rect.left(), rect.top(), rect.width(), border_width), border_color)
+            painter.fillRect(QRectF(rect.left(), inner.bottom(), rect.width(), border_width), border_color)
+            painter.fillRect(QRectF(rect.left(), inner.top(), border_width, inner.height()), border_color)
+            painter.fillRect(QRectF(inner.right(), inner.top(), border_width, inner.height()), border_color)
+        return
+
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    path = QPainterPath()
+    path.addRoundedRect(rect, border_radius, border_radius)
+    painter.fillPath(path, background_color)
+
+    if border_width > 0:
+        # The inner edge cuts the inside out of the border (odd-even fill rule)
+        radius = max(0, border_radius - border_width)
+        path.addRoundedRect(rect.adjusted(border_width, border_width, -border_width, -border_width), radius, radius)
+        painter.fillPath(path, border_color)
+
+
+def get_frame_pixmap(width: int, height: int, ratio: float, border_radius: int, border_width: int,
+                     border_color: QColor, background_color: QColor) -> QPixmap:
+    """Get border and background of a line edit rendered into a pixmap.
+    The pixmap is rendered once and shared through QPixmapCache by everything drawing the same frame
+
+    :param width: width of the frame
+    :param height: height of the frame
+    :param ratio: device pixel ratio of the paint device
+    :param border_radius: radius of the border
+    :param border_width: width of the border
+    :param border_color: color of the border
+    :param background_color: color of the background
+    :return: rendered frame
+    """
+
+    key = 'AnimatedLineEdit:%dx%d@%f:%d:%d:%x:%x' % (width, height, ratio, border_radius,
+                                                    border_width, border_color.rgba(), background_color.rgba())
+    pixmap = QPixmapCache.find(key)
+
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap(math.ceil(width * ratio), math.ceil(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        draw_frame(painter, QRectF(0, 0, width, height), border_radius, border_width, border_color, background_color)
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+
+    return pixmap
 
 
 class AnimatedLineEdit(QLineEdit):
 
+    # Emitted with the TransitionTimings of every finished transition while instrumentation is enabled
+    transitionTimed = Signal(object)
+
+    # Frame rate used by all widgets without their own frame rate
+    __default_animation_frame_rate = 25.0
+
+    # Whether transitions snap to their end state (None to detect automatically)
+    __reduced_motion = None
+
+    # Whether a widget is being constructed by createMany() (initial style and geometry are deferred),
+    # and the widget that deferred them
+    __creating_many = False
+    __deferred_widget = None
+
+    # Keywords accepted by applyStyle()
+    STYLE_KEYWORDS = frozenset((
+        'placeholder_color', 'placeholder_color_outside', 'placeholder_font_family',
+        'placeholder_font_size_inner', 'placeholder_font_size_outer', 'placeholder_font_bold',
+        'placeholder_font_italic', 'transition_duration', 'easing_curve',
+        'color', 'background_color', 'border_color', 'border_width', 'border_radius', 'padding',
+        'hovered_color', 'hovered_background_color', 'hovered_border_color', 'hovered_border_width',
+        'focused_color', 'focused_background_color', 'focused_border_color', 'focused_border_width',
+        'disabled_color', 'disabled_background_color', 'disabled_border_color', 'disabled_border_width'))
+
+    # Keywords of applyStyle() that modify the placeholder fonts
+    FONT_KEYWORDS = frozenset((
+        'placeholder_font_family', 'placeholder_font_size_inner', 'placeholder_font_size_outer',
+        'placeholder_font_bold', 'placeholder_font_italic'))
+
     def __init__(self, placeholder_text, parent=None):
         """Creates a new AnimatedLineEdit instance
 
@@ -20,170 +137,424 @@ class AnimatedLineEdit(QLineEdit):
         self.__placeholder_text_current = self.__placeholder_text
         self.__is_placeholder_inside = True
 
-        # Font settings
-        self.__placeholder_font_inner = self.font()
-        self.__placeholder_font_outer = self.font()
-        self.__placeholder_font_current = QFont(self.__placeholder_font_inner.family(),
-                                                self.__placeholder_font_inner.pointSize())
+        # Font settings (inner and outer fonts are interned and shared between widgets)
+        self.__placeholder_font_inner = FontCache.instance().internFont(self.font())
+        self.__placeholder_font_outer = self.__placeholder_font_inner
+        self.__placeholder_font_size_current = self.__placeholder_font_inner.pointSizeF()
 
         # Animation settings
         self.__transition_duration = 250
         self.__transition_easing_curve = QEasingCurve.Type.InOutCubic
+        self.__transition_idle_timeout = 5000
+        self.__animation_frame_rate = None
+        self.__animation_frame_rate_from_screen = False
 
-        # Styling settings
-        self.__color = QColor(0, 0, 0)
-        self.__background_color = QColor(255, 255, 255)
-        self.__border_color = self.palette().color(QPalette.ColorRole.Shadow)
-        self.__placeholder_color = self.palette().color(QPalette.ColorRole.Shadow)
+        # Placeholder color settings
+        palette = self.palette()
+        self.__placeholder_color = palette.color(QPalette.ColorRole.Shadow)
         self.__placeholder_color_outside = None
         self.__placeholder_color_current = self.__placeholder_color
-        self.__border_width = 1
-        self.__border_radius = 0
-        self.__padding = QMargins()
-        self.__hovered_color = None
-        self.__hovered_background_color = None
-        self.__hovered_border_color = None
-        self.__hovered_border_width = None
-        self.__focused_color = None
-        self.__focused_background_color = None
-        self.__focused_border_color = self.palette().color(QPalette.ColorRole.Highlight)
-        self.__focused_border_width = None
-        self.__disabled_color = None
-        self.__disabled_background_color = None
-        self.__disabled_border_color = None
-        self.__disabled_border_width = None
+
+        # Styling settings (a shared style plus the values set on this widget)
+        self.__line_edit_style = None
+        self.__style_overrides = {}
+        self.__palette_override_names = set()
+        self.__attach_line_edit_style(AnimatedLineEditStyle.instance())
+
+        # A default style not followed by any widget yet may still have the colors of a previous palette
+        application_palette = QApplication.palette()
+        self.__line_edit_style.applicationPaletteChanged(application_palette)
+
+        # Colors of a palette differing from the application palette (e.g. inherited from the parent)
+        # are kept as overrides until another style is set
+        for name, role in PALETTE_VALUE_ROLES:
+            color = palette.color(role)
+            if color != application_palette.color(role):
+                self.__style_overrides[name] = color
+                self.__palette_override_names.add(name)
+
+        # Painter rendering mode (draws frame and background without the stylesheet engine)
+        self.__painter_rendering = False
+        self.__style_sheet_suspended = False
+        self.__painter_palette = None
+        self.__painter_state_style = None
+
+        # Background and border colors currently painted in painter rendering mode, and the
+        # transition interpolating them along shared color ramps after a state change
+        self.__frame_colors = None
+        self.__frame_color_ramps = None
+        self.__frame_colors_at_rest = True
+        self.__state_transition = None
+
+        # Deferred geometry (recalculated once per event loop pass or on the next paint)
+        self.__deferred_geometry = False
+        self.__geometry_pending = False
+        self.__geometry_event_posted = False
+
+        # Batched style updates (regeneration is deferred until the outermost batch ends)
+        self.__style_batch_depth = 0
+        self.__style_sheet_dirty = False
+        self.__geometry_dirty = False
+
+        # Single transition driving position, font size and color of the placeholder text.
+        # It is advanced by the process-wide scheduler, which also repaints the widget.
+        # Created on first use and released again after the idle timeout.
+        self.__transition = None
+
+        # Inputs of every geometry stage as of its last calculation
+        self.__geometry_inputs = {}
 
         # Calculate widget geometry and update stylesheet
-        self.__calculate_geometry()
-        self.__update_style_sheet()
+        # (createMany() starts a style batch instead, which is ended once the style has been applied)
+        self.__style_sheet = None
+        # (only the first widget constructed defers them, not e.g. helper widgets constructed by a subclass)
+        if AnimatedLineEdit.__creating_many:
+            AnimatedLineEdit.__creating_many = False
+            AnimatedLineEdit.__deferred_widget = self
+            self.__style_batch_depth = 1
+            self.__geometry_dirty = True
+            self.__style_sheet_dirty = True
+        else:
+            self.__calculate_geometry()
+            self.__update_style_sheet()
+
+        # Dirty area tracking of the transition
+        self.__placeholder_rect_previous = QRect()
+        self.__frame_state_previous = None
+        self.__transition_repainted_pixels = 0
+        self.__transition_frames_emitted = 0
+        self.__transition_frames_suppressed = 0
+
+        # Opt-in frame timing instrumentation
+        self.__instrumentation = False
+        self.__timing_aggregate = None
+        self.__transition_timings = None
+        self.__transition_timings_last = None
+        self.__transition_paint_pending = False
+        self.__transition_timings_finished = False
+
+        # Transition values necessary for interpolation
+        self.__transition_to_outside = False
+        self.__transition_position_start = 0
+        self.__transition_font_start = 0
+        self.__placeholder_color_ramp = ColorRampCache.instance().getRamp(self.__placeholder_color_current,
+                                                                          self.__placeholder_color_current)
+
+        # Text changes without focus (setText() and clear(), also when called from C++) move the placeholder text
+        self.textChanged.connect(self.__text_changed)
+
+    def __ensure_transition(self) -> Transition:
+        """Creates the transition if it does not exist yet
+
+        :return: the transition of this widget
+        """
 
-        # Timeline starting values necessary for interpolation
-        self.__timeline_position_start = 0
-        self.__timeline_font_start = 0
+        if self.__transition is None:
+            self.__transition = Transition(self, self.__transition_value_changed_timed if self.__instrumentation
+                                           else self.__transition_value_changed,
+                                           self.__transition_duration, self.__transition_easing_curve,
+                                           self.__transition_finished)
+        return self.__transition
+
+    def __transition_finished(self):
+        """Method that gets called once the transition has finished.
+        Schedules the release of the idle transition."""
+
+        if self.__transition is not None and self.__transition_idle_timeout >= 0:
+            AnimationScheduler.instance().scheduleRelease(self.__transition, self.__transition_idle_timeout,
+                                                          self.__release_transition)
+
+        # The timings are complete once the last frame has been painted
+        if self.__transition_timings is not None:
+            if self.__transition_paint_pending:
+                self.__transition_timings_finished = True
+            else:
+                self.__finish_transition_timings()
+
+    def __release_transition(self):
+        """Frees the transition if it is not running"""
+
+        if self.__transition is not None and not AnimationScheduler.instance().isRunning(self.__transition):
+            self.__transition = None
+
+    def __transition_value_changed(self, value):
+        """Method that gets called every time the scheduler advances the transition.
+        Interpolates the placeholder text position, font size and color from the
+        transition's progress.
+
+        :param value: current transition value (between 0.0 and 1.0)
+        :return: area of the widget that needs to be repainted
+        """
+
+        if TraceRecorder.recording:
+            TraceRecorder.instance().record('transitionValueChanged', 'i', self, {'value': value})
+
+        if self.__transition_to_outside:
+            rounding = math.floor
+            position_end = self.__position_outer.y()
+            font_end = self.__placeholder_font_outer.pointSizeF()
+            text_end = self.__placeholder_text_outer_elided
+        else:
+            rounding = math.ceil
+            position_end = self.__position_inner.y()
+            font_end = self.__placeholder_font_inner.pointSizeF()
+            text_end = self.__placeholder_text_inner_elided
+
+        self.__position_current.setY(
+            rounding(self.__transition_position_start + (position_end - self.__transition_position_start) * value))
+        self.__placeholder_font_size_current = \
+            self.__transition_font_start + (font_end - self.__transition_font_start) * value
+        self.__placeholder_color_current = get_ramp_color(self.__placeholder_color_ramp, value)
 
-        # Timeline for moving the placeholder text to the outside position
-        self.__timeline_position_out = QTimeLine(self.__transition_duration)
-        self.__timeline_position_out.setFrameRange(self.__position_current.y(), self.__position_outer.y())
-        self.__timeline_position_out.setEasingCurve(self.__transition_easing_curve)
-        self.__timeline_position_out.valueChanged.connect(self.__timeline_position_out_value_changed)
+        if self.__transition_to_outside and value > 0.1 and self.__is_placeholder_inside:
+            self.__is_placeholder_inside = False
+        elif not self.__transition_to_outside and value > 0.8 and not self.__is_placeholder_inside:
+            self.__is_placeholder_inside = True
 
-        # Timeline for moving the placeholder text to the inside position
-        self.__timeline_position_in = QTimeLine(self.__transition_duration)
-        self.__timeline_position_in.setFrameRange(self.__position_current.y(), self.__position_inner.y())
-        self.__timeline_position_in.setEasingCurve(self.__transition_easing_curve)
-        self.__timeline_position_in.valueChanged.connect(self.__timeline_position_in_value_changed)
+        if abs(self.__placeholder_font_size_current - font_end) < 1 and self.__placeholder_text_current != text_end:
+            self.__placeholder_text_current = text_end
 
-        # Timeline for scaling the font to the outside font size
-        self.__timeline_font_out = QTimeLine(self.__transition_duration)
-        self.__timeline_font_out.setFrameRange(self.__placeholder_font_current.pointSize(),
-                                               self.__placeholder_font_outer.pointSize())
-        self.__timeline_font_out.setEasingCurve(self.__transition_easing_curve)
-        self.__timeline_font_out.valueChanged.connect(self.__timeline_font_out_value_changed)
+        # Frames that would look exactly like the last painted one are not repainted
+        placeholder_rect = self.__get_placeholder_rect()
+        frame_state = self.__get_frame_state(placeholder_rect)
 
-        # Timeline for scaling the font to the inside font size
-        self.__timeline_font_in = QTimeLine(self.__transition_duration)
-        self.__timeline_font_in.setFrameRange(self.__placeholder_font_current.pointSize(),
-                                              self.__placeholder_font_inner.pointSize())
-        self.__timeline_font_in.setEasingCurve(self.__transition_easing_curve)
-        self.__timeline_font_in.valueChanged.connect(self.__timeline_font_in_value_changed)
+        if frame_state == self.__frame_state_previous:
+            self.__transition_frames_suppressed += 1
+            return None
 
+        self.__frame_state_previous = frame_state
+        self.__transition_frames_emitted += 1
 
-    def __timeline_position_out_value_changed(self, value):
-        """Method that gets called every time the timeline's value changes.
-        Calculates the new placeholder text position and forces the widget to update.
+        # Only the area covered by the previous and the new placeholder and the border notch changes
+        dirty_rect = placeholder_rect.united(self.__placeholder_rect_previous).united(self.__notch_rect)
+        self.__placeholder_rect_previous = placeholder_rect
+        self.__transition_repainted_pixels += dirty_rect.width() * dirty_rect.height()
+        return dirty_rect
 
-        :param value: current timeline value (between 0.0 and 1.0)
+    def __transition_value_changed_timed(self, value):
+        """Instrumented variant of __transition_value_changed that records the frame timings
+
+        :param value: current transition value (between 0.0 and 1.0)
+        :return: area of the widget that needs to be repainted
         """
 
-        self.__position_current.setY(
-            math.floor(self.__timeline_position_start +
-                       (self.__position_outer.y() - self.__timeline_position_start) * value))
+        start = time.perf_counter() * 1000
+        rect = self.__transition_value_changed(value)
 
-        if value > 0.1 and self.__is_placeholder_inside:
-            self.__is_placeholder_inside = False
+        if self.__transition_timings is not None:
+            self.__transition_timings.addFrame(start, time.perf_counter() * 1000 - start)
+            if rect is not None:
+                self.__transition_paint_pending = True
 
-        self.update()
+        return rect
 
-    def __timeline_position_in_value_changed(self, value):
-        """Method that gets called every time the timeline's value changes.
-        Calculates the new placeholder text position and forces the widget to update.
+    def __finish_transition_timings(self):
+        """Publishes the timings of the current transition to the widget's statistics,
+        the global collector and the transitionTimed signal"""
 
-        :param value: current timeline value (between 0.0 and 1.0)
-        """
+        timings = self.__transition_timings
+        self.__transition_timings = None
+        self.__transition_paint_pending = False
+        self.__transition_timings_finished = False
+        self.__transition_timings_last = timings
 
-        self.__position_current.setY(
-            math.ceil(self.__timeline_position_start +
-                      (self.__position_inner.y() - self.__timeline_position_start) * value))
+        self.__timing_aggregate.add(timings)
+        InstrumentationCollector.instance().add(timings)
+        self.transitionTimed.emit(timings)
 
-        if value > 0.8 and not self.__is_placeholder_inside:
-            self.__is_placeholder_inside = True
+    def __get_frame_state(self, placeholder_rect: QRect) -> tuple:
+        """Get everything that determines how the placeholder looks in the current frame
 
-        self.update()
+        :param placeholder_rect: pixel-aligned area covered by the placeholder text
+        :return: comparable frame state
+        """
+
+        return (placeholder_rect.x(), placeholder_rect.y(), placeholder_rect.width(), placeholder_rect.height(),
+                self.__position_current.y(), self.__placeholder_color_current.rgba(), self.__is_placeholder_inside,
+                self.__placeholder_text_current, self.__get_placeholder_font_at_rest())
 
-    def __timeline_font_out_value_changed(self, value):
-        """Method that gets called every time the timeline's value changes.
-        Calculates the new placeholder text font size and forces the widget to update.
+    def __get_placeholder_rect(self) -> QRect:
+        """Calculates the area covered by the placeholder text as it is currently painted
 
-        :param value: current timeline value (between 0.0 and 1.0)
+        :return: bounding rect of the placeholder text (with a margin for antialiasing)
         """
 
-        self.__placeholder_font_current.setPointSize(
-            math.floor(self.__timeline_font_start +
-                       (self.__placeholder_font_outer.pointSize() - self.__timeline_font_start) * value))
+        font = self.__get_placeholder_font_at_rest()
 
-        if self.__placeholder_font_current.pointSize() == self.__placeholder_font_outer.pointSize() and \
-                self.__placeholder_text_current != self.__placeholder_text_outer_elided:
-            self.__placeholder_text_current = self.__placeholder_text_outer_elided
+        if font is not None:
+            rect = QRectF(FontCache.instance().getBoundingRect(font, self.__placeholder_text_current))
+        else:
+            scale = self.__get_placeholder_scale()
+            rect = QRectF(FontCache.instance().getBoundingRect(
+                self.__placeholder_font_inner, self.__placeholder_text_current))
+            rect = QRectF(rect.x() * scale, rect.y() * scale, rect.width() * scale, rect.height() * scale)
 
-        self.update()
+        return rect.translated(self.__position_current.x(), self.__position_current.y()).toAlignedRect().adjusted(
+            -2, -2, 2, 2)
 
-    def __timeline_font_in_value_changed(self, value):
-        """Method that gets called every time the timeline's value changes.
-        Calculates the new placeholder text font size and forces the widget to update.
+    def __get_placeholder_font_at_rest(self) -> QFont:
+        """Get the font the placeholder text is drawn with if it is at rest in one of its positions
 
-        :param value: current timeline value (between 0.0 and 1.0)
+        :return: inner or outer placeholder font, or None while the font size is being animated
         """
 
-        self.__placeholder_font_current.setPointSize(
-            math.ceil(self.__timeline_font_start +
-                      (self.__placeholder_font_inner.pointSize() - self.__timeline_font_start) * value))
+        if self.__placeholder_font_size_current == self.__placeholder_font_inner.pointSizeF():
+            return self.__placeholder_font_inner
+        if self.__placeholder_font_size_current == self.__placeholder_font_outer.pointSizeF():
+            return self.__placeholder_font_outer
+        return None
 
-        if self.__placeholder_font_current.pointSize() == self.__placeholder_font_inner.pointSize() and \
-                self.__placeholder_text_current != self.__placeholder_text_inner_elided:
-            self.__placeholder_text_current = self.__placeholder_text_inner_elided
+    def __get_placeholder_static_text(self, font: QFont) -> QStaticText:
+        """Get the prepared layout matching the placeholder text and the font it is drawn with
 
-        self.update()
+        :param font: inner or outer placeholder font
+        :return: prepared static text, or None if there is no matching layout
+        """
 
-    def __calculate_geometry(self):
-        """Calculates everything related to widget geometry."""
+        if font is self.__placeholder_font_inner and \
+                self.__placeholder_text_current == self.__placeholder_text_inner_elided:
+            return self.__placeholder_static_text_inner
+        if font is self.__placeholder_font_outer and \
+                self.__placeholder_text_current == self.__placeholder_text_outer_elided:
+            return self.__placeholder_static_text_outer
+        return None
 
-        self.__font_metrics_inner = QFontMetrics(self.__placeholder_font_inner)
-        self.__font_metrics_outer = QFontMetrics(self.__placeholder_font_outer)
-        self.__placeholder_text_start = max(15, self.__border_radius + 10)
+    def __get_placeholder_scale(self) -> float:
+        """Get the scale applied to the placeholder text laid out with the inner font
+
+        :return: current font size relative to the inner font size
+        """
 
-        self.__placeholder_text_inner_elided = self.__font_metrics_inner.elidedText(
-            self.__placeholder_text, Qt.TextElideMode.ElideRight, self.width() - self.__placeholder_text_start * 2)
-        self.__placeholder_text_outer_elided = self.__font_metrics_outer.elidedText(
-            self.__placeholder_text, Qt.TextElideMode.ElideRight, self.width() - self.__placeholder_text_start * 2)
+        inner_size = self.__placeholder_font_inner.pointSizeF()
+        return self.__placeholder_font_size_current / inner_size if inner_size > 0 else 1.0
 
-        self.__placeholder_text_current = self.__placeholder_text_inner_elided
+    def __start_transition(self, to_outside: bool, color_end: QColor, animate: bool = True):
+        """Starts the placeholder transition from the current state towards a position
 
-        self.__text_inner_bounds = self.__font_metrics_inner.tightBoundingRect(self.__placeholder_text_inner_elided)
-        self.__text_outer_bounds = self.__font_metrics_outer.tightBoundingRect(self.__placeholder_text_outer_elided)
+        :param to_outside: whether the placeholder moves to the outside position
+        :param color_end: placeholder color at the end of the transition
+        :param animate: whether to animate the transition (reduced motion never animates)
+        """
 
-        self.__top_offset = math.ceil(
-            (self.__text_outer_bounds.height() -
-             (self.__border_width if self.__focused_border_width is None else self.__focused_border_width)) / 2)
+        self.__flush_geometry()
+        self.__transition_to_outside = to_outside
+        self.__transition_position_start = self.__position_current.y()
+        self.__transition_font_start = self.__placeholder_font_size_current
+        self.__placeholder_color_ramp = ColorRampCache.instance().getRamp(self.__placeholder_color_current,
+                                                                          color_end)
+        self.__placeholder_rect_previous = self.__get_placeholder_rect()
+        self.__frame_state_previous = self.__get_frame_state(self.__placeholder_rect_previous)
+        self.__transition_repainted_pixels = 0
+        self.__transition_frames_emitted = 0
+        self.__transition_frames_suppressed = 0
+
+        if self.__instrumentation:
+            # An interrupted transition is published with the frames it got to
+            if self.__transition_timings is not None and self.__transition_timings.frame_count > 0:
+                self.__finish_transition_timings()
+            self.__transition_timings = TransitionTimings(self.objectName() or self.__placeholder_text)
+
+        if not animate or AnimatedLineEdit.isReducedMotion():
+            # Snap directly to the end state without starting any timer
+            if self.__transition is not None:
+                AnimationScheduler.instance().stop(self.__transition)
+            if self.__instrumentation:
+                self.__transition_value_changed_timed(1.0)
+            else:
+                self.__transition_value_changed(1.0)
+            self.update()
+            if TraceRecorder.recording:
+                TraceRecorder.instance().record('update', 'i', self)
+            self.__transition_finished()
+            return
+
+        transition = self.__ensure_transition()
+        transition.setFrameRate(self.getAnimationFrameRate())
+        AnimationScheduler.instance().start(transition)
+
+    def __geometry_stage_changed(self, stage: str, inputs: tuple) -> bool:
+        """Checks whether the inputs of a geometry stage changed since it was last calculated
+
+        :param stage: name of the stage
+        :param inputs: current inputs of the stage
+        :return: whether the stage needs to be recalculated
+        """
 
-        self.setContentsMargins(0, self.__top_offset, 0, 0)
+        if self.__geometry_inputs.get(stage) == inputs:
+            return False
 
-        self.__position_inner = QPoint(
-            self.__placeholder_text_start,
-            self.__top_offset + (self.height() - self.__top_offset - math.ceil(
-                (self.height() - self.__top_offset - self.__text_inner_bounds.height()) / 2)))
+        self.__geometry_inputs[stage] = inputs
+        return True
 
-        self.__position_outer = QPoint(self.__placeholder_text_start, self.__text_outer_bounds.height())
-        self.__position_current = QPoint(self.__position_inner.x(), self.__position_inner.y())
+    def __calculate_geometry(self):
+        """Calculates everything related to widget geometry.
+        The calculation is split into stages that are only recalculated if their inputs changed,
+        e.g. a new height only moves the inside position and a new outer font size leaves the inside
+        placeholder text alone."""
+
+        font_cache = FontCache.instance()
+        width = self.width()
+        height = self.height()
+        border_radius = self.__get_style_value('border_radius')
+        border_width = self.__get_style_value('focused_border_width')
+        if border_width is None:
+            border_width = self.__get_style_value('border_width')
+        self.__placeholder_text_start = max(15, border_radius + 10)
+        available_width = width - self.__placeholder_text_start * 2
+
+        # Elided placeholder texts and their prepared layouts (text, fonts and width)
+        if self.__geometry_stage_changed('inner', (self.__placeholder_font_inner, self.__placeholder_text,
+                                                   available_width)):
+            self.__placeholder_text_inner_elided, self.__text_inner_bounds = font_cache.getElidedText(
+                self.__placeholder_font_inner, self.__placeholder_text, available_width)
+            self.__placeholder_static_text_inner = font_cache.getStaticText(
+                self.__placeholder_font_inner, self.__placeholder_text_inner_elided)
+
+        if self.__geometry_stage_changed('outer', (self.__placeholder_font_outer, self.__placeholder_text,
+                                                   available_width)):
+            self.__placeholder_text_outer_elided, self.__text_outer_bounds = font_cache.getElidedText(
+                self.__placeholder_font_outer, self.__placeholder_text, available_width)
+            self.__placeholder_static_text_outer = font_cache.getStaticText(
+                self.__placeholder_font_outer, self.__placeholder_text_outer_elided)
+
+        # Top offset making room for the outside placeholder (outer text height and border width)
+        outer_height = self.__text_outer_bounds.height()
+        if self.__geometry_stage_changed('offset', (outer_height, border_width)):
+            self.__top_offset = math.ceil((outer_height - border_width) / 2)
+
+            if self.contentsMargins().top() != self.__top_offset:
+                self.setContentsMargins(0, self.__top_offset, 0, 0)
+
+        # Gap in the top border behind the outside placeholder, kept clear of the rounded corners
+        if self.__geometry_stage_changed('notch', (self.__placeholder_text_start, self.__text_outer_bounds.width(),
+                                                   width, border_radius, self.__top_offset, border_width)):
+            notch_left = max(self.__placeholder_text_start - 5, border_radius)
+            notch_right = min(self.__placeholder_text_start + self.__text_outer_bounds.width() + 5,
+                              width - 1 - border_radius)
+            self.__notch_rect = QRect(notch_left, self.__top_offset, max(0, notch_right - notch_left + 1),
+                                      border_width)
+
+        # Positions of the placeholder text at rest
+        if self.__geometry_stage_changed('positions', (self.__placeholder_text_start, self.__top_offset, height,
+                                                       self.__text_inner_bounds.height(), outer_height)):
+            self.__position_inner = QPoint(
+                self.__placeholder_text_start,
+                self.__top_offset + (height - self.__top_offset - math.ceil(
+                    (height - self.__top_offset - self.__text_inner_bounds.height()) / 2)))
+            self.__position_outer = QPoint(self.__placeholder_text_start, outer_height)
+
+        # A running transition moves towards the new positions by itself,
+        # otherwise the placeholder text is put at rest in its current position
+        if self.__transition is None or not AnimationScheduler.instance().isRunning(self.__transition):
+            if self.__is_placeholder_inside:
+                position = self.__position_inner
+                self.__placeholder_text_current = self.__placeholder_text_inner_elided
+                self.__placeholder_font_size_current = self.__placeholder_font_inner.pointSizeF()
+            else:
+                position = self.__position_outer
+                self.__placeholder_text_current = self.__placeholder_text_outer_elided
+                self.__placeholder_font_size_current = self.__placeholder_font_outer.pointSizeF()
+            self.__position_current = QPoint(position.x(), position.y())
 
     def paintEvent(self, event):
         """Method that gets called every time the widget needs to be updated.
@@ -192,19 +563,219 @@ class AnimatedLineEdit(QLineEdit):
         :param event: event sent by PyQt
         """
 
+        tracing = TraceRecorder.recording
+        if tracing:
+            TraceRecorder.instance().record('paintEvent', 'B', self)
+
+        if self.__transition_timings is None:
+            self.__paint(event)
+        else:
+            start = time.perf_counter() * 1000
+            self.__paint(event)
+            self.__transition_timings.addPaint(time.perf_counter() * 1000 - start)
+            self.__transition_paint_pending = False
+
+            if self.__transition_timings_finished:
+                self.__finish_transition_timings()
+
+        if tracing:
+            TraceRecorder.instance().record('paintEvent', 'E', self)
+
+    def __paint(self, event):
+        """Paints the widget and the placeholder text
+
+        :param event: event sent by PyQt
+        """
+
+        self.__flush_geometry()
+
+        if self.__painter_rendering:
+            self.__paint_frame()
+
         super().paintEvent(event)
         painter = QPainter(self)
-        painter.setFont(self.__placeholder_font_current)
 
-        if not self.__is_placeholder_inside:
-            painter.setPen(self.__background_color)
-            for i in range(self.__border_width if self.__focused_border_width is None else self.__focused_border_width):
-                painter.drawLine(QPoint(self.__placeholder_text_start - 5, self.__top_offset + i),
-                                 QPoint(self.__placeholder_text_start + self.__text_outer_bounds.width() + 5,
-                                        self.__top_offset + i))
+        if not self.__is_placeholder_inside and not self.__notch_rect.isEmpty():
+            painter.fillRect(self.__notch_rect,
+                             self.__frame_colors[0] if self.__painter_rendering
+                             else self.__get_style_value('background_color'))
+
+        font = self.__get_placeholder_font_at_rest()
+
+        if font is not None:
+            painter.setFont(font)
+            painter.setPen(self.__placeholder_color_current)
+            static_text = self.__get_placeholder_static_text(font)
+
+            if static_text is not None:
+                painter.drawStaticText(self.__position_current.x(),
+                                       self.__position_current.y() - FontCache.instance().getFontMetrics(font).ascent(),
+                                       static_text)
+            else:
+                painter.drawText(self.__position_current, self.__placeholder_text_current)
+        else:
+            # While the size is animated the text is laid out once with the inner font and scaled,
+            # so no font has to be resolved and no glyphs have to be rasterized per frame
+            scale = self.__get_placeholder_scale()
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.translate(self.__position_current)
+            painter.scale(scale, scale)
+            painter.fillPath(FontCache.instance().getTextPath(self.__placeholder_font_inner,
+                                                              self.__placeholder_text_current),
+                             self.__placeholder_color_current)
+
+    def __paint_frame(self):
+        """Paints border and background of the current state (painter rendering mode).
+        At rest the frame is rendered once into a pixmap that is shared by all identically styled widgets.
+        While the colors fade after a state change it is drawn directly, as every frame has other colors"""
+
+        background_color, border_color = self.__frame_colors
+        border_width = self.__painter_state_style[2]
+        border_radius = self.__get_style_value('border_radius')
+        rect = self.contentsRect()
+        painter = QPainter(self)
+
+        if not self.__frame_colors_at_rest:
+            draw_frame(painter, QRectF(rect), border_radius, border_width, border_color, background_color)
+        else:
+            pixmap = get_frame_pixmap(rect.width(), rect.height(), self.devicePixelRatioF(), border_radius,
+                                      border_width, border_color, background_color)
+            painter.drawPixmap(rect.topLeft(), pixmap)
+
+        painter.end()
+
+    def __resolve_state_style(self) -> tuple:
+        """Resolves text color, background color, border width and border color
+        for the state the widget is currently in (disabled, focused, hovered or regular)
+
+        :return: resolved values of the current state
+        """
+
+        if not self.isEnabled():
+            state = 'disabled_'
+        elif self.hasFocus():
+            state = 'focused_'
+        elif self.underMouse():
+            state = 'hovered_'
+        else:
+            state = None
+
+        resolved = []
+        for name in ('color', 'background_color', 'border_width', 'border_color'):
+            value = None if state is None else self.__get_style_value(state + name)
+            resolved.append(self.__get_style_value(name) if value is None else value)
+        return tuple(resolved)
+
+    def __update_painter_state(self, force: bool = False):
+        """Applies the style of the current state in painter rendering mode.
+        The palette and text margins are only touched if the state style changed
+
+        :param force: whether to apply the state style even if it did not change
+        """
+
+        if not self.__painter_rendering:
+            return
+
+        state_style = self.__resolve_state_style()
+        if not force and state_style == self.__painter_state_style:
+            return
+
+        previous = self.__painter_state_style
+        self.__painter_state_style = state_style
+        color, background_color, border_width, border_color = state_style
+        self.__update_frame_colors(background_color, border_color, not force)
+
+        if force or previous[0] != color:
+            palette = self.palette()
+            palette.setColor(QPalette.ColorRole.Text, color)
+            palette.setColor(QPalette.ColorRole.Base, QColor(0, 0, 0, 0))
+            self.setPalette(palette)
+
+        if force or previous[2] != border_width:
+            padding = self.__get_style_value('padding')
+            self.setTextMargins(padding.left() + border_width, padding.top() + border_width,
+                                padding.right() + border_width, padding.bottom() + border_width)
+
+        self.update()
+
+    def __update_frame_colors(self, background_color: QColor, border_color: QColor, animate: bool):
+        """Moves the painted background and border colors to the colors of a new state (painter rendering mode).
+        The colors are interpolated along color ramps shared by all widgets, so a frame allocates no colors
+
+        :param background_color: background color of the new state
+        :param border_color: border color of the new state
+        :param animate: whether to interpolate the colors (reduced motion and hidden widgets never animate)
+        """
+
+        scheduler = AnimationScheduler.instance()
+
+        if self.__frame_colors is None or not animate or not self.isVisible() or AnimatedLineEdit.isReducedMotion():
+            if self.__state_transition is not None:
+                scheduler.stop(self.__state_transition)
+            self.__frame_colors = (background_color, border_color)
+            self.__frame_colors_at_rest = True
+            return
 
-        painter.setPen(self.__placeholder_color_current)
-        painter.drawText(self.__position_current, self.__placeholder_text_current)
+        ramp_cache = ColorRampCache.instance()
+        self.__frame_color_ramps = (ramp_cache.getRamp(self.__frame_colors[0], background_color),
+                                    ramp_cache.getRamp(self.__frame_colors[1], border_color))
+
+        if self.__state_transition is None:
+            self.__state_transition = Transition(self, self.__state_value_changed, self.__transition_duration,
+                                                 self.__transition_easing_curve)
+        self.__state_transition.setFrameRate(self.getAnimationFrameRate())
+        scheduler.start(self.__state_transition)
+
+    def __state_value_changed(self, value):
+        """Method that gets called every time the scheduler advances the state transition.
+        Looks up the background and border colors in the shared color ramps
+
+        :param value: current transition value (between 0.0 and 1.0)
+        :return: area of the widget that needs to be repainted
+        """
+
+        background_ramp, border_ramp = self.__frame_color_ramps
+        background_color = get_ramp_color(background_ramp, value)
+        border_color = get_ramp_color(border_ramp, value)
+
+        # Colors of the shared ramps are compared by identity, unchanged frames are not repainted
+        if background_color is self.__frame_colors[0] and border_color is self.__frame_colors[1]:
+            return None
+
+        self.__frame_colors = (background_color, border_color)
+        self.__frame_colors_at_rest = background_color is background_ramp[-1] and border_color is border_ramp[-1]
+        return self.rect()
+
+    def enterEvent(self, event):
+        """Method that gets called every time the mouse enters the widget.
+
+        :param event: event sent by PyQt
+        """
+
+        super().enterEvent(event)
+        self.__update_painter_state()
+
+    def leaveEvent(self, event):
+        """Method that gets called every time the mouse leaves the widget.
+
+        :param event: event sent by PyQt
+        """
+
+        super().leaveEvent(event)
+        self.__update_painter_state()
+
+    def changeEvent(self, event):
+        """Method that gets called every time a state of the widget changes.
+
+        :param event: event sent by PyQt
+        """
+
+        super().changeEvent(event)
+        if event.type() == event.Type.EnabledChange:
+            self.__update_painter_state()
+        elif event.type() == event.Type.PaletteChange:
+            # Sent to every widget after the application palette changed
+            self.__line_edit_style.applicationPaletteChanged(QApplication.palette())
 
     def focusInEvent(self, event):
         """Method that gets called every time the widget gains focus.
@@ -212,21 +783,18 @@ class AnimatedLineEdit(QLineEdit):
         :param event: event sent by PyQt
         """
 
+        if TraceRecorder.recording:
+            TraceRecorder.instance().record('focusIn', 'i', self)
+
         super().focusInEvent(event)
+        self.__update_painter_state()
         if not self.text():
-            self.__timeline_position_in.stop()
-            self.__timeline_font_in.stop()
-            self.__timeline_position_start = self.__position_current.y()
-            self.__timeline_font_start = self.__placeholder_font_current.pointSize()
-
             if len(self.__placeholder_text_outer_elided) <= len(self.__placeholder_text_inner_elided):
                 self.__placeholder_text_current = self.__placeholder_text_outer_elided
 
-            self.__placeholder_color_current = (self.__placeholder_color_outside if
-                                                self.__placeholder_color_outside is not None
-                                                else self.__placeholder_color)
-            self.__timeline_position_out.start()
-            self.__timeline_font_out.start()
+            self.__start_transition(True, self.__placeholder_color_outside if
+                                    self.__placeholder_color_outside is not None
+                                    else self.__placeholder_color)
 
     def focusOutEvent(self, event):
         """Method that gets called every time the widget loses focus.
@@ -234,19 +802,117 @@ class AnimatedLineEdit(QLineEdit):
         :param event: event sent by PyQt
         """
 
+        if TraceRecorder.recording:
+            TraceRecorder.instance().record('focusOut', 'i', self)
+
         super().focusOutEvent(event)
+        self.__update_painter_state()
         if not self.text():
-            self.__timeline_position_out.stop()
-            self.__timeline_font_out.stop()
-            self.__timeline_position_start = self.__position_current.y()
-            self.__timeline_font_start = self.__placeholder_font_current.pointSize()
-
             if len(self.__placeholder_text_inner_elided) <= len(self.__placeholder_text_outer_elided):
                 self.__placeholder_text_current = self.__placeholder_text_inner_elided
 
-            self.__placeholder_color_current = self.__placeholder_color
-            self.__timeline_position_in.start()
-            self.__timeline_font_in.start()
+            self.__start_transition(False, self.__placeholder_color)
+
+    def __text_changed(self, text: str):
+        """Method that gets called every time the text changes. If the widget is not focused, the
+        placeholder text moves to the outside position (or back inside if the text is empty) without a transition
+
+        :param text: new text
+        """
+
+        if self.hasFocus():
+            return
+
+        if text and self.__is_placeholder_inside:
+            self.__start_transition(True, self.__placeholder_color_outside if
+                                    self.__placeholder_color_outside is not None
+                                    else self.__placeholder_color, False)
+        elif not text and not self.__is_placeholder_inside:
+            self.__start_transition(False, self.__placeholder_color, False)
+
+    def resetState(self, placeholder_text: str = None):
+        """Resets the widget to the state of a newly created one: the text is cleared, focus is removed
+        and a running transition is stopped with the placeholder text back in the inside position.
+        Style and other settings are kept (see resetSettings()). Used to recycle widgets (see AnimatedLineEditPool)
+
+        :param placeholder_text: new placeholder text (None to keep the current one)
+        """
+
+        # Focus is removed first, as losing it may start a transition
+        if self.hasFocus():
+            self.clearFocus()
+        super().setText('')
+
+        if self.__transition is not None:
+            scheduler = AnimationScheduler.instance()
+            scheduler.stop(self.__transition)
+            scheduler.cancelRelease(self.__transition)
+            self.__transition = None
+
+        if placeholder_text is not None:
+            self.__placeholder_text = placeholder_text
+
+        self.__is_placeholder_inside = True
+        self.__placeholder_color_current = self.__placeholder_color
+        self.__placeholder_color_ramp = ColorRampCache.instance().getRamp(self.__placeholder_color,
+                                                                          self.__placeholder_color)
+        self.__frame_state_previous = None
+        self.__transition_repainted_pixels = 0
+        self.__transition_frames_emitted = 0
+        self.__transition_frames_suppressed = 0
+        self.__transition_timings = None
+        self.__transition_paint_pending = False
+        self.__transition_timings_finished = False
+
+        # Snaps border and background to the colors of the current state
+        if self.__state_transition is not None:
+            AnimationScheduler.instance().stop(self.__state_transition)
+        self.__update_painter_state(True)
+
+        # Places the placeholder text inside again
+        self.__update_geometry()
+        self.update()
+
+    def resetSettings(self):
+        """Restores the settings of a newly created widget: enabled state, object name, font, echo mode,
+        maximum length, validator, input mask, completer, alignment, read-only, placeholder colors and fonts,
+        transition duration, easing curve and idle timeout, animation frame rate, painter rendering,
+        deferred geometry and instrumentation. Style values are not affected (see clearStyleOverrides())
+        and signal connections are kept. Used to recycle widgets (see AnimatedLineEditPool)
+        """
+
+        # The font a new widget would inherit (once styled, widgets no longer inherit it when reparented)
+        parent = self.parentWidget()
+        self.setFont(parent.font() if parent is not None else QApplication.font(self))
+        self.setObjectName('')
+        self.setEnabled(True)
+        self.setEchoMode(QLineEdit.EchoMode.Normal)
+        self.setMaxLength(32767)
+        self.setValidator(None)
+        self.setInputMask('')
+        self.setCompleter(None)
+        self.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        self.setReadOnly(False)
+        self.setPainterRenderingEnabled(False)
+        self.setDeferredGeometryEnabled(False)
+        self.setInstrumentationEnabled(False)
+
+        self.setTransitionDuration(250)
+        self.setEasingCurve(QEasingCurve.Type.InOutCubic)
+        self.setTransitionIdleTimeout(5000)
+        self.setAnimationFrameRate(None)
+        self.setAnimationFrameRateFromScreen(False)
+
+        self.setPlaceholderColor(self.palette().color(QPalette.ColorRole.Shadow))
+        self.setPlaceholderColorOutside(None)
+
+        self.__placeholder_font_inner = FontCache.instance().internFont(self.font())
+        self.__placeholder_font_outer = self.__placeholder_font_inner
+        self.__placeholder_font_size_current = (self.__placeholder_font_outer.pointSizeF()
+                                                if not self.__is_placeholder_inside
+                                                else self.__placeholder_font_inner.pointSizeF())
+        self.__update_geometry()
+        self.update()
 
     def resizeEvent(self, event):
         """Method that gets called every time the widget is resized.
@@ -254,54 +920,397 @@ class AnimatedLineEdit(QLineEdit):
         :param event: event sent by PyQt
         """
 
-        self.__calculate_geometry()
+        if not self.__deferred_geometry:
+            self.__calculate_geometry()
+            return
+
+        self.__geometry_pending = True
+
+        if not self.__geometry_event_posted:
+            self.__geometry_event_posted = True
+            QCoreApplication.postEvent(self, QEvent(GEOMETRY_EVENT_TYPE))
+
+    def event(self, event):
+        """Method that gets called for every event the widget receives.
+        Handles the deferred geometry calculation.
+
+        :param event: event sent by PyQt
+        :return: whether the event was recognized
+        """
+
+        if event.type() == GEOMETRY_EVENT_TYPE:
+            self.__geometry_event_posted = False
+            self.__flush_geometry()
+            return True
+
+        return super().event(event)
+
+    def __flush_geometry(self):
+        """Calculates the geometry if a deferred calculation is pending"""
+
+        if self.__geometry_pending:
+            self.__geometry_pending = False
+            self.__calculate_geometry()
+
+    def __resolve_style(self) -> tuple:
+        """Resolves the styling settings of all states into a hashable tuple.
+        Unset state values fall back to the regular values.
+
+        :return: resolved style values in stylesheet order
+        """
+
+        if not self.__style_overrides:
+            return self.__line_edit_style.getResolvedStyle()
+
+        values = self.__line_edit_style.getValues()
+        values.update(self.__style_overrides)
+        return resolve_style(values)
 
     def __update_style_sheet(self):
-        """Updates the stylesheet according to the current values."""
-
-        self.setStyleSheet('QLineEdit {'
-                           'color: %s;'
-                           'background-color: %s;'
-                           'border: %dpx solid %s;'
-                           'border-radius: %dpx;'
-                           'padding: %d %d %d %dpx;'
-                           '}'
-                           'QLineEdit:hover {'
-                           'color: %s;'
-                           'background-color: %s;'
-                           'border: %dpx solid %s;'
-                           '}'
-                           'QLineEdit:focus {'
-                           'color: %s;'
-                           'background-color: %s;'
-                           'border: %dpx solid %s;'
-                           '}'
-                           'QLineEdit:disabled {'
-                           'color: %s;'
-                           'background-color: %s;'
-                           'border: %dpx solid %s;'
-                           '}'
-                           % (self.__color.name(),
-                              self.__background_color.name(),
-                              self.__border_width,
-                              self.__border_color.name(),
-                              self.__border_radius,
-                              self.__padding.top(),
-                              self.__padding.right(),
-                              self.__padding.bottom(),
-                              self.__padding.left(),
-                              self.__color.name() if self.__hovered_color is None else self.__hovered_color.name(),
-                              self.__background_color.name() if self.__hovered_background_color is None else self.__hovered_background_color.name(),
-                              self.__border_width if self.__hovered_border_width is None else self.__hovered_border_width,
-                              self.__border_color.name() if self.__hovered_border_color is None else self.__hovered_border_color.name(),
-                              self.__color.name() if self.__focused_color is None else self.__focused_color.name(),
-                              self.__background_color.name() if self.__focused_background_color is None else self.__focused_background_color.name(),
-                              self.__border_width if self.__focused_border_width is None else self.__focused_border_width,
-                              self.__border_color.name() if self.__focused_border_color is None else self.__focused_border_color.name(),
-                              self.__color.name() if self.__disabled_color is None else self.__disabled_color.name(),
-                              self.__background_color.name() if self.__disabled_background_color is None else self.__disabled_background_color.name(),
-                              self.__border_width if self.__disabled_border_width is None else self.__disabled_border_width,
-                              self.__border_color.name() if self.__disabled_border_color is None else self.__disabled_border_color.name()))
+        """Updates the stylesheet according to the current values.
+        The stylesheet is taken from the shared cache and only applied if it changed."""
+
+        if self.__style_batch_depth > 0:
+            self.__style_sheet_dirty = True
+            return
+
+        if self.__painter_rendering:
+            self.__update_painter_state(True)
+            return
+
+        if self.__style_sheet_suspended:
+            return
+
+        if self.__style_overrides:
+            style_sheet = StyleSheetCache.instance().getStyleSheet(self.__resolve_style())
+        else:
+            style_sheet = self.__line_edit_style.getStyleSheet()
+
+        if style_sheet is not self.__style_sheet:
+            self.__style_sheet = style_sheet
+            self.setStyleSheet(style_sheet)
+
+    def __update_geometry(self):
+        """Recalculates the widget geometry, or marks it dirty while a style batch is active"""
+
+        if self.__style_batch_depth > 0:
+            self.__geometry_dirty = True
+        else:
+            self.__calculate_geometry()
+
+    @contextmanager
+    def batchStyleUpdate(self):
+        """Context manager deferring stylesheet and geometry updates until it exits.
+        All setters called inside the block result in at most one stylesheet update
+        and one geometry calculation
+
+        :return: context manager yielding the widget
+        """
+
+        self.__style_batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.__end_style_batch()
+
+    def __end_style_batch(self):
+        """Ends a style batch, applying the deferred updates if it was the outermost batch"""
+
+        self.__style_batch_depth -= 1
+        if self.__style_batch_depth == 0:
+            if self.__geometry_dirty:
+                self.__geometry_dirty = False
+                self.__calculate_geometry()
+            if self.__style_sheet_dirty:
+                self.__style_sheet_dirty = False
+                self.__update_style_sheet()
+
+    def applyStyle(self, **kwargs):
+        """Set several style settings at once with a single stylesheet update.
+        Keywords are the snake case names of the setters without the set prefix,
+        e.g. applyStyle(border_width=2, focused_border_color=QColor(0, 0, 255))
+
+        :param kwargs: style settings to apply
+        """
+
+        setters = AnimatedLineEdit.__resolve_style_setters('applyStyle', kwargs)
+
+        with self.batchStyleUpdate():
+            for setter, value in setters:
+                setter(self, value)
+
+    @classmethod
+    def __resolve_style_setters(cls, method: str, style: dict) -> list:
+        """Resolves style keywords to the setters applying them
+
+        :param method: name of the calling method used in the error message
+        :param style: style keywords and their values
+        :return: list of (unbound setter, value) tuples
+        """
+
+        unknown = [key for key in style if key not in cls.STYLE_KEYWORDS]
+        if unknown:
+            raise TypeError('%s() got unexpected keyword argument(s): %s' % (method, ', '.join(unknown)))
+
+        return [(getattr(cls, 'set' + ''.join(part.capitalize() for part in key.split('_'))), value)
+                for key, value in style.items()]
+
+    @classmethod
+    def createMany(cls, specs, parent=None, style: dict = None) -> list:
+        """Creates many widgets in one pass, e.g. for forms generated from a schema.
+        Each widget gets its style applied before its first geometry calculation and stylesheet update,
+        so geometry is calculated and the (shared) stylesheet is applied exactly once per widget
+
+        :param specs: placeholder texts, or dicts with a placeholder_text key and optional style keywords
+                      (as accepted by applyStyle()) overriding the shared style
+        :param parent: the parent widget of all created widgets
+        :param style: shared AnimatedLineEditStyle followed by every widget, or style keywords
+                      (as accepted by applyStyle()) applied to every widget
+        :return: list of the created widgets in the order of the specs
+        """
+
+        line_edit_style = None
+        if isinstance(style, AnimatedLineEditStyle):
+            line_edit_style, style = style, None
+
+        style = style or {}
+        shared_setters = cls.__resolve_style_setters('createMany', style)
+        widgets = []
+
+        # Placeholder fonts resolved by the font setters, shared by all widgets starting from the same font
+        # ((id of the interned starting font, font keywords) -> (inner font, outer font))
+        fonts = {}
+
+        for spec in specs:
+            if isinstance(spec, str):
+                placeholder_text, merged_style, setters = spec, style, shared_setters
+            else:
+                merged_style = dict(spec)
+                placeholder_text = merged_style.pop('placeholder_text')
+                cls.__resolve_style_setters('createMany', merged_style)
+                merged_style = {**style, **merged_style}
+                setters = cls.__resolve_style_setters('createMany', merged_style)
+
+            AnimatedLineEdit.__creating_many = True
+            try:
+                widget = cls(placeholder_text, parent)
+            finally:
+                deferred_widget = AnimatedLineEdit.__deferred_widget
+                AnimatedLineEdit.__creating_many = False
+                AnimatedLineEdit.__deferred_widget = None
+
+            # A helper widget constructed before the base class initialization of a subclass
+            # deferred its updates instead, so they are applied right away
+            if deferred_widget is not widget:
+                if deferred_widget is not None:
+                    deferred_widget.__end_style_batch()
+                widget.__style_batch_depth += 1
+
+            try:
+                if line_edit_style is not None:
+                    widget.setLineEditStyle(line_edit_style)
+
+                font_style = tuple((key, value) for key, value in merged_style.items()
+                                   if key in cls.FONT_KEYWORDS)
+                font_key = (id(widget.__placeholder_font_inner), font_style)
+                resolved_fonts = fonts.get(font_key)
+
+                for (setter, value), key in zip(setters, merged_style):
+                    if resolved_fonts is None or key not in cls.FONT_KEYWORDS:
+                        setter(widget, value)
+
+                if resolved_fonts is None:
+                    fonts[font_key] = (widget.__placeholder_font_inner, widget.__placeholder_font_outer)
+                else:
+                    widget.__placeholder_font_inner, widget.__placeholder_font_outer = resolved_fonts
+            finally:
+                widget.__end_style_batch()
+
+            widgets.append(widget)
+
+        return widgets
+
+    def __attach_line_edit_style(self, style: AnimatedLineEditStyle):
+        """Replaces the shared style the widget follows
+
+        :param style: new shared style
+        """
+
+        if self.__line_edit_style is not None:
+            self.__line_edit_style.removeWidget(self)
+
+        self.__line_edit_style = style
+        style.addWidget(self)
+
+    def lineEditStyleChanged(self, names: frozenset):
+        """Method that gets called by the shared style every time it changes.
+
+        :param names: names of the changed style values
+        """
+
+        # Values overridden by this widget do not affect it
+        if names <= self.__style_overrides.keys():
+            return
+
+        self.__update_style_sheet()
+        if not names.isdisjoint(GEOMETRY_VALUE_NAMES):
+            self.__update_geometry()
+
+    def __get_style_value(self, name: str):
+        """Get a style value, preferring the value set on this widget over the shared style
+
+        :param name: name of the style value
+        :return: style value
+        """
+
+        if name in self.__style_overrides:
+            return self.__style_overrides[name]
+        return self.__line_edit_style.getValue(name)
+
+    def __set_style_value(self, name: str, value):
+        """Overrides a value of the shared style for this widget
+
+        :param name: name of the style value
+        :param value: new style value
+        """
+
+        self.__style_overrides[name] = value
+        self.__palette_override_names.discard(name)
+
+    def getLineEditStyle(self) -> AnimatedLineEditStyle:
+        """Get the shared style the widget follows
+
+        :return: shared style
+        """
+
+        return self.__line_edit_style
+
+    def setLineEditStyle(self, style: AnimatedLineEditStyle):
+        """Set the shared style the widget follows. Values set on the widget with its own setters
+        keep overriding the shared style
+
+        :param style: new shared style (None to use the default style)
+        """
+
+        if style is None:
+            style = AnimatedLineEditStyle.instance()
+        if style is self.__line_edit_style:
+            return
+
+        self.__attach_line_edit_style(style)
+
+        for name in self.__palette_override_names:
+            del self.__style_overrides[name]
+        self.__palette_override_names.clear()
+
+        self.__update_style_sheet()
+        self.__update_geometry()
+
+    def getStyleOverrides(self) -> dict:
+        """Get the style values set on this widget that override the shared style
+
+        :return: dict of overridden style values by name
+        """
+
+        return dict(self.__style_overrides)
+
+    def clearStyleOverrides(self):
+        """Removes all style values set on this widget so it follows the shared style again"""
+
+        self.__style_overrides.clear()
+        self.__palette_override_names.clear()
+        self.__update_style_sheet()
+        self.__update_geometry()
+
+    def isPainterRenderingEnabled(self) -> bool:
+        """Get whether the frame and background are painted with QPainter instead of a stylesheet
+
+        :return: whether painter rendering is enabled
+        """
+
+        return self.__painter_rendering
+
+    def setPainterRenderingEnabled(self, enable: bool):
+        """Set whether the frame and background should be painted with QPainter instead of a stylesheet.
+        This bypasses the stylesheet engine for painting and hover changes while producing the same look
+
+        :param enable: whether painter rendering should be enabled
+        """
+
+        if enable == self.__painter_rendering:
+            return
+
+        self.__painter_rendering = enable
+        self.__style_sheet = None
+        self.setAttribute(Qt.WidgetAttribute.WA_Hover, enable)
+
+        if enable:
+            self.__painter_palette = self.palette()
+            self.setStyleSheet('')
+            self.setFrame(False)
+            self.__painter_state_style = self.__resolve_state_style()
+            self.__update_painter_state(True)
+        else:
+            self.setFrame(True)
+            self.setTextMargins(0, 0, 0, 0)
+            self.setPalette(self.__painter_palette)
+            self.__painter_palette = None
+            self.__painter_state_style = None
+            if self.__state_transition is not None:
+                AnimationScheduler.instance().stop(self.__state_transition)
+            self.__frame_colors = None
+            self.__update_style_sheet()
+
+    def isStyleSheetSuspended(self) -> bool:
+        """Get whether the stylesheet is removed while the widget is not in use
+
+        :return: whether the stylesheet is suspended
+        """
+
+        return self.__style_sheet_suspended
+
+    def setStyleSheetSuspended(self, suspend: bool):
+        """Set whether the stylesheet should be removed while the widget is not in use.
+        Reparenting a widget without a stylesheet is several times faster, as Qt does not
+        have to resolve it again (used by AnimatedLineEditPool)
+
+        :param suspend: whether the stylesheet should be suspended
+        """
+
+        if suspend == self.__style_sheet_suspended:
+            return
+
+        self.__style_sheet_suspended = suspend
+
+        if self.__painter_rendering:
+            return
+
+        if suspend:
+            self.__style_sheet = None
+            self.setStyleSheet('')
+        else:
+            self.__update_style_sheet()
+
+    def isDeferredGeometryEnabled(self) -> bool:
+        """Get whether geometry calculation is deferred while resizing
+
+        :return: whether deferred geometry is enabled
+        """
+
+        return self.__deferred_geometry
+
+    def setDeferredGeometryEnabled(self, enable: bool):
+        """Set whether geometry calculation should be deferred while resizing.
+        If enabled, resizes only mark the geometry dirty and it is recalculated once
+        per event loop pass or on the next paint, whichever comes first
+
+        :param enable: whether deferred geometry should be enabled
+        """
+
+        self.__deferred_geometry = enable
+
+        if not enable:
+            self.__flush_geometry()
 
     def getPlaceholderText(self) -> str:
         """Get the current placeholder text
@@ -318,6 +1327,8 @@ class AnimatedLineEdit(QLineEdit):
         """
 
         self.__placeholder_text = text
+        self.__update_geometry()
+        self.update()
 
     def getColor(self) -> QColor:
         """Get the current text color
@@ -325,7 +1336,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: text color
         """
 
-        return self.__color
+        return self.__get_style_value('color')
 
     def setColor(self, color: QColor):
         """Set the text color
@@ -333,7 +1344,7 @@ class AnimatedLineEdit(QLineEdit):
         :param color: new text color
         """
 
-        self.__color = color
+        self.__set_style_value('color', color)
         self.__update_style_sheet()
 
     def getPlaceholderColor(self) -> QColor:
@@ -382,7 +1393,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: background color
         """
 
-        return self.__background_color
+        return self.__get_style_value('background_color')
 
     def setBackgroundColor(self, color: QColor):
         """Set the background color
@@ -390,7 +1401,7 @@ class AnimatedLineEdit(QLineEdit):
         :param color: new background color
         """
 
-        self.__background_color = color
+        self.__set_style_value('background_color', color)
         self.__update_style_sheet()
 
     def getBorderColor(self) -> QColor:
@@ -399,7 +1410,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: border color
         """
 
-        return self.__border_color
+        return self.__get_style_value('border_color')
 
     def setBorderColor(self, color: QColor):
         """Set the border color
@@ -407,7 +1418,7 @@ class AnimatedLineEdit(QLineEdit):
         :param color: new border color
         """
 
-        self.__border_color = color
+        self.__set_style_value('border_color', color)
         self.__update_style_sheet()
 
     def getBorderWidth(self) -> int:
@@ -416,7 +1427,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: border width
         """
 
-        return self.__border_width
+        return self.__get_style_value('border_width')
 
     def setBorderWidth(self, width: int):
         """Set the border width
@@ -424,8 +1435,9 @@ class AnimatedLineEdit(QLineEdit):
         :param width: new border width
         """
 
-        self.__border_width = width
+        self.__set_style_value('border_width', width)
         self.__update_style_sheet()
+        self.__update_geometry()
 
     def getBorderRadius(self) -> int:
         """Get the current border radius
@@ -433,7 +1445,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: border radius
         """
 
-        return self.__border_radius
+        return self.__get_style_value('border_radius')
 
     def setBorderRadius(self, radius: int):
         """Set the border radius
@@ -441,9 +1453,9 @@ class AnimatedLineEdit(QLineEdit):
         :param radius: new border radius
         """
 
-        self.__border_radius = radius
+        self.__set_style_value('border_radius', radius)
         self.__update_style_sheet()
-        self.__placeholder_text_start = max(15, self.__border_radius + 10)
+        self.__update_geometry()
 
     def getPlaceholderFontInner(self) -> QFont:
         """Get the current placeholder text font for the inside position
@@ -451,7 +1463,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: placeholder text font for the inside position
         """
 
-        return self.__placeholder_font_inner
+        return QFont(self.__placeholder_font_inner)
 
     def getPlaceholderFontOuter(self) -> QFont:
         """Get the current placeholder text font for the outside position
@@ -459,7 +1471,27 @@ class AnimatedLineEdit(QLineEdit):
         :return: placeholder text font for the outside position
         """
 
-        return self.__placeholder_font_outer
+        return QFont(self.__placeholder_font_outer)
+
+    def __modify_placeholder_fonts(self, modify, inner: bool = True, outer: bool = True):
+        """Applies a modification to copies of the shared placeholder fonts and interns the results
+
+        :param modify: callable modifying the given font in place
+        :param inner: whether the font for the inside position should be modified
+        :param outer: whether the font for the outside position should be modified
+        """
+
+        font_cache = FontCache.instance()
+
+        if inner:
+            font = QFont(self.__placeholder_font_inner)
+            modify(font)
+            self.__placeholder_font_inner = font_cache.internFont(font)
+
+        if outer:
+            font = QFont(self.__placeholder_font_outer)
+            modify(font)
+            self.__placeholder_font_outer = font_cache.internFont(font)
 
     def setPlaceholderFontFamily(self, family: str):
         """Set the font family of the placeholder text for all positions
@@ -467,13 +1499,8 @@ class AnimatedLineEdit(QLineEdit):
         :param family: new font family of the placeholder text
         """
 
-        self.__placeholder_font_inner.setFamily(family)
-        self.__placeholder_font_outer.setFamily(family)
-        self.__placeholder_font_current = QFont(self.__placeholder_font_inner.family(),
-                                                self.__placeholder_font_inner.pointSize())
-        self.__placeholder_font_current.setWeight(self.__placeholder_font_inner.weight())
-        self.__placeholder_font_current.setItalic(self.__placeholder_font_inner.italic())
-        self.__calculate_geometry()
+        self.__modify_placeholder_fonts(lambda font: font.setFamily(family))
+        self.__update_geometry()
 
     def setPlaceholderFontSizeInner(self, size: int):
         """Set the placeholder text font size for the inside position
@@ -481,12 +1508,8 @@ class AnimatedLineEdit(QLineEdit):
         :param size: new placeholder text font size for the inside position
         """
 
-        self.__placeholder_font_inner.setPointSize(size)
-        self.__placeholder_font_current = QFont(self.__placeholder_font_inner.family(),
-                                                self.__placeholder_font_inner.pointSize())
-        self.__placeholder_font_current.setWeight(self.__placeholder_font_inner.weight())
-        self.__placeholder_font_current.setItalic(self.__placeholder_font_inner.italic())
-        self.__calculate_geometry()
+        self.__modify_placeholder_fonts(lambda font: font.setPointSize(size), outer=False)
+        self.__update_geometry()
 
     def setPlaceholderFontSizeOuter(self, size: int):
         """Set the placeholder text font size for the outside position
@@ -494,8 +1517,8 @@ class AnimatedLineEdit(QLineEdit):
         :param size: new placeholder text font size for the outside position
         """
 
-        self.__placeholder_font_outer.setPointSize(size)
-        self.__calculate_geometry()
+        self.__modify_placeholder_fonts(lambda font: font.setPointSize(size), inner=False)
+        self.__update_geometry()
 
     def setPlaceholderFontBold(self, enable: bool):
         """Set whether the placeholder text font should be bold
@@ -503,10 +1526,8 @@ class AnimatedLineEdit(QLineEdit):
         :param enable: whether the placeholder text font should be bold
         """
 
-        self.__placeholder_font_inner.setBold(enable)
-        self.__placeholder_font_outer.setBold(enable)
-        self.__placeholder_font_current.setBold(enable)
-        self.__calculate_geometry()
+        self.__modify_placeholder_fonts(lambda font: font.setBold(enable))
+        self.__update_geometry()
 
     def setPlaceholderFontItalic(self, enable: bool):
         """Set whether the placeholder text font should be italic
@@ -514,10 +1535,8 @@ class AnimatedLineEdit(QLineEdit):
         :param enable: whether the placeholder text font should be italic
         """
 
-        self.__placeholder_font_inner.setItalic(enable)
-        self.__placeholder_font_outer.setItalic(enable)
-        self.__placeholder_font_current.setItalic(enable)
-        self.__calculate_geometry()
+        self.__modify_placeholder_fonts(lambda font: font.setItalic(enable))
+        self.__update_geometry()
 
     def getPadding(self) -> QMargins:
         """Get the current padding of the widget
@@ -525,7 +1544,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: current padding
         """
 
-        return self.__padding
+        return self.__get_style_value('padding')
 
     def setPadding(self, padding: QMargins):
         """Set the padding of the widget
@@ -533,7 +1552,7 @@ class AnimatedLineEdit(QLineEdit):
         :param padding: padding of the widget
         """
 
-        self.__padding = padding
+        self.__set_style_value('padding', padding)
         self.__update_style_sheet()
 
     def getTransitionDuration(self) -> int:
@@ -551,10 +1570,10 @@ class AnimatedLineEdit(QLineEdit):
         """
 
         self.__transition_duration = duration
-        self.__timeline_position_in.setDuration(self.__transition_duration)
-        self.__timeline_position_out.setDuration(self.__transition_duration)
-        self.__timeline_font_in.setDuration(self.__transition_duration)
-        self.__timeline_font_out.setDuration(self.__transition_duration)
+        if self.__transition is not None:
+            self.__transition.setDuration(self.__transition_duration)
+        if self.__state_transition is not None:
+            self.__state_transition.setDuration(self.__transition_duration)
 
     def getEasingCurve(self) -> QEasingCurve.Type:
         """Get the current easing curve used for the placeholder text transition
@@ -571,10 +1590,203 @@ class AnimatedLineEdit(QLineEdit):
         """
 
         self.__transition_easing_curve = easing_curve
-        self.__timeline_position_in.setEasingCurve(self.__transition_easing_curve)
-        self.__timeline_position_out.setEasingCurve(self.__transition_easing_curve)
-        self.__timeline_font_in.setEasingCurve(self.__transition_easing_curve)
-        self.__timeline_font_out.setEasingCurve(self.__transition_easing_curve)
+        if self.__transition is not None:
+            self.__transition.setEasingCurve(self.__transition_easing_curve)
+        if self.__state_transition is not None:
+            self.__state_transition.setEasingCurve(self.__transition_easing_curve)
+
+    @classmethod
+    def isReducedMotion(cls) -> bool:
+        """Get whether placeholder transitions snap to their end state instead of being animated.
+        Unless set explicitly, this is enabled by the environment variable
+        PYQT_ANIMATED_LINE_EDIT_REDUCED_MOTION or on the offscreen and minimal platforms
+
+        :return: whether reduced motion is enabled
+        """
+
+        if AnimatedLineEdit.__reduced_motion is not None:
+            return AnimatedLineEdit.__reduced_motion
+
+        value = os.environ.get(REDUCED_MOTION_ENVIRONMENT_VARIABLE, '').strip().lower()
+        if value in ('1', 'true', 'yes', 'on'):
+            return True
+        if value in ('0', 'false', 'no', 'off'):
+            return False
+
+        return QApplication.platformName() in REDUCED_MOTION_PLATFORMS
+
+    @classmethod
+    def setReducedMotion(cls, enable: bool):
+        """Set whether placeholder transitions of all widgets should snap to their end state
+        instead of being animated
+
+        :param enable: whether reduced motion should be enabled (None to detect it automatically)
+        """
+
+        AnimatedLineEdit.__reduced_motion = enable
+
+    @classmethod
+    def getDefaultAnimationFrameRate(cls) -> float:
+        """Get the frame rate used by all widgets without their own frame rate
+
+        :return: default frame rate in frames per second
+        """
+
+        return AnimatedLineEdit.__default_animation_frame_rate
+
+    @classmethod
+    def setDefaultAnimationFrameRate(cls, frame_rate: float):
+        """Set the frame rate used by all widgets without their own frame rate
+
+        :param frame_rate: new default frame rate in frames per second (must be positive)
+        """
+
+        if frame_rate is None or frame_rate <= 0:
+            raise ValueError('frame rate must be positive, got %r' % (frame_rate,))
+
+        AnimatedLineEdit.__default_animation_frame_rate = frame_rate
+
+    def getAnimationFrameRate(self) -> float:
+        """Get the frame rate the placeholder transition is animated with.
+        This is the screen's refresh rate, the widget's own frame rate or the default frame rate
+
+        :return: frame rate in frames per second
+        """
+
+        if self.__animation_frame_rate_from_screen:
+            screen = self.screen()
+            if screen is not None and screen.refreshRate() > 0:
+                return screen.refreshRate()
+
+        if self.__animation_frame_rate is not None:
+            return self.__animation_frame_rate
+
+        return AnimatedLineEdit.__default_animation_frame_rate
+
+    def setAnimationFrameRate(self, frame_rate: float):
+        """Set the frame rate the placeholder transition is animated with.
+        The transition keeps its duration regardless of the frame rate
+
+        :param frame_rate: new frame rate in frames per second (must be positive, None to use the default frame rate)
+        """
+
+        if frame_rate is not None and frame_rate <= 0:
+            raise ValueError('frame rate must be positive, got %r' % (frame_rate,))
+
+        self.__animation_frame_rate = frame_rate
+
+    def isAnimationFrameRateFromScreen(self) -> bool:
+        """Get whether the frame rate is derived from the refresh rate of the widget's screen
+
+        :return: whether the screen's refresh rate is used
+        """
+
+        return self.__animation_frame_rate_from_screen
+
+    def setAnimationFrameRateFromScreen(self, enable: bool):
+        """Set whether the frame rate should be derived from the refresh rate of the widget's screen
+
+        :param enable: whether the screen's refresh rate should be used
+        """
+
+        self.__animation_frame_rate_from_screen = enable
+
+    def getTransitionIdleTimeout(self) -> int:
+        """Get the time after which an idle transition gets released
+
+        :return: idle timeout in milliseconds (negative if idle transitions are kept)
+        """
+
+        return self.__transition_idle_timeout
+
+    def setTransitionIdleTimeout(self, timeout: int):
+        """Set the time after which an idle transition gets released.
+        The transition gets created again the next time the widget gains or loses focus
+
+        :param timeout: new idle timeout in milliseconds (negative to keep idle transitions)
+        """
+
+        self.__transition_idle_timeout = timeout
+
+    def getTransitionRepaintedPixels(self) -> int:
+        """Get the number of pixels invalidated by the current or last placeholder transition
+
+        :return: number of repainted pixels
+        """
+
+        return self.__transition_repainted_pixels
+
+    def getTransitionFramesEmitted(self) -> int:
+        """Get the number of frames of the current or last transition that were repainted
+
+        :return: number of emitted frames
+        """
+
+        return self.__transition_frames_emitted
+
+    def getTransitionFramesSuppressed(self) -> int:
+        """Get the number of frames of the current or last transition that were skipped
+        because they looked exactly like the previously painted frame
+
+        :return: number of suppressed frames
+        """
+
+        return self.__transition_frames_suppressed
+
+    def isInstrumentationEnabled(self) -> bool:
+        """Get whether frame timings of the placeholder transitions are recorded
+
+        :return: whether instrumentation is enabled
+        """
+
+        return self.__instrumentation
+
+    def setInstrumentationEnabled(self, enable: bool):
+        """Set whether frame count, frame intervals, paint and slot durations of the placeholder
+        transitions should be recorded. Finished transitions are emitted by transitionTimed and
+        added to the widget's statistics and the global InstrumentationCollector
+
+        :param enable: whether instrumentation should be enabled
+        """
+
+        self.__instrumentation = enable
+
+        if enable:
+            if self.__timing_aggregate is None:
+                self.__timing_aggregate = TimingAggregate()
+        else:
+            self.__transition_timings = None
+            self.__transition_paint_pending = False
+            self.__transition_timings_finished = False
+
+        if self.__transition is not None:
+            self.__transition.callback = self.__transition_value_changed_timed if enable \
+                else self.__transition_value_changed
+
+    def getLastTransitionTimings(self) -> TransitionTimings:
+        """Get the timings of the last finished transition recorded by the instrumentation
+
+        :return: transition timings (None if no transition has been recorded)
+        """
+
+        return self.__transition_timings_last
+
+    def getTimingStatistics(self) -> dict:
+        """Get aggregated statistics of all transitions recorded by the instrumentation
+
+        :return: dict with the transition and frame counts and the p50, p95 and max of
+                 frame_interval, paint_duration and slot_duration in milliseconds (None if never enabled)
+        """
+
+        return None if self.__timing_aggregate is None else self.__timing_aggregate.getStatistics()
+
+    def hasTransition(self) -> bool:
+        """Get whether the transition machinery is currently allocated
+
+        :return: whether the transition exists
+        """
+
+        return self.__transition is not None
 
     def getHoveredColor(self) -> QColor:
         """Get the current hovered text color
@@ -582,7 +1794,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: hovered text color
         """
 
-        return self.__hovered_color
+        return self.__get_style_value('hovered_color')
 
     def setHoveredColor(self, color: QColor):
         """Set the hovered text color
@@ -590,7 +1802,7 @@ class AnimatedLineEdit(QLineEdit):
         :param color: new hovered text color
         """
 
-        self.__hovered_color = color
+        self.__set_style_value('hovered_color', color)
         self.__update_style_sheet()
 
     def getHoveredBackgroundColor(self) -> QColor:
@@ -599,7 +1811,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: hovered background color
         """
 
-        return self.__hovered_background_color
+        return self.__get_style_value('hovered_background_color')
 
     def setHoveredBackgroundColor(self, color: QColor):
         """Set the hovered background color
@@ -607,7 +1819,7 @@ class AnimatedLineEdit(QLineEdit):
         :param color: new hovered background color
         """
 
-        self.__hovered_background_color = color
+        self.__set_style_value('hovered_background_color', color)
         self.__update_style_sheet()
 
     def getHoveredBorderColor(self) -> QColor:
@@ -616,7 +1828,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: hovered border color
         """
 
-        return self.__hovered_border_color
+        return self.__get_style_value('hovered_border_color')
 
     def setHoveredBorderColor(self, color: QColor):
         """Set the hovered border color
@@ -624,7 +1836,7 @@ class AnimatedLineEdit(QLineEdit):
         :param color: new hovered border color
         """
 
-        self.__hovered_border_color = color
+        self.__set_style_value('hovered_border_color', color)
         self.__update_style_sheet()
 
     def getHoveredBorderWidth(self) -> int:
@@ -633,7 +1845,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: hovered border width
         """
 
-        return self.__hovered_border_width
+        return self.__get_style_value('hovered_border_width')
 
     def setHoveredBorderWidth(self, width: int):
         """Set the hovered border width
@@ -641,7 +1853,7 @@ class AnimatedLineEdit(QLineEdit):
         :param width: new hovered border width
         """
 
-        self.__hovered_border_width = width
+        self.__set_style_value('hovered_border_width', width)
         self.__update_style_sheet()
 
     def getFocusedColor(self) -> QColor:
@@ -650,7 +1862,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: focused text color
         """
 
-        return self.__focused_color
+        return self.__get_style_value('focused_color')
 
     def setFocusedColor(self, color: QColor):
         """Set the focused text color
@@ -658,7 +1870,7 @@ class AnimatedLineEdit(QLineEdit):
         :param color: new focused text color
         """
 
-        self.__focused_color = color
+        self.__set_style_value('focused_color', color)
         self.__update_style_sheet()
 
     def getFocusedBackgroundColor(self) -> QColor:
@@ -667,7 +1879,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: focused background color
         """
 
-        return self.__focused_background_color
+        return self.__get_style_value('focused_background_color')
 
     def setFocusedBackgroundColor(self, color: QColor):
         """Set the focused background color
@@ -675,7 +1887,7 @@ class AnimatedLineEdit(QLineEdit):
         :param color: new focused background color
         """
 
-        self.__focused_background_color = color
+        self.__set_style_value('focused_background_color', color)
         self.__update_style_sheet()
 
     def getFocusedBorderColor(self) -> QColor:
@@ -684,7 +1896,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: focused border color
         """
 
-        return self.__focused_border_color
+        return self.__get_style_value('focused_border_color')
 
     def setFocusedBorderColor(self, color: QColor):
         """Set the focused border color
@@ -692,7 +1904,7 @@ class AnimatedLineEdit(QLineEdit):
         :param color: new focused border color
         """
 
-        self.__focused_border_color = color
+        self.__set_style_value('focused_border_color', color)
         self.__update_style_sheet()
 
     def getFocusedBorderWidth(self) -> int:
@@ -701,7 +1913,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: focused border width
         """
 
-        return self.__focused_border_width
+        return self.__get_style_value('focused_border_width')
 
     def setFocusedBorderWidth(self, width: int):
         """Set the focused border width
@@ -709,8 +1921,9 @@ class AnimatedLineEdit(QLineEdit):
         :param width: new focused border width
         """
 
-        self.__focused_border_width = width
+        self.__set_style_value('focused_border_width', width)
         self.__update_style_sheet()
+        self.__update_geometry()
 
     def getDisabledColor(self) -> QColor:
         """Get the current disabled text color
@@ -718,7 +1931,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: disabled text color
         """
 
-        return self.__disabled_color
+        return self.__get_style_value('disabled_color')
 
     def setDisabledColor(self, color: QColor):
         """Set the disabled text color
@@ -726,7 +1939,7 @@ class AnimatedLineEdit(QLineEdit):
         :param color: new disabled text color
         """
 
-        self.__disabled_color = color
+        self.__set_style_value('disabled_color', color)
         self.__update_style_sheet()
 
     def getDisabledBackgroundColor(self) -> QColor:
@@ -735,7 +1948,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: disabled background color
         """
 
-        return self.__disabled_background_color
+        return self.__get_style_value('disabled_background_color')
 
     def setDisabledBackgroundColor(self, color: QColor):
         """Set the disabled background color
@@ -743,7 +1956,7 @@ class AnimatedLineEdit(QLineEdit):
         :param color: new disabled background color
         """
 
-        self.__disabled_background_color = color
+        self.__set_style_value('disabled_background_color', color)
         self.__update_style_sheet()
 
     def getDisabledBorderColor(self) -> QColor:
@@ -752,7 +1965,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: disabled border color
         """
 
-        return self.__disabled_border_color
+        return self.__get_style_value('disabled_border_color')
 
     def setDisabledBorderColor(self, color: QColor):
         """Set the disabled border color
@@ -760,7 +1973,7 @@ class AnimatedLineEdit(QLineEdit):
         :param color: new disabled border color
         """
 
-        self.__disabled_border_color = color
+        self.__set_style_value('disabled_border_color', color)
         self.__update_style_sheet()
 
     def getDisabledBorderWidth(self) -> int:
@@ -769,7 +1982,7 @@ class AnimatedLineEdit(QLineEdit):
         :return: disabled border width
         """
 
-        return self.__disabled_border_width
+        return self.__get_style_value('disabled_border_width')
 
     def setDisabledBorderWidth(self, width: int):
         """Set the disabled border width
@@ -777,7 +1990,7 @@ class AnimatedLineEdit(QLineEdit):
         :param width: new disabled border width
         """
 
-        self.__disabled_border_width = width
+        self.__set_style_value('disabled_border_width', width)
         self.__update_style_sheet()
 
     def isPlaceholderInside(self) -> bool:
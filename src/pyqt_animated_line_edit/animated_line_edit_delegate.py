@@ -0,0 +1,371 @@
+import math
+from qtpy.QtGui import QColor, QFont, QPalette
+from qtpy.QtCore import QRect, QSize, Qt
+from qtpy.QtWidgets import QApplication, QStyle, QStyledItemDelegate
+from .animated_line_edit import AnimatedLineEdit, get_frame_pixmap
+from .animated_line_edit_style import AnimatedLineEditStyle
+from .font_cache import FontCache
+
+
+# Item data role the placeholder text is read from (falls back to the horizontal header of the column)
+PLACEHOLDER_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class AnimatedLineEditDelegate(QStyledItemDelegate):
+
+    def __init__(self, parent=None, style: AnimatedLineEditStyle = None):
+        """Creates a new AnimatedLineEditDelegate instance painting items like AnimatedLineEdits at rest.
+        A widget only exists for the item being edited, so memory and paint cost do not grow with the
+        number of rows
+
+        :param parent: the parent object (usually the view)
+        :param style: shared style of the painted items and editors (None to use the default style)
+        """
+
+        super(AnimatedLineEditDelegate, self).__init__(parent)
+
+        self.__line_edit_style = AnimatedLineEditStyle.instance() if style is None else style
+        self.__placeholder_role = PLACEHOLDER_ROLE
+        self.__placeholder_color = QApplication.palette().color(QPalette.ColorRole.Shadow)
+        self.__placeholder_color_outside = None
+        self.__placeholder_font_size_inner = None
+        self.__placeholder_font_size_outer = None
+        self.__transition_duration = 250
+
+        # Placeholder fonts derived from the font of the view (resolved again if the view's font changes)
+        self.__font = None
+        self.__placeholder_font_inner = None
+        self.__placeholder_font_outer = None
+
+    def __update_fonts(self, font: QFont):
+        """Derives the placeholder fonts from the font of the view
+
+        :param font: font of the view
+        """
+
+        if font == self.__font:
+            return
+
+        font_cache = FontCache.instance()
+        self.__font = font_cache.internFont(font)
+        self.__placeholder_font_inner = self.__font
+        self.__placeholder_font_outer = self.__font
+
+        if self.__placeholder_font_size_inner is not None:
+            inner = QFont(font)
+            inner.setPointSize(self.__placeholder_font_size_inner)
+            self.__placeholder_font_inner = font_cache.internFont(inner)
+
+        if self.__placeholder_font_size_outer is not None:
+            outer = QFont(font)
+            outer.setPointSize(self.__placeholder_font_size_outer)
+            self.__placeholder_font_outer = font_cache.internFont(outer)
+
+    def __get_placeholder_text(self, index) -> str:
+        """Get the placeholder text of an item
+
+        :param index: model index of the item
+        :return: placeholder text
+        """
+
+        placeholder_text = index.data(self.__placeholder_role)
+
+        if placeholder_text is None:
+            placeholder_text = index.model().headerData(index.column(), Qt.Orientation.Horizontal)
+
+        return '' if placeholder_text is None else str(placeholder_text)
+
+    def __resolve_state_style(self, state) -> tuple:
+        """Resolves text color, background color, border width and border color
+        for the state of an item (disabled, focused, hovered or regular)
+
+        :param state: style state flags of the item
+        :return: resolved values of the state
+        """
+
+        get_value = self.__line_edit_style.getValue
+
+        if not state & QStyle.StateFlag.State_Enabled:
+            prefix = 'disabled_'
+        elif state & QStyle.StateFlag.State_HasFocus:
+            prefix = 'focused_'
+        elif state & QStyle.StateFlag.State_MouseOver:
+            prefix = 'hovered_'
+        else:
+            prefix = None
+
+        resolved = []
+        for name in ('color', 'background_color', 'border_width', 'border_color'):
+            value = None if prefix is None else get_value(prefix + name)
+            resolved.append(get_value(name) if value is None else value)
+        return tuple(resolved)
+
+    def paint(self, painter, option, index):
+        """Paints an item like an AnimatedLineEdit at rest: the frame, the text and the placeholder
+        text inside (if the item is empty) or on the top border (if the item has text)
+
+        :param painter: painter of the view
+        :param option: style options of the item
+        :param index: model index of the item
+        """
+
+        self.__update_fonts(option.font)
+        font_cache = FontCache.instance()
+        get_value = self.__line_edit_style.getValue
+        color, background_color, border_width, border_color = self.__resolve_state_style(option.state)
+        border_radius = get_value('border_radius')
+        focused_border_width = get_value('focused_border_width')
+        if focused_border_width is None:
+            focused_border_width = get_value('border_width')
+
+        rect = option.rect
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        text = '' if text is None else str(text)
+        placeholder_text = self.__get_placeholder_text(index)
+        placeholder_text_start = max(15, border_radius + 10)
+        placeholder_width = rect.width() - placeholder_text_start * 2
+
+        outer_text, outer_bounds = font_cache.getElidedText(
+            self.__placeholder_font_outer, placeholder_text, placeholder_width)
+        top_offset = math.ceil((outer_bounds.height() - focused_border_width) / 2)
+        frame_rect = rect.adjusted(0, top_offset, 0, 0)
+
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(rect, option.palette.highlight())
+
+        painter.save()
+        painter.drawPixmap(frame_rect.topLeft(), get_frame_pixmap(
+            frame_rect.width(), frame_rect.height(), painter.device().devicePixelRatioF(), border_radius,
+            border_width, border_color, background_color))
+
+        # Text laid out like in a QLineEdit (2px horizontal and 1px vertical margin inside the padding)
+        if text:
+            padding = get_value('padding')
+            text_rect = frame_rect.adjusted(border_width + padding.left() + 2, border_width + padding.top() + 1,
+                                            -border_width - padding.right() - 2,
+                                            -border_width - padding.bottom() - 1)
+            painter.setFont(self.__font)
+            painter.setPen(color)
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                             font_cache.getElidedText(self.__font, text, text_rect.width())[0])
+
+        if text:
+            # Placeholder text on the top border with a gap in the border behind it
+            notch_left = max(placeholder_text_start - 5, border_radius)
+            notch_right = min(placeholder_text_start + outer_bounds.width() + 5, rect.width() - 1 - border_radius)
+            if notch_right >= notch_left:
+                painter.fillRect(QRect(rect.x() + notch_left, rect.y() + top_offset,
+                                       notch_right - notch_left + 1, focused_border_width), background_color)
+
+            font = self.__placeholder_font_outer
+            placeholder_text = outer_text
+            x = rect.x() + placeholder_text_start
+            y = rect.y() + outer_bounds.height()
+            painter.setPen(self.__placeholder_color_outside if self.__placeholder_color_outside is not None
+                           else self.__placeholder_color)
+        else:
+            font = self.__placeholder_font_inner
+            placeholder_text, inner_bounds = font_cache.getElidedText(font, placeholder_text, placeholder_width)
+            x = rect.x() + placeholder_text_start
+            y = rect.y() + top_offset + (rect.height() - top_offset - math.ceil(
+                (rect.height() - top_offset - inner_bounds.height()) / 2))
+            painter.setPen(self.__placeholder_color)
+
+        painter.setFont(font)
+        painter.drawStaticText(x, y - font_cache.getFontMetrics(font).ascent(),
+                               font_cache.getStaticText(font, placeholder_text))
+        painter.restore()
+
+    def sizeHint(self, option, index) -> QSize:
+        """Get the size of an item, leaving room for the placeholder text on the top border
+
+        :param option: style options of the item
+        :param index: model index of the item
+        :return: size hint of the item
+        """
+
+        self.__update_fonts(option.font)
+        font_cache = FontCache.instance()
+        get_value = self.__line_edit_style.getValue
+        padding = get_value('padding')
+        border_width = get_value('border_width')
+        focused_border_width = get_value('focused_border_width')
+        if focused_border_width is None:
+            focused_border_width = border_width
+
+        outer_bounds = font_cache.getBoundingRect(self.__placeholder_font_outer, self.__get_placeholder_text(index))
+        top_offset = math.ceil((outer_bounds.height() - focused_border_width) / 2)
+        height = (top_offset + font_cache.getFontMetrics(self.__font).height() + padding.top() + padding.bottom() +
+                  2 * max(border_width, focused_border_width) + 2 + 4)
+
+        size = super().sizeHint(option, index)
+        return QSize(size.width(), max(size.height(), height))
+
+    def createEditor(self, parent, option, index) -> AnimatedLineEdit:
+        """Creates the short-lived AnimatedLineEdit used to edit an item.
+        Only this editor runs the placeholder transition
+
+        :param parent: parent widget of the editor (the viewport of the view)
+        :param option: style options of the item
+        :param index: model index of the item
+        :return: the editor
+        """
+
+        editor = AnimatedLineEdit(self.__get_placeholder_text(index), parent)
+
+        with editor.batchStyleUpdate():
+            editor.setLineEditStyle(self.__line_edit_style)
+            editor.setPlaceholderColor(self.__placeholder_color)
+            editor.setPlaceholderColorOutside(self.__placeholder_color_outside)
+            editor.setTransitionDuration(self.__transition_duration)
+            if self.__placeholder_font_size_inner is not None:
+                editor.setPlaceholderFontSizeInner(self.__placeholder_font_size_inner)
+            if self.__placeholder_font_size_outer is not None:
+                editor.setPlaceholderFontSizeOuter(self.__placeholder_font_size_outer)
+
+        return editor
+
+    def setEditorData(self, editor: AnimatedLineEdit, index):
+        """Sets the text of the editor from the model
+
+        :param editor: the editor
+        :param index: model index of the edited item
+        """
+
+        text = index.data(Qt.ItemDataRole.EditRole)
+        editor.setText('' if text is None else str(text))
+
+    def setModelData(self, editor: AnimatedLineEdit, model, index):
+        """Writes the text of the editor to the model
+
+        :param editor: the editor
+        :param model: the model of the edited item
+        :param index: model index of the edited item
+        """
+
+        model.setData(index, editor.text(), Qt.ItemDataRole.EditRole)
+
+    def updateEditorGeometry(self, editor: AnimatedLineEdit, option, index):
+        """Places the editor exactly over the painted item
+
+        :param editor: the editor
+        :param option: style options of the item
+        :param index: model index of the edited item
+        """
+
+        editor.setGeometry(option.rect)
+
+    def getLineEditStyle(self) -> AnimatedLineEditStyle:
+        """Get the shared style of the painted items and editors
+
+        :return: shared style
+        """
+
+        return self.__line_edit_style
+
+    def setLineEditStyle(self, style: AnimatedLineEditStyle):
+        """Set the shared style of the painted items and editors
+
+        :param style: new shared style (None to use the default style)
+        """
+
+        self.__line_edit_style = AnimatedLineEditStyle.instance() if style is None else style
+
+    def getPlaceholderRole(self) -> int:
+        """Get the item data role the placeholder text is read from
+
+        :return: placeholder text role
+        """
+
+        return self.__placeholder_role
+
+    def setPlaceholderRole(self, role: int):
+        """Set the item data role the placeholder text is read from.
+        Items without data for this role use the horizontal header of their column
+
+        :param role: new placeholder text role
+        """
+
+        self.__placeholder_role = role
+
+    def getPlaceholderColor(self) -> QColor:
+        """Get the placeholder text color
+
+        :return: placeholder text color
+        """
+
+        return self.__placeholder_color
+
+    def setPlaceholderColor(self, color: QColor):
+        """Set the placeholder text color
+
+        :param color: new placeholder text color
+        """
+
+        self.__placeholder_color = color
+
+    def getPlaceholderColorOutside(self) -> QColor:
+        """Get the placeholder text color for the outside position
+
+        :return: placeholder text color for the outside position
+        """
+
+        return self.__placeholder_color_outside
+
+    def setPlaceholderColorOutside(self, color: QColor):
+        """Set the placeholder text color for the outside position
+
+        :param color: new placeholder text color for the outside position
+        """
+
+        self.__placeholder_color_outside = color
+
+    def getPlaceholderFontSizeInner(self) -> int:
+        """Get the placeholder text font size for the inside position
+
+        :return: font size (None to use the font size of the view)
+        """
+
+        return self.__placeholder_font_size_inner
+
+    def setPlaceholderFontSizeInner(self, size: int):
+        """Set the placeholder text font size for the inside position
+
+        :param size: new font size (None to use the font size of the view)
+        """
+
+        self.__placeholder_font_size_inner = size
+        self.__font = None
+
+    def getPlaceholderFontSizeOuter(self) -> int:
+        """Get the placeholder text font size for the outside position
+
+        :return: font size (None to use the font size of the view)
+        """
+
+        return self.__placeholder_font_size_outer
+
+    def setPlaceholderFontSizeOuter(self, size: int):
+        """Set the placeholder text font size for the outside position
+
+        :param size: new font size (None to use the font size of the view)
+        """
+
+        self.__placeholder_font_size_outer = size
+        self.__font = None
+
+    def getTransitionDuration(self) -> int:
+        """Get the duration of the placeholder transition of the editor
+
+        :return: duration in milliseconds
+        """
+
+        return self.__transition_duration
+
+    def setTransitionDuration(self, duration: int):
+        """Set the duration of the placeholder transition of the editor
+
+        :param duration: new duration in milliseconds
+        """
+
+        self.__transition_duration = duration
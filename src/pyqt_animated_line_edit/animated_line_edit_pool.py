@@ -0,0 +1,141 @@
+from qtpy.QtCore import Qt
+from .animated_line_edit import AnimatedLineEdit
+from .animated_line_edit_style import AnimatedLineEditStyle
+
+
+class AnimatedLineEditPool:
+
+    def __init__(self, maximum_size: int = 64, style: AnimatedLineEditStyle = None):
+        """Creates a new AnimatedLineEditPool instance recycling released widgets instead of
+        constructing new ones, e.g. for the pages of a wizard that are built and torn down repeatedly
+
+        :param maximum_size: maximum number of idle widgets kept (further released widgets are deleted)
+        :param style: shared style of the handed out widgets (None to use the default style)
+        """
+
+        self.__maximum_size = maximum_size
+        self.__line_edit_style = style
+        self.__widgets = []
+
+        # Reuse statistics
+        self.__created = 0
+        self.__reused = 0
+        self.__released = 0
+        self.__discarded = 0
+
+    def acquire(self, placeholder_text: str = '', parent=None) -> AnimatedLineEdit:
+        """Get a widget in the state of a newly created one, reusing an idle widget if there is one
+        (see resetState() and resetSettings()). Signal connections made by previous users are not removed,
+        so connections to a pooled widget have to be disconnected before releasing it.
+        Like any widget added to an already visible parent, it has to be shown explicitly
+
+        :param placeholder_text: the displayed placeholder text
+        :param parent: the parent widget
+        :return: the widget
+        """
+
+        if not self.__widgets:
+            self.__created += 1
+            widget = AnimatedLineEdit(placeholder_text, parent)
+            if self.__line_edit_style is not None:
+                widget.setLineEditStyle(self.__line_edit_style)
+            return widget
+
+        self.__reused += 1
+        widget = self.__widgets.pop()
+        if placeholder_text != widget.getPlaceholderText():
+            widget.resetState(placeholder_text)
+        if parent is not None:
+            widget.setParent(parent)
+
+        # Restored after reparenting, so the widget and placeholder fonts are inherited from the new parent
+        with widget.batchStyleUpdate():
+            widget.resetSettings()
+        widget.setStyleSheetSuspended(False)
+        return widget
+
+    def release(self, widget: AnimatedLineEdit):
+        """Takes a widget back. The widget is detached from its parent and reset (see resetState()),
+        its style values set with its own setters are removed. If the pool is full, the widget is
+        deleted instead. Widgets that are already idle in the pool are ignored
+
+        :param widget: the widget that is no longer used
+        """
+
+        if any(idle is widget for idle in self.__widgets):
+            return
+
+        self.__released += 1
+
+        if len(self.__widgets) >= self.__maximum_size:
+            self.__discarded += 1
+            widget.setParent(None)
+            widget.deleteLater()
+            return
+
+        # Hidden and without stylesheet before detaching, as both make reparenting much slower.
+        # The widget is not kept explicitly hidden, so it is shown together with its next parent
+        # like a new widget
+        widget.hide()
+        widget.setStyleSheetSuspended(True)
+        widget.setParent(None)
+        widget.setAttribute(Qt.WidgetAttribute.WA_WState_ExplicitShowHide, False)
+
+        with widget.batchStyleUpdate():
+            widget.resetState()
+            if widget.getStyleOverrides():
+                widget.clearStyleOverrides()
+            widget.setLineEditStyle(self.__line_edit_style)
+
+        self.__widgets.append(widget)
+
+    def getSize(self) -> int:
+        """Get the number of idle widgets
+
+        :return: number of widgets waiting to be reused
+        """
+
+        return len(self.__widgets)
+
+    def getMaximumSize(self) -> int:
+        """Get the maximum number of idle widgets kept
+
+        :return: maximum pool size
+        """
+
+        return self.__maximum_size
+
+    def setMaximumSize(self, maximum_size: int):
+        """Set the maximum number of idle widgets kept, deleting the idle widgets exceeding it
+
+        :param maximum_size: new maximum pool size
+        """
+
+        self.__maximum_size = maximum_size
+
+        while len(self.__widgets) > maximum_size:
+            self.__discarded += 1
+            self.__widgets.pop().deleteLater()
+
+    def getStatistics(self) -> dict:
+        """Get the reuse statistics of the pool
+
+        :return: dict with the numbers of created, reused, released and discarded widgets,
+            the current size and the ratio of acquisitions served by reused widgets
+        """
+
+        acquired = self.__created + self.__reused
+        return {'created': self.__created,
+                'reused': self.__reused,
+                'released': self.__released,
+                'discarded': self.__discarded,
+                'size': len(self.__widgets),
+                'reuse_ratio': self.__reused / acquired if acquired else 0.0}
+
+    def clear(self):
+        """Deletes all idle widgets"""
+
+        for widget in self.__widgets:
+            widget.deleteLater()
+        self.__discarded += len(self.__widgets)
+        self.__widgets.clear()
@@ -0,0 +1,226 @@
+import weakref
+from qtpy.QtGui import QColor, QPalette
+from qtpy.QtCore import QObject, QMargins, Signal
+from qtpy.QtWidgets import QApplication
+from .style_sheet_cache import StyleSheetCache
+
+
+# Names of all style values (the state values fall back to the regular values if they are None)
+STYLE_VALUE_NAMES = (
+    'color', 'background_color', 'border_color', 'border_width', 'border_radius', 'padding',
+    'hovered_color', 'hovered_background_color', 'hovered_border_color', 'hovered_border_width',
+    'focused_color', 'focused_background_color', 'focused_border_color', 'focused_border_width',
+    'disabled_color', 'disabled_background_color', 'disabled_border_color', 'disabled_border_width')
+
+# Style values the widget geometry depends on
+GEOMETRY_VALUE_NAMES = frozenset(('border_width', 'border_radius', 'focused_border_width'))
+
+# Style values taken from the application palette and their palette color roles
+PALETTE_VALUE_ROLES = (('border_color', QPalette.ColorRole.Shadow),
+                       ('focused_border_color', QPalette.ColorRole.Highlight))
+
+
+def resolve_style(values: dict) -> tuple:
+    """Resolves the style values of all states into a hashable tuple.
+    Unset state values fall back to the regular values.
+
+    :param values: style values by name
+    :return: resolved style values in stylesheet order
+    """
+
+    color = values['color'].name()
+    background_color = values['background_color'].name()
+    border_width = values['border_width']
+    border_color = values['border_color'].name()
+    padding = values['padding']
+    resolved = [color, background_color, border_width, border_color, values['border_radius'],
+                padding.top(), padding.right(), padding.bottom(), padding.left()]
+
+    for state in ('hovered_', 'focused_', 'disabled_'):
+        state_color = values[state + 'color']
+        state_background_color = values[state + 'background_color']
+        state_border_width = values[state + 'border_width']
+        state_border_color = values[state + 'border_color']
+        resolved += [color if state_color is None else state_color.name(),
+                     background_color if state_background_color is None else state_background_color.name(),
+                     border_width if state_border_width is None else state_border_width,
+                     border_color if state_border_color is None else state_border_color.name()]
+
+    return tuple(resolved)
+
+
+class AnimatedLineEditStyle(QObject):
+
+    # Emitted with the set of names of the changed values every time the style changes
+    changed = Signal(object)
+
+    __instance = None
+
+    @classmethod
+    def instance(cls) -> 'AnimatedLineEditStyle':
+        """Get the process-wide default style used by all widgets without their own style,
+        creating it on first use
+
+        :return: default style instance
+        """
+
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self, **values):
+        """Creates a new AnimatedLineEditStyle instance that can be shared by many widgets.
+        Keywords are the style value names, e.g. AnimatedLineEditStyle(border_width=2, border_radius=4)
+
+        :param values: style values differing from the defaults
+        """
+
+        super(AnimatedLineEditStyle, self).__init__()
+
+        palette = QApplication.palette()
+        self.__values = dict.fromkeys(STYLE_VALUE_NAMES)
+        self.__values.update(color=QColor(0, 0, 0),
+                             background_color=QColor(255, 255, 255),
+                             border_width=1,
+                             border_radius=0,
+                             padding=QMargins())
+
+        # Application palette colors the palette values were taken from
+        self.__palette_colors = {}
+        for name, role in PALETTE_VALUE_ROLES:
+            self.__palette_colors[name] = self.__values[name] = palette.color(role)
+
+        self.__update_values('AnimatedLineEditStyle', values)
+
+        # Resolved style and stylesheet, built once after every change
+        self.__resolved_style = None
+        self.__style_sheet = None
+
+        # Widgets following this style (notified directly, as a signal connection per widget
+        # would make widget construction noticeably slower)
+        self.__widgets = weakref.WeakSet()
+
+    def applicationPaletteChanged(self, palette: QPalette):
+        """Method that gets called by the widgets every time their palette changes.
+        If the application palette changed, the values taken from it are updated and all widgets
+        using this style follow. Values that have been set explicitly since are kept
+
+        :param palette: current application palette
+        """
+
+        changed = {}
+        for name, role in PALETTE_VALUE_ROLES:
+            color = palette.color(role)
+            previous = self.__palette_colors[name]
+            if color != previous:
+                self.__palette_colors[name] = color
+                if self.__values[name] == previous:
+                    changed[name] = color
+
+        if changed:
+            self.applyStyle(**changed)
+
+    def __update_values(self, method: str, values: dict):
+        """Validates and stores style values
+
+        :param method: name of the calling method used in the error message
+        :param values: style values by name
+        """
+
+        unknown = [name for name in values if name not in self.__values]
+        if unknown:
+            raise TypeError('%s() got unexpected keyword argument(s): %s' % (method, ', '.join(unknown)))
+
+        self.__values.update(values)
+
+    def getValue(self, name: str):
+        """Get a style value
+
+        :param name: name of the style value
+        :return: style value (None for unset state values)
+        """
+
+        return self.__values[name]
+
+    def getValues(self) -> dict:
+        """Get all style values
+
+        :return: dict of all style values by name
+        """
+
+        return dict(self.__values)
+
+    def setValue(self, name: str, value):
+        """Set a style value and update all widgets using this style
+
+        :param name: name of the style value
+        :param value: new style value (None to let a state value fall back to the regular value)
+        """
+
+        self.applyStyle(**{name: value})
+
+    def applyStyle(self, **kwargs):
+        """Set several style values at once, e.g. applyStyle(border_width=2, focused_border_color=QColor(0, 0, 255)).
+        The stylesheet is regenerated once and all widgets using this style are updated in a single pass
+
+        :param kwargs: style values to set
+        """
+
+        self.__update_values('applyStyle', kwargs)
+        self.__resolved_style = None
+        self.__style_sheet = None
+        names = frozenset(kwargs)
+
+        for widget in list(self.__widgets):
+            try:
+                widget.lineEditStyleChanged(names)
+            except RuntimeError:
+                # The underlying C++ widget has been deleted
+                self.__widgets.discard(widget)
+
+        self.changed.emit(names)
+
+    def getResolvedStyle(self) -> tuple:
+        """Get the style values of all states resolved into a hashable tuple
+
+        :return: resolved style values in stylesheet order
+        """
+
+        if self.__resolved_style is None:
+            self.__resolved_style = resolve_style(self.__values)
+        return self.__resolved_style
+
+    def getStyleSheet(self) -> str:
+        """Get the stylesheet of this style (shared with all identically styled widgets)
+
+        :return: stylesheet
+        """
+
+        if self.__style_sheet is None:
+            self.__style_sheet = StyleSheetCache.instance().getStyleSheet(self.getResolvedStyle())
+        return self.__style_sheet
+
+    def addWidget(self, widget):
+        """Registers a widget following this style. Its lineEditStyleChanged() method gets called
+        every time the style changes. Usually called by AnimatedLineEdit.setLineEditStyle()
+
+        :param widget: the widget to register (only weakly referenced)
+        """
+
+        self.__widgets.add(widget)
+
+    def removeWidget(self, widget):
+        """Unregisters a widget that no longer follows this style
+
+        :param widget: the widget to unregister
+        """
+
+        self.__widgets.discard(widget)
+
+    def getWidgetCount(self) -> int:
+        """Get the number of widgets using this style
+
+        :return: number of widgets
+        """
+
+        return len(self.__widgets)
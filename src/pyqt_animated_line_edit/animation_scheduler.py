@@ -0,0 +1,268 @@
+import math
+import time
+from qtpy.QtCore import QObject, QTimer, QEasingCurve, Qt
+from .trace_recorder import TraceRecorder
+
+
+class Transition:
+
+    def __init__(self, widget, callback, duration: int = 250,
+                 easing_curve: QEasingCurve.Type = QEasingCurve.Type.InOutCubic, finished_callback=None):
+        """Creates a new Transition instance
+
+        :param widget: the widget that gets repainted while the transition runs
+        :param callback: callable receiving the eased progress (between 0.0 and 1.0) and returning
+                         the QRect of the widget to repaint (or None if nothing needs to be repainted)
+        :param duration: duration of the transition in milliseconds
+        :param easing_curve: easing curve applied to the progress
+        :param finished_callback: optional callable that gets called once the transition has finished
+        """
+
+        self.widget = widget
+        self.callback = callback
+        self.finished_callback = finished_callback
+        self.duration = duration
+        self.easing_curve = QEasingCurve(easing_curve)
+        self.frame_interval = 40.0
+        self.start_time = 0.0
+        self.last_frame_time = 0.0
+
+    def setDuration(self, duration: int):
+        """Set the duration of the transition
+
+        :param duration: new duration in milliseconds
+        """
+
+        self.duration = duration
+
+    def setEasingCurve(self, easing_curve: QEasingCurve.Type):
+        """Set the easing curve of the transition
+
+        :param easing_curve: new easing curve
+        """
+
+        self.easing_curve = QEasingCurve(easing_curve)
+
+    def setFrameRate(self, frame_rate: float):
+        """Set the number of frames per second the transition is advanced with
+
+        :param frame_rate: new frame rate
+        """
+
+        self.frame_interval = 1000 / frame_rate
+
+    def advance(self, now: float) -> tuple:
+        """Advances the transition to the given point in time.
+        The progress is derived from the elapsed time, so late or dropped ticks do not stretch the
+        transition. Ticks arriving before the next frame of this transition is due are skipped
+
+        :param now: current time in milliseconds
+        :return: tuple of whether the transition has finished and the rect to repaint (or None)
+        """
+
+        progress = 1.0 if self.duration <= 0 else min(1.0, (now - self.start_time) / self.duration)
+
+        # Allow for some timer jitter so a tick arriving slightly early does not drop a frame
+        if progress < 1.0 and now - self.last_frame_time < self.frame_interval * 0.9:
+            return False, None
+
+        self.last_frame_time = now
+        rect = self.callback(self.easing_curve.valueForProgress(progress))
+        return progress >= 1.0, rect
+
+
+class AnimationScheduler(QObject):
+
+    __instance = None
+
+    @classmethod
+    def instance(cls) -> 'AnimationScheduler':
+        """Get the process-wide scheduler, creating it on first use
+
+        :return: shared scheduler instance
+        """
+
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        """Creates a new AnimationScheduler instance.
+        Usually the shared instance returned by instance() should be used instead."""
+
+        super(AnimationScheduler, self).__init__()
+
+        # Registry of all running transitions (dict keeps them in start order)
+        self.__transitions = {}
+
+        # Single timer advancing every running transition
+        self.__timer = QTimer(self)
+        self.__timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.__timer.timeout.connect(self.__tick)
+
+        # Pending releases of idle transitions (transition -> (deadline, callback))
+        self.__releases = {}
+
+        # Single coarse timer firing at the earliest pending release
+        self.__release_timer = QTimer(self)
+        self.__release_timer.setSingleShot(True)
+        self.__release_timer.timeout.connect(self.__release_idle_transitions)
+
+    def __tick(self):
+        """Method that gets called every time the timer fires.
+        Advances all running transitions and repaints the dirty areas of their widgets in one batch."""
+
+        now = time.perf_counter() * 1000
+        dirty = {}
+        finished = []
+
+        for transition in list(self.__transitions):
+            try:
+                is_finished, rect = transition.advance(now)
+            except RuntimeError:
+                # The underlying C++ widget has been deleted
+                self.__transitions.pop(transition, None)
+                continue
+
+            if is_finished:
+                del self.__transitions[transition]
+                finished.append(transition)
+
+            if rect is not None:
+                key = id(transition.widget)
+                if key in dirty:
+                    dirty[key] = (transition.widget, dirty[key][1].united(rect))
+                else:
+                    dirty[key] = (transition.widget, rect)
+
+        for widget, rect in dirty.values():
+            try:
+                widget.update(rect)
+                if TraceRecorder.recording:
+                    TraceRecorder.instance().record('update', 'i', widget, {
+                        'x': rect.x(), 'y': rect.y(), 'width': rect.width(), 'height': rect.height()})
+            except RuntimeError:
+                pass
+
+        for transition in finished:
+            if transition.finished_callback is not None:
+                try:
+                    transition.finished_callback()
+                except RuntimeError:
+                    pass
+
+        self.__update_interval()
+
+    def __update_interval(self):
+        """Adapts the tick interval to the highest frame rate of all running transitions
+        and stops the timer if no transition is running"""
+
+        if not self.__transitions:
+            self.__timer.stop()
+            return
+
+        interval = max(1, round(min(transition.frame_interval for transition in self.__transitions)))
+        if interval != self.__timer.interval():
+            self.__timer.setInterval(interval)
+        if not self.__timer.isActive():
+            self.__timer.start()
+
+    def __release_idle_transitions(self):
+        """Method that gets called when the earliest pending release is due.
+        Calls the release callbacks of all transitions whose idle period has passed."""
+
+        now = time.perf_counter() * 1000
+
+        for transition, (deadline, callback) in list(self.__releases.items()):
+            if deadline <= now:
+                del self.__releases[transition]
+                try:
+                    callback()
+                except RuntimeError:
+                    pass
+
+        self.__restart_release_timer()
+
+    def __restart_release_timer(self):
+        """Restarts the release timer for the earliest pending release"""
+
+        if self.__releases:
+            deadline = min(deadline for deadline, callback in self.__releases.values())
+            self.__release_timer.start(max(0, math.ceil(deadline - time.perf_counter() * 1000)))
+        else:
+            self.__release_timer.stop()
+
+    def scheduleRelease(self, transition: Transition, delay: int, callback):
+        """Calls a callback once a transition has been idle for the given time.
+        Starting the transition again cancels the pending release.
+
+        :param transition: the idle transition
+        :param delay: idle period in milliseconds
+        :param callback: callable releasing the transition
+        """
+
+        self.__releases[transition] = (time.perf_counter() * 1000 + delay, callback)
+        self.__restart_release_timer()
+
+    def cancelRelease(self, transition: Transition):
+        """Cancels the pending release of a transition
+
+        :param transition: the transition to keep
+        """
+
+        if self.__releases.pop(transition, None) is not None:
+            self.__restart_release_timer()
+
+    def getPendingReleaseCount(self) -> int:
+        """Get the number of idle transitions waiting to be released
+
+        :return: number of pending releases
+        """
+
+        return len(self.__releases)
+
+    def start(self, transition: Transition):
+        """Starts (or restarts) a transition from the beginning
+
+        :param transition: the transition to start
+        """
+
+        self.cancelRelease(transition)
+        transition.start_time = time.perf_counter() * 1000
+        transition.last_frame_time = transition.start_time
+        self.__transitions[transition] = None
+        self.__update_interval()
+
+    def stop(self, transition: Transition):
+        """Stops a transition without advancing it any further
+
+        :param transition: the transition to stop
+        """
+
+        self.__transitions.pop(transition, None)
+        self.__update_interval()
+
+    def isRunning(self, transition: Transition) -> bool:
+        """Get whether a transition is currently running
+
+        :param transition: the transition to check
+        :return: whether the transition is running
+        """
+
+        return transition in self.__transitions
+
+    def getActiveTransitionCount(self) -> int:
+        """Get the number of currently running transitions
+
+        :return: number of running transitions
+        """
+
+        return len(self.__transitions)
+
+    def getInterval(self) -> int:
+        """Get the interval between two ticks
+
+        :return: interval in milliseconds
+        """
+
+        return self.__timer.interval()
@@ -0,0 +1,116 @@
+from collections import OrderedDict
+from qtpy.QtGui import QColor
+
+
+# Number of steps of a color ramp (a ramp holds one more color, including both ends)
+COLOR_RAMP_STEPS = 64
+
+
+def interpolate_color(start: QColor, end: QColor, value: float) -> QColor:
+    """Linearly interpolates between two colors
+
+    :param start: color at value 0.0
+    :param end: color at value 1.0
+    :param value: interpolation value (between 0.0 and 1.0)
+    :return: interpolated color
+    """
+
+    return QColor(round(start.red() + (end.red() - start.red()) * value),
+                  round(start.green() + (end.green() - start.green()) * value),
+                  round(start.blue() + (end.blue() - start.blue()) * value),
+                  round(start.alpha() + (end.alpha() - start.alpha()) * value))
+
+
+def get_ramp_color(ramp: tuple, value: float) -> QColor:
+    """Looks up the color of a ramp closest to an interpolation value
+
+    :param ramp: color ramp returned by ColorRampCache.getRamp()
+    :param value: interpolation value (values outside 0.0 to 1.0, e.g. from overshooting easing curves, are clamped)
+    :return: shared color of the ramp (must not be modified)
+    """
+
+    return ramp[min(COLOR_RAMP_STEPS, max(0, round(value * COLOR_RAMP_STEPS)))]
+
+
+class ColorRampCache:
+
+    __instance = None
+
+    @classmethod
+    def instance(cls) -> 'ColorRampCache':
+        """Get the process-wide cache, creating it on first use
+
+        :return: shared cache instance
+        """
+
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self, maximum_size: int = 256):
+        """Creates a new ColorRampCache instance.
+        Usually the shared instance returned by instance() should be used instead.
+
+        :param maximum_size: maximum number of ramps kept (the least recently used ramps are dropped first)
+        """
+
+        self.__ramps = OrderedDict()
+        self.__maximum_size = maximum_size
+        self.__hits = 0
+        self.__misses = 0
+
+    def getRamp(self, start: QColor, end: QColor) -> tuple:
+        """Get the colors between two colors, computing them on first request.
+        All transitions between the same pair of colors share the very same ramp,
+        so a frame only looks up a color instead of creating one
+
+        :param start: color at the start of the transition
+        :param end: color at the end of the transition
+        :return: tuple of COLOR_RAMP_STEPS + 1 colors (must not be modified)
+        """
+
+        key = (start.rgba(), end.rgba())
+        ramp = self.__ramps.get(key)
+
+        if ramp is not None:
+            self.__hits += 1
+            self.__ramps.move_to_end(key)
+            return ramp
+
+        self.__misses += 1
+        ramp = tuple(interpolate_color(start, end, step / COLOR_RAMP_STEPS) for step in range(COLOR_RAMP_STEPS + 1))
+        self.__ramps[key] = ramp
+
+        if len(self.__ramps) > self.__maximum_size:
+            self.__ramps.popitem(last=False)
+
+        return ramp
+
+    def getHits(self) -> int:
+        """Get the number of requests answered from the cache
+
+        :return: number of cache hits
+        """
+
+        return self.__hits
+
+    def getMisses(self) -> int:
+        """Get the number of requests that had to compute a new ramp
+
+        :return: number of cache misses
+        """
+
+        return self.__misses
+
+    def getSize(self) -> int:
+        """Get the number of cached ramps
+
+        :return: number of ramps
+        """
+
+        return len(self.__ramps)
+
+    def clear(self):
+        """Removes all cached ramps"""
+
+        self.__ramps.clear()
@@ -0,0 +1,222 @@
+from collections import OrderedDict
+from qtpy.QtGui import QFont, QFontMetrics, QPainterPath, QStaticText, QTransform
+from qtpy.QtCore import QRect, Qt
+
+
+class FontCache:
+
+    __instance = None
+
+    @classmethod
+    def instance(cls) -> 'FontCache':
+        """Get the process-wide cache, creating it on first use
+
+        :return: shared cache instance
+        """
+
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self, maximum_size: int = 2048):
+        """Creates a new FontCache instance.
+        Usually the shared instance returned by instance() should be used instead.
+
+        :param maximum_size: maximum number of cached text entries (elided texts, bounds, outlines and static texts)
+        """
+
+        self.__maximum_size = maximum_size
+        self.__fonts = {}
+        self.__font_keys = {}
+        self.__font_metrics = {}
+        self.__entries = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    def internFont(self, font: QFont) -> QFont:
+        """Get the shared instance of a font.
+        Fonts returned by this method are shared and must not be modified
+
+        :param font: font to intern
+        :return: shared font equal to the given font
+        """
+
+        key = self.__get_font_key(font)
+        interned = self.__fonts.get(key)
+
+        if interned is None:
+            interned = QFont(font)
+            self.__fonts[key] = interned
+            self.__font_keys[id(interned)] = (interned, key)
+
+        return interned
+
+    def __get_font_key(self, font: QFont) -> str:
+        """Get the key of a font, looking it up for interned fonts instead of recomputing it
+
+        :param font: font to get the key of
+        :return: font key
+        """
+
+        entry = self.__font_keys.get(id(font))
+
+        # Interned fonts are kept alive by the cache, so their ids cannot be reused by other fonts
+        if entry is not None and entry[0] is font:
+            return entry[1]
+
+        return font.key()
+
+    def getFontMetrics(self, font: QFont) -> QFontMetrics:
+        """Get the shared font metrics of a font
+
+        :param font: font to get the metrics for
+        :return: font metrics
+        """
+
+        key = self.__get_font_key(font)
+        font_metrics = self.__font_metrics.get(key)
+
+        if font_metrics is None:
+            font_metrics = QFontMetrics(font)
+            self.__font_metrics[key] = font_metrics
+
+        return font_metrics
+
+    def __lookup(self, key: tuple, compute):
+        """Get an entry of the bounded LRU cache, computing it on a miss
+
+        :param key: cache key
+        :param compute: callable computing the entry
+        :return: cached or computed entry
+        """
+
+        entry = self.__entries.get(key)
+
+        if entry is not None:
+            self.__hits += 1
+            self.__entries.move_to_end(key)
+            return entry
+
+        self.__misses += 1
+        entry = compute()
+        self.__entries[key] = entry
+
+        if len(self.__entries) > self.__maximum_size:
+            self.__entries.popitem(last=False)
+
+        return entry
+
+    def getElidedText(self, font: QFont, text: str, width: int) -> tuple:
+        """Get a text elided to the available width together with its tight bounding rect.
+        Results are kept in a bounded LRU cache shared by all widgets
+
+        :param font: font used to render the text
+        :param text: text to elide
+        :param width: available width
+        :return: tuple of elided text and its tight bounding rect (must not be modified)
+        """
+
+        def compute():
+            font_metrics = self.getFontMetrics(font)
+            elided_text = font_metrics.elidedText(text, Qt.TextElideMode.ElideRight, width)
+            return elided_text, font_metrics.tightBoundingRect(elided_text)
+
+        return self.__lookup(('elided', self.__get_font_key(font), text, width), compute)
+
+    def getBoundingRect(self, font: QFont, text: str) -> QRect:
+        """Get the bounding rect of a text relative to its baseline origin.
+        Results are kept in the same bounded LRU cache as the elided texts
+
+        :param font: font used to render the text
+        :param text: text to measure
+        :return: bounding rect (must not be modified)
+        """
+
+        return self.__lookup(('bounds', self.__get_font_key(font), text),
+                             lambda: self.getFontMetrics(font).boundingRect(text))
+
+    def getTextPath(self, font: QFont, text: str) -> QPainterPath:
+        """Get the outline of a text with its baseline origin at (0, 0).
+        Results are kept in the same bounded LRU cache as the elided texts
+
+        :param font: font used to lay out the text
+        :param text: text to lay out
+        :return: text outline (must not be modified)
+        """
+
+        def compute():
+            path = QPainterPath()
+            path.addText(0, 0, font, text)
+            return path
+
+        return self.__lookup(('path', self.__get_font_key(font), text), compute)
+
+    def getStaticText(self, font: QFont, text: str) -> QStaticText:
+        """Get a plain text QStaticText prepared for the given font.
+        Results are kept in the same bounded LRU cache as the elided texts
+
+        :param font: font used to lay out the text
+        :param text: text to lay out
+        :return: prepared static text (must not be modified)
+        """
+
+        def compute():
+            static_text = QStaticText(text)
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            static_text.prepare(QTransform(), font)
+            return static_text
+
+        return self.__lookup(('static', self.__get_font_key(font), text), compute)
+
+    def getMaximumSize(self) -> int:
+        """Get the maximum number of cached text entries
+
+        :return: maximum number of cached text entries
+        """
+
+        return self.__maximum_size
+
+    def setMaximumSize(self, maximum_size: int):
+        """Set the maximum number of cached text entries
+
+        :param maximum_size: new maximum number of cached text entries
+        """
+
+        self.__maximum_size = maximum_size
+
+        while len(self.__entries) > self.__maximum_size:
+            self.__entries.popitem(last=False)
+
+    def getHits(self) -> int:
+        """Get the number of text requests answered from the cache
+
+        :return: number of cache hits
+        """
+
+        return self.__hits
+
+    def getMisses(self) -> int:
+        """Get the number of text requests that had to be computed
+
+        :return: number of cache misses
+        """
+
+        return self.__misses
+
+    def getSize(self) -> int:
+        """Get the number of cached text entries
+
+        :return: number of cached text entries
+        """
+
+        return len(self.__entries)
+
+    def clear(self):
+        """Removes all cached fonts, metrics and elided texts and resets the counters"""
+
+        self.__fonts.clear()
+        self.__font_keys.clear()
+        self.__font_metrics.clear()
+        self.__entries.clear()
+        self.__hits = 0
+        self.__misses = 0
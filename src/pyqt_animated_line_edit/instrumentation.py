@@ -0,0 +1,199 @@
+import math
+from collections import deque
+
+
+# Metrics recorded for every transition
+TIMING_METRICS = ('frame_interval', 'paint_duration', 'slot_duration')
+
+
+def percentile(values, percent: float) -> float:
+    """Calculates a percentile using the nearest-rank method
+
+    :param values: measured values
+    :param percent: percentile to calculate (between 0 and 100)
+    :return: percentile of the values (None if there are no values)
+    """
+
+    if not values:
+        return None
+
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def summarize(values) -> dict:
+    """Summarizes measured values
+
+    :param values: measured values
+    :return: dict with the p50, p95 and max of the values (None if there are no values)
+    """
+
+    return {'p50': percentile(values, 50),
+            'p95': percentile(values, 95),
+            'max': max(values) if values else None}
+
+
+class TransitionTimings:
+
+    def __init__(self, name: str):
+        """Creates a new TransitionTimings instance recording the frames of a single transition
+
+        :param name: name of the widget running the transition
+        """
+
+        self.name = name
+        self.frame_count = 0
+        self.frame_intervals = []
+        self.paint_durations = []
+        self.slot_durations = []
+        self.__last_frame_time = None
+
+    def addFrame(self, time: float, slot_duration: float):
+        """Records a frame of the transition
+
+        :param time: time the frame was computed at in milliseconds
+        :param slot_duration: time spent computing the frame in milliseconds
+        """
+
+        if self.__last_frame_time is not None:
+            self.frame_intervals.append(time - self.__last_frame_time)
+
+        self.__last_frame_time = time
+        self.frame_count += 1
+        self.slot_durations.append(slot_duration)
+
+    def addPaint(self, duration: float):
+        """Records a paint event that happened during the transition
+
+        :param duration: time spent painting in milliseconds
+        """
+
+        self.paint_durations.append(duration)
+
+    def getStatistics(self) -> dict:
+        """Get aggregated statistics of the transition
+
+        :return: dict with the frame count and the p50, p95 and max of every metric in milliseconds
+        """
+
+        return {'frame_count': self.frame_count,
+                'frame_interval': summarize(self.frame_intervals),
+                'paint_duration': summarize(self.paint_durations),
+                'slot_duration': summarize(self.slot_durations)}
+
+
+class TimingAggregate:
+
+    def __init__(self, maximum_samples: int = 1000):
+        """Creates a new TimingAggregate instance combining the timings of several transitions
+
+        :param maximum_samples: maximum number of most recent samples kept per metric
+        """
+
+        self.__transition_count = 0
+        self.__frame_count = 0
+        self.__samples = {metric: deque(maxlen=maximum_samples) for metric in TIMING_METRICS}
+
+    def add(self, timings: TransitionTimings):
+        """Adds the timings of a finished transition
+
+        :param timings: timings of the transition
+        """
+
+        self.__transition_count += 1
+        self.__frame_count += timings.frame_count
+        self.__samples['frame_interval'].extend(timings.frame_intervals)
+        self.__samples['paint_duration'].extend(timings.paint_durations)
+        self.__samples['slot_duration'].extend(timings.slot_durations)
+
+    def getStatistics(self) -> dict:
+        """Get aggregated statistics of all added transitions
+
+        :return: dict with the transition and frame counts and the p50, p95 and max of every metric in milliseconds
+        """
+
+        statistics = {'transition_count': self.__transition_count, 'frame_count': self.__frame_count}
+        for metric, samples in self.__samples.items():
+            statistics[metric] = summarize(samples)
+        return statistics
+
+
+class InstrumentationCollector:
+
+    __instance = None
+
+    @classmethod
+    def instance(cls) -> 'InstrumentationCollector':
+        """Get the process-wide collector, creating it on first use
+
+        :return: shared collector instance
+        """
+
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self, maximum_samples: int = 1000):
+        """Creates a new InstrumentationCollector instance.
+        Usually the shared instance returned by instance() should be used instead.
+
+        :param maximum_samples: maximum number of most recent samples kept per metric and widget
+        """
+
+        self.__maximum_samples = maximum_samples
+        self.__total = TimingAggregate(maximum_samples)
+        self.__widgets = {}
+
+    def add(self, timings: TransitionTimings):
+        """Adds the timings of a finished transition of an instrumented widget
+
+        :param timings: timings of the transition
+        """
+
+        self.__total.add(timings)
+
+        aggregate = self.__widgets.get(timings.name)
+        if aggregate is None:
+            aggregate = TimingAggregate(self.__maximum_samples)
+            self.__widgets[timings.name] = aggregate
+        aggregate.add(timings)
+
+    def getStatistics(self) -> dict:
+        """Get aggregated statistics of all instrumented widgets
+
+        :return: dict with the transition and frame counts and the p50, p95 and max of every metric in milliseconds
+        """
+
+        return self.__total.getStatistics()
+
+    def getWidgetStatistics(self) -> dict:
+        """Get aggregated statistics of every instrumented widget
+
+        :return: dict mapping widget names to their statistics
+        """
+
+        return {name: aggregate.getStatistics() for name, aggregate in self.__widgets.items()}
+
+    def getSlowestWidgets(self, count: int = 5, metric: str = 'paint_duration', statistic: str = 'p95') -> list:
+        """Get the widgets with the highest value of a statistic
+
+        :param count: maximum number of widgets to return
+        :param metric: one of frame_interval, paint_duration and slot_duration
+        :param statistic: one of p50, p95 and max
+        :return: list of (name, value) tuples, slowest first
+        """
+
+        values = []
+        for name, statistics in self.getWidgetStatistics().items():
+            value = statistics[metric][statistic]
+            if value is not None:
+                values.append((name, value))
+
+        values.sort(key=lambda item: item[1], reverse=True)
+        return values[:count]
+
+    def clear(self):
+        """Removes all collected timings"""
+
+        self.__total = TimingAggregate(self.__maximum_samples)
+        self.__widgets.clear()
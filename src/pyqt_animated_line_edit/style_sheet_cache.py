@@ -0,0 +1,96 @@
+STYLE_SHEET_TEMPLATE = ('QLineEdit {'
+                        'color: %s;'
+                        'background-color: %s;'
+                        'border: %dpx solid %s;'
+                        'border-radius: %dpx;'
+                        'padding: %d %d %d %dpx;'
+                        '}'
+                        'QLineEdit:hover {'
+                        'color: %s;'
+                        'background-color: %s;'
+                        'border: %dpx solid %s;'
+                        '}'
+                        'QLineEdit:focus {'
+                        'color: %s;'
+                        'background-color: %s;'
+                        'border: %dpx solid %s;'
+                        '}'
+                        'QLineEdit:disabled {'
+                        'color: %s;'
+                        'background-color: %s;'
+                        'border: %dpx solid %s;'
+                        '}')
+
+
+class StyleSheetCache:
+
+    __instance = None
+
+    @classmethod
+    def instance(cls) -> 'StyleSheetCache':
+        """Get the process-wide cache, creating it on first use
+
+        :return: shared cache instance
+        """
+
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        """Creates a new StyleSheetCache instance.
+        Usually the shared instance returned by instance() should be used instead."""
+
+        self.__style_sheets = {}
+        self.__hits = 0
+        self.__misses = 0
+
+    def getStyleSheet(self, style: tuple) -> str:
+        """Get the stylesheet for a resolved style, building it on first request.
+        Identically styled widgets receive the very same string object.
+
+        :param style: resolved style values in the order of STYLE_SHEET_TEMPLATE
+        :return: stylesheet
+        """
+
+        style_sheet = self.__style_sheets.get(style)
+
+        if style_sheet is None:
+            self.__misses += 1
+            style_sheet = STYLE_SHEET_TEMPLATE % style
+            self.__style_sheets[style] = style_sheet
+        else:
+            self.__hits += 1
+
+        return style_sheet
+
+    def getHits(self) -> int:
+        """Get the number of requests answered from the cache
+
+        :return: number of cache hits
+        """
+
+        return self.__hits
+
+    def getMisses(self) -> int:
+        """Get the number of requests that had to build a new stylesheet
+
+        :return: number of cache misses
+        """
+
+        return self.__misses
+
+    def getSize(self) -> int:
+        """Get the number of cached stylesheets
+
+        :return: number of cached stylesheets
+        """
+
+        return len(self.__style_sheets)
+
+    def clear(self):
+        """Removes all cached stylesheets and resets the counters"""
+
+        self.__style_sheets.clear()
+        self.__hits = 0
+        self.__misses = 0
@@ -0,0 +1,141 @@
+import json
+import os
+import time
+from collections import deque
+
+
+class TraceRecorder:
+
+    __instance = None
+
+    # Whether the shared recorder is enabled. Instrumented code paths check this
+    # before doing any work, so a disabled recorder costs a single attribute lookup
+    recording = False
+
+    @classmethod
+    def instance(cls) -> 'TraceRecorder':
+        """Get the process-wide recorder, creating it on first use
+
+        :return: shared recorder instance
+        """
+
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self, capacity: int = 100000):
+        """Creates a new TraceRecorder instance.
+        Usually the shared instance returned by instance() should be used instead.
+
+        :param capacity: maximum number of events kept (the oldest events are dropped first)
+        """
+
+        self.__enabled = False
+        self.__events = deque(maxlen=capacity)
+
+    def isEnabled(self) -> bool:
+        """Get whether events are recorded
+
+        :return: whether the recorder is enabled
+        """
+
+        return self.__enabled
+
+    def setEnabled(self, enable: bool):
+        """Set whether events should be recorded
+
+        :param enable: whether the recorder should be enabled
+        """
+
+        self.__enabled = enable
+        if self is TraceRecorder.__instance:
+            TraceRecorder.recording = enable
+
+    def record(self, name: str, phase: str, widget, args: dict = None):
+        """Records an event with the current monotonic time
+
+        :param name: name of the event
+        :param phase: Chrome trace event phase ('B' for begin, 'E' for end, 'i' for instant events)
+        :param widget: widget the event belongs to
+        :param args: optional additional values of the event
+        """
+
+        self.__events.append((time.perf_counter_ns(), phase, name,
+                              widget.objectName() or '%s@%x' % (type(widget).__name__, id(widget)), args))
+
+    def getCapacity(self) -> int:
+        """Get the maximum number of events kept
+
+        :return: capacity of the ring buffer
+        """
+
+        return self.__events.maxlen
+
+    def setCapacity(self, capacity: int):
+        """Set the maximum number of events kept, keeping the most recent events
+
+        :param capacity: new capacity of the ring buffer
+        """
+
+        self.__events = deque(self.__events, maxlen=capacity)
+
+    def getEventCount(self) -> int:
+        """Get the number of recorded events
+
+        :return: number of events in the ring buffer
+        """
+
+        return len(self.__events)
+
+    def getEvents(self) -> list:
+        """Get the recorded events, oldest first
+
+        :return: list of (timestamp in nanoseconds, phase, name, widget name, args) tuples
+        """
+
+        return list(self.__events)
+
+    def clear(self):
+        """Removes all recorded events"""
+
+        self.__events.clear()
+
+    def toChromeTrace(self) -> dict:
+        """Converts the recorded events to the Chrome trace event format.
+        Every widget is shown on its own track named after the widget
+
+        :return: trace as a JSON serializable dict
+        """
+
+        pid = os.getpid()
+        tracks = {}
+        trace_events = []
+
+        for timestamp, phase, name, widget_name, args in self.__events:
+            tid = tracks.get(widget_name)
+
+            if tid is None:
+                tid = len(tracks) + 1
+                tracks[widget_name] = tid
+                trace_events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                                     'args': {'name': widget_name}})
+
+            trace_event = {'name': name, 'cat': 'AnimatedLineEdit', 'ph': phase, 'ts': timestamp / 1000,
+                           'pid': pid, 'tid': tid}
+            if phase == 'i':
+                trace_event['s'] = 't'
+            if args:
+                trace_event['args'] = args
+            trace_events.append(trace_event)
+
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def export(self, path: str):
+        """Writes the recorded events to a file in the Chrome trace event format,
+        which can be loaded into chrome://tracing or Perfetto
+
+        :param path: path of the JSON file
+        """
+
+        with open(path, 'w') as file:
+            json.dump(self.toChromeTrace(), file)
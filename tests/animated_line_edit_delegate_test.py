@@ -0,0 +1,116 @@
+from PyQt6.QtGui import QColor, QImage, QPainter, QStandardItem, QStandardItemModel
+from PyQt6.QtCore import QRect, Qt
+from PyQt6.QtWidgets import QStyle, QStyleOptionViewItem, QTableView
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+from src.pyqt_animated_line_edit.animated_line_edit_delegate import AnimatedLineEditDelegate, PLACEHOLDER_ROLE
+from src.pyqt_animated_line_edit.animated_line_edit_style import AnimatedLineEditStyle
+
+
+def create_view(qtbot, rows: int = 3) -> tuple:
+    """Creates a shown table view with a single column using the delegate"""
+
+    model = QStandardItemModel(rows, 1)
+    model.setHorizontalHeaderLabels(['Name'])
+    for row in range(rows):
+        model.setItem(row, 0, QStandardItem())
+
+    view = QTableView()
+    qtbot.addWidget(view)
+    delegate = AnimatedLineEditDelegate(view)
+    view.setItemDelegate(delegate)
+    view.setModel(model)
+    view.resize(300, 300)
+    view.show()
+    return view, model, delegate
+
+
+def test_placeholder_text(qtbot):
+    """Test reading the placeholder text from the item data with a fallback to the header"""
+
+    view, model, delegate = create_view(qtbot)
+    model.item(1, 0).setData('First name', PLACEHOLDER_ROLE)
+
+    editor = delegate.createEditor(view.viewport(), QStyleOptionViewItem(), model.index(0, 0))
+    assert editor.getPlaceholderText() == 'Name'
+    editor.deleteLater()
+
+    editor = delegate.createEditor(view.viewport(), QStyleOptionViewItem(), model.index(1, 0))
+    assert editor.getPlaceholderText() == 'First name'
+    editor.deleteLater()
+
+
+def test_editor(qtbot):
+    """Test editing an item with a short-lived AnimatedLineEdit"""
+
+    style = AnimatedLineEditStyle(border_radius=4)
+    view, model, delegate = create_view(qtbot)
+    delegate.setLineEditStyle(style)
+    delegate.setTransitionDuration(100)
+    model.item(0, 0).setText('Text')
+
+    index = model.index(0, 0)
+    editor = delegate.createEditor(view.viewport(), QStyleOptionViewItem(), index)
+
+    assert isinstance(editor, AnimatedLineEdit)
+    assert editor.getLineEditStyle() is style
+    assert editor.getTransitionDuration() == 100
+
+    # Existing text moves the placeholder text to the outside position without a transition
+    delegate.setEditorData(editor, index)
+    assert editor.text() == 'Text'
+    assert editor.isPlaceholderInside() == False
+
+    editor.setText('Changed')
+    delegate.setModelData(editor, model, index)
+    assert model.item(0, 0).text() == 'Changed'
+    editor.deleteLater()
+
+
+def test_no_widgets_per_row(qtbot):
+    """Test that painting many rows does not create any widgets"""
+
+    view, model, delegate = create_view(qtbot, 200)
+    qtbot.waitExposed(view)
+    view.repaint()
+
+    assert not view.viewport().findChildren(AnimatedLineEdit)
+
+    view.edit(model.index(0, 0))
+    assert len(view.viewport().findChildren(AnimatedLineEdit)) == 1
+
+
+def test_paint(qtbot):
+    """Test painting the placeholder text inside empty items and on the border of filled items"""
+
+    style = AnimatedLineEditStyle(background_color=QColor(255, 255, 255), border_color=QColor(0, 0, 0))
+    view, model, delegate = create_view(qtbot, 2)
+    delegate.setLineEditStyle(style)
+    delegate.setPlaceholderColor(QColor(255, 0, 0))
+    model.item(1, 0).setText('Text')
+
+    option = QStyleOptionViewItem()
+    option.font = view.font()
+    option.palette = view.palette()
+    option.state = QStyle.StateFlag.State_Enabled
+    size = delegate.sizeHint(option, model.index(0, 0))
+    option.rect = QRect(0, 0, 200, size.height())
+
+    def render(row: int) -> QImage:
+        image = QImage(200, size.height(), QImage.Format.Format_ARGB32)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        delegate.paint(painter, option, model.index(row, 0))
+        painter.end()
+        return image
+
+    def red_rows(image: QImage) -> list:
+        return [y for y in range(image.height()) for x in range(image.width())
+                if image.pixelColor(x, y).red() > 200 and image.pixelColor(x, y).green() < 100]
+
+    empty = red_rows(render(0))
+    filled = red_rows(render(1))
+
+    assert empty and filled
+    # The placeholder text of the filled item is drawn higher up, on the top border
+    assert max(filled) < max(empty)
+
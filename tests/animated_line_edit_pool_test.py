@@ -0,0 +1,198 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont, QIntValidator
+from PyQt6.QtWidgets import QLineEdit, QWidget
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+from src.pyqt_animated_line_edit.animated_line_edit_pool import AnimatedLineEditPool
+from src.pyqt_animated_line_edit.animated_line_edit_style import AnimatedLineEditStyle
+
+
+def test_reuse(qtbot):
+    """Test handing out released widgets again with reuse statistics"""
+
+    pool = AnimatedLineEditPool()
+    parent = QWidget()
+    qtbot.addWidget(parent)
+
+    widget = pool.acquire('First', parent)
+    assert widget.parent() is parent
+    assert widget.getPlaceholderText() == 'First'
+
+    pool.release(widget)
+    assert widget.parent() is None
+    assert pool.getSize() == 1
+
+    reused = pool.acquire('Second', parent)
+    assert reused is widget
+    assert reused.getPlaceholderText() == 'Second'
+    assert reused.parent() is parent
+    assert pool.getStatistics() == {'created': 1, 'reused': 1, 'released': 1, 'discarded': 0, 'size': 0,
+                                    'reuse_ratio': 0.5}
+
+
+def test_reset(qtbot, animated):
+    """Test that released widgets are handed out without text, running transition or style overrides"""
+
+    style = AnimatedLineEditStyle(border_radius=4)
+    pool = AnimatedLineEditPool(style=style)
+
+    widget = pool.acquire('Test')
+    qtbot.addWidget(widget)
+    widget.show()
+    qtbot.waitExposed(widget)
+    widget.setBorderColor(QColor(255, 0, 0))
+    widget.setFocus()
+    widget.setText('Text')
+    widget.activateWindow()
+
+    pool.release(widget)
+    widget = pool.acquire('Test')
+
+    assert widget.text() == ''
+    assert widget.hasFocus() == False
+    assert widget.isPlaceholderInside() == True
+    assert widget.hasTransition() == False
+    assert widget.getStyleOverrides() == {}
+    assert widget.getLineEditStyle() is style
+
+
+def test_maximum_size(qtbot):
+    """Test deleting released widgets once the pool is full"""
+
+    pool = AnimatedLineEditPool(maximum_size=2)
+    widgets = [pool.acquire('Test %d' % i) for i in range(3)]
+
+    for widget in widgets:
+        pool.release(widget)
+
+    assert pool.getSize() == 2
+    assert pool.getStatistics()['discarded'] == 1
+
+    pool.setMaximumSize(1)
+    assert pool.getSize() == 1
+
+    pool.clear()
+    assert pool.getSize() == 0
+    assert pool.getStatistics()['discarded'] == 3
+
+
+def test_reset_state(qtbot, animated):
+    """Test resetting a widget while its placeholder text is moving outside"""
+
+    line_edit = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit)
+    line_edit.setText('Text')
+    line_edit.resetState('Other')
+
+    assert line_edit.text() == ''
+    assert line_edit.getPlaceholderText() == 'Other'
+    assert line_edit.isPlaceholderInside() == True
+    assert line_edit._AnimatedLineEdit__placeholder_text_current == 'Other'
+
+
+def test_style_sheet_suspended(qtbot):
+    """Test removing the stylesheet while a widget is idle and applying it again"""
+
+    line_edit = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit)
+    style_sheet = line_edit.styleSheet()
+
+    line_edit.setStyleSheetSuspended(True)
+    assert line_edit.styleSheet() == ''
+
+    # Changes while suspended are applied once the stylesheet is back
+    line_edit.setBorderColor(QColor(255, 0, 0))
+    assert line_edit.styleSheet() == ''
+
+    line_edit.setStyleSheetSuspended(False)
+    assert line_edit.styleSheet() != ''
+    assert line_edit.styleSheet() != style_sheet
+
+
+def test_reset_settings(qtbot):
+    """Test that released widgets are handed out with the settings of a new widget"""
+
+    pool = AnimatedLineEditPool()
+    widget = pool.acquire('A')
+    qtbot.addWidget(widget)
+    default_color = widget.getPlaceholderColor()
+    default_font = widget.getPlaceholderFontInner()
+
+    widget.setPlaceholderColor(QColor(255, 0, 0))
+    widget.setPlaceholderColorOutside(QColor(0, 255, 0))
+    widget.setPlaceholderFontSizeInner(20)
+    widget.setTransitionDuration(999)
+    widget.setAnimationFrameRate(30)
+    widget.setPainterRenderingEnabled(True)
+    widget.setInstrumentationEnabled(True)
+    widget.setReadOnly(True)
+
+    pool.release(widget)
+    widget = pool.acquire('B')
+
+    assert widget.getPlaceholderColor() == default_color
+    assert widget.getPlaceholderColorOutside() is None
+    assert widget.getPlaceholderFontInner() == default_font
+    assert widget.getPlaceholderFontOuter() == default_font
+    assert widget.getTransitionDuration() == 250
+    assert widget.getAnimationFrameRate() == AnimatedLineEdit.getDefaultAnimationFrameRate()
+    assert widget.isPainterRenderingEnabled() == False
+    assert widget.isInstrumentationEnabled() == False
+    assert widget.isReadOnly() == False
+    assert widget.styleSheet() != ''
+
+
+def test_reset_widget_properties(qtbot):
+    """Test that released widgets are handed out with the line edit properties of a new widget"""
+
+    pool = AnimatedLineEditPool()
+    parent = QWidget()
+    qtbot.addWidget(parent)
+    font = QFont(parent.font())
+    font.setPointSize(15)
+    parent.setFont(font)
+
+    widget = pool.acquire('A', parent)
+    new_alignment = widget.alignment()
+    widget.setEnabled(False)
+    widget.setEchoMode(QLineEdit.EchoMode.Password)
+    widget.setMaxLength(3)
+    widget.setValidator(QIntValidator())
+    widget.setAlignment(Qt.AlignmentFlag.AlignRight)
+    widget.setObjectName('old')
+    big_font = QFont(widget.font())
+    big_font.setPointSize(20)
+    widget.setFont(big_font)
+
+    pool.release(widget)
+    widget = pool.acquire('B', parent)
+
+    assert widget.isEnabled() == True
+    assert widget.echoMode() == QLineEdit.EchoMode.Normal
+    assert widget.maxLength() == 32767
+    assert widget.validator() is None
+    assert widget.alignment() == new_alignment
+    assert widget.objectName() == ''
+
+    # Fonts are inherited from the new parent like for a new widget
+    assert widget.font().pointSize() == 15
+    assert widget.getPlaceholderFontInner().pointSize() == 15
+    assert widget.getPlaceholderFontOuter().pointSize() == 15
+
+
+def test_release_twice(qtbot):
+    """Test that releasing an idle widget again does not hand it out twice"""
+
+    pool = AnimatedLineEditPool()
+    widget = pool.acquire('Test')
+    qtbot.addWidget(widget)
+
+    pool.release(widget)
+    pool.release(widget)
+    assert pool.getSize() == 1
+
+    first = pool.acquire('Test')
+    second = pool.acquire('Test')
+    qtbot.addWidget(second)
+    assert first is not second
+    assert pool.getStatistics()['reused'] == 1
+    assert pool.getStatistics()['released'] == 1
@@ -0,0 +1,93 @@
+import pytest
+from PyQt6.QtGui import QColor, QPalette
+from PyQt6.QtCore import QMargins
+from PyQt6.QtWidgets import QApplication
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+from src.pyqt_animated_line_edit.animated_line_edit_style import AnimatedLineEditStyle, resolve_style
+
+
+def test_default_values(qtbot):
+    """Test the default values of a new style"""
+
+    style = AnimatedLineEditStyle(border_radius=4)
+
+    assert style.getValue('color') == QColor(0, 0, 0)
+    assert style.getValue('background_color') == QColor(255, 255, 255)
+    assert style.getValue('border_width') == 1
+    assert style.getValue('border_radius') == 4
+    assert style.getValue('padding') == QMargins()
+    assert style.getValue('hovered_color') is None
+    assert AnimatedLineEditStyle.instance() is AnimatedLineEditStyle.instance()
+
+    with pytest.raises(TypeError):
+        AnimatedLineEditStyle(unknown=1)
+
+
+def test_resolve_style(qtbot):
+    """Test resolving the values of all states with fallbacks to the regular values"""
+
+    style = AnimatedLineEditStyle(border_color=QColor(0, 0, 0), focused_border_color=QColor(0, 0, 255),
+                                  disabled_border_width=3, padding=QMargins(1, 2, 3, 4))
+    resolved = resolve_style(style.getValues())
+
+    assert resolved == ('#000000', '#ffffff', 1, '#000000', 0, 2, 3, 4, 1,
+                        '#000000', '#ffffff', 1, '#000000',
+                        '#000000', '#ffffff', 1, '#0000ff',
+                        '#000000', '#ffffff', 3, '#000000')
+    assert style.getResolvedStyle() == resolved
+
+
+def test_apply_style(qtbot):
+    """Test changing several values with a single change notification and stylesheet regeneration"""
+
+    style = AnimatedLineEditStyle()
+    style_sheet = style.getStyleSheet()
+
+    assert style.getStyleSheet() is style_sheet
+
+    with qtbot.waitSignal(style.changed) as blocker:
+        style.applyStyle(border_width=2, hovered_color=QColor(255, 0, 0))
+
+    assert blocker.args[0] == frozenset(('border_width', 'hovered_color'))
+    assert 'border: 2px solid' in style.getStyleSheet()
+    assert style.getStyleSheet() is style.getStyleSheet()
+
+    with pytest.raises(TypeError):
+        style.applyStyle(unknown=1)
+
+    style.setValue('border_width', 3)
+    assert style.getValue('border_width') == 3
+
+
+def test_application_palette_change(qtbot):
+    """Test that the default style follows changes of the application palette"""
+
+    default_style = AnimatedLineEditStyle.instance()
+    line_edit = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit)
+    application_palette = QApplication.palette()
+    palette = QPalette(application_palette)
+    palette.setColor(QPalette.ColorRole.Shadow, QColor(1, 2, 3))
+
+    try:
+        QApplication.setPalette(palette)
+
+        # Getting the default style does not change it
+        assert AnimatedLineEditStyle.instance().getValue('border_color') != QColor(1, 2, 3)
+
+        # Existing widgets follow as soon as the palette change is delivered
+        QApplication.processEvents()
+        assert line_edit.getBorderColor() == QColor(1, 2, 3)
+        assert line_edit.getStyleOverrides() == {}
+        assert default_style.getValue('border_color') == QColor(1, 2, 3)
+
+        other = AnimatedLineEdit('Other')
+        qtbot.addWidget(other)
+        assert other.getBorderColor() == QColor(1, 2, 3)
+        assert other.getStyleOverrides() == {}
+    finally:
+        QApplication.setPalette(application_palette)
+        QApplication.processEvents()
+
+    assert default_style.getValue('border_color') == application_palette.color(QPalette.ColorRole.Shadow)
+    assert line_edit.getBorderColor() == application_palette.color(QPalette.ColorRole.Shadow)
@@ -1,8 +1,17 @@
+import pytest
 from PyQt6.QtGui import QColor, QPalette, QFont, QFocusEvent
 from PyQt6.QtCore import QEasingCurve, QMargins
 from PyQt6.QtTest import QTest
 from pytestqt.qt_compat import qt_api
+from src.pyqt_animated_line_edit import animated_line_edit
 from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+from src.pyqt_animated_line_edit.animated_line_edit_style import AnimatedLineEditStyle
+from src.pyqt_animated_line_edit.animation_scheduler import AnimationScheduler
+from src.pyqt_animated_line_edit.color_ramp import interpolate_color
+from src.pyqt_animated_line_edit.font_cache import FontCache
+from src.pyqt_animated_line_edit.instrumentation import InstrumentationCollector
+from src.pyqt_animated_line_edit.style_sheet_cache import StyleSheetCache
+from src.pyqt_animated_line_edit.trace_recorder import TraceRecorder
 
 
 def test_initial_values(qtbot):
@@ -48,6 +57,7 @@ def test_set_placeholder_text(qtbot):
     line_edit.setPlaceholderText('Placeholder')
 
     assert line_edit.getPlaceholderText() == 'Placeholder'
+    assert line_edit._AnimatedLineEdit__placeholder_text_current == 'Placeholder'
 
 
 def test_set_color(qtbot):
@@ -374,3 +384,651 @@ def test_focus_in_out(qtbot):
 
     # Placeholder text should be in the outside position again
     assert line_edit.isPlaceholderInside() == False
+
+
+def test_interpolate_color():
+    """Test interpolating between two colors"""
+
+    start = QColor(0, 0, 0, 0)
+    end = QColor(255, 100, 50, 255)
+
+    assert interpolate_color(start, end, 0.0) == start
+    assert interpolate_color(start, end, 1.0) == end
+    assert interpolate_color(start, end, 0.5) == QColor(128, 50, 25, 128)
+
+
+def test_set_transition_idle_timeout(qtbot):
+    """Test setting the transition idle timeout"""
+
+    line_edit = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit)
+
+    line_edit.setTransitionIdleTimeout(1000)
+
+    assert line_edit.getTransitionIdleTimeout() == 1000
+
+
+def test_lazy_transition(qtbot, animated):
+    """Test creating the transition on first focus and releasing it when idle"""
+
+    line_edit = AnimatedLineEdit('Test')
+    line_edit.setTransitionDuration(50)
+    line_edit.setTransitionIdleTimeout(50)
+    qtbot.addWidget(line_edit)
+
+    # No transition before the widget is focused for the first time
+    assert line_edit.hasTransition() == False
+
+    focus_event_in = QFocusEvent(QFocusEvent.Type.FocusIn)
+    qt_api.QtWidgets.QApplication.instance().sendEvent(line_edit, focus_event_in)
+
+    assert line_edit.hasTransition() == True
+
+    # Wait for animation to complete and the idle timeout to pass
+    QTest.qWait(250)
+
+    assert line_edit.hasTransition() == False
+    assert line_edit.isPlaceholderInside() == False
+
+
+def test_batch_style_update(qtbot):
+    """Test deferring stylesheet and geometry updates until the batch ends"""
+
+    line_edit = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit)
+
+    style_sheets = []
+    line_edit.setStyleSheet = style_sheets.append
+    calculate_geometry = line_edit._AnimatedLineEdit__calculate_geometry
+    geometry_calls = []
+    line_edit._AnimatedLineEdit__calculate_geometry = lambda: geometry_calls.append(calculate_geometry())
+
+    with line_edit.batchStyleUpdate():
+        line_edit.setColor(QColor(255, 0, 0))
+        line_edit.setBackgroundColor(QColor(0, 255, 0))
+        line_edit.setBorderWidth(3)
+        line_edit.setFocusedBorderWidth(4)
+
+        assert style_sheets == []
+        assert geometry_calls == []
+
+    assert len(style_sheets) == 1
+    assert len(geometry_calls) == 1
+    assert 'border: 3px solid' in style_sheets[0]
+
+
+def test_apply_style(qtbot):
+    """Test applying several style settings at once"""
+
+    line_edit = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit)
+
+    style_sheets = []
+    line_edit.setStyleSheet = style_sheets.append
+
+    color = QColor(255, 0, 0)
+    padding = QMargins(1, 2, 3, 4)
+    line_edit.applyStyle(color=color, border_width=2, padding=padding, hovered_border_color=color)
+
+    assert len(style_sheets) == 1
+    assert line_edit.getColor() == color
+    assert line_edit.getBorderWidth() == 2
+    assert line_edit.getPadding() == padding
+    assert line_edit.getHoveredBorderColor() == color
+
+    with pytest.raises(TypeError):
+        line_edit.applyStyle(unknown=1)
+
+
+def test_painter_rendering(qtbot):
+    """Test painting frame and background with QPainter instead of a stylesheet"""
+
+    line_edit = AnimatedLineEdit('Test')
+    line_edit.resize(100, 40)
+    qtbot.addWidget(line_edit)
+
+    border_color = QColor(255, 0, 0)
+    background_color = QColor(0, 255, 0)
+    line_edit.setBorderColor(border_color)
+    line_edit.setBackgroundColor(background_color)
+    line_edit.setBorderWidth(2)
+    line_edit.setPainterRenderingEnabled(True)
+
+    assert line_edit.isPainterRenderingEnabled() == True
+    assert line_edit.styleSheet() == ''
+
+    # Border and background should be painted in their colors
+    image = line_edit.grab().toImage()
+    top = line_edit.contentsRect().top()
+    assert image.pixelColor(0, top + 10) == border_color
+    assert image.pixelColor(5, top + 10) == background_color
+
+    line_edit.setPainterRenderingEnabled(False)
+
+    assert line_edit.isPainterRenderingEnabled() == False
+    assert 'border: 2px solid #ff0000;' in line_edit.styleSheet()
+
+
+def test_deferred_geometry(qtbot):
+    """Test coalescing geometry calculations while resizing"""
+
+    line_edit = AnimatedLineEdit('Test')
+    line_edit.setDeferredGeometryEnabled(True)
+    qtbot.addWidget(line_edit)
+    line_edit.show()
+    QTest.qWait(10)
+
+    assert line_edit.isDeferredGeometryEnabled() == True
+
+    calculate_geometry = line_edit._AnimatedLineEdit__calculate_geometry
+    geometry_calls = []
+    line_edit._AnimatedLineEdit__calculate_geometry = lambda: geometry_calls.append(calculate_geometry())
+
+    for width in range(100, 200, 10):
+        line_edit.resize(width, 40)
+
+    assert geometry_calls == []
+
+    # Geometry is calculated once the event loop runs
+    QTest.qWait(10)
+
+    assert len(geometry_calls) == 1
+
+
+def test_transition_dirty_rect(qtbot, animated):
+    """Test invalidating only the area around the placeholder during transitions"""
+
+    line_edit = AnimatedLineEdit('Test')
+    line_edit.resize(200, 40)
+    line_edit.setTransitionDuration(50)
+    qtbot.addWidget(line_edit)
+
+    focus_event_in = QFocusEvent(QFocusEvent.Type.FocusIn)
+    qt_api.QtWidgets.QApplication.instance().sendEvent(line_edit, focus_event_in)
+
+    # Wait for animation to complete
+    QTest.qWait(150)
+
+    assert line_edit.isPlaceholderInside() == False
+    assert line_edit.getTransitionRepaintedPixels() > 0
+
+    # A single frame invalidates less than the whole widget
+    dirty_rect = line_edit._AnimatedLineEdit__transition_value_changed(0.5)
+
+    assert 0 < dirty_rect.width() * dirty_rect.height() < line_edit.width() * line_edit.height()
+
+
+def test_border_notch(qtbot):
+    """Test the cached gap in the top border behind the outside placeholder"""
+
+    line_edit = AnimatedLineEdit('A long placeholder text')
+    line_edit.resize(120, 40)
+    qtbot.addWidget(line_edit)
+
+    line_edit.setBorderRadius(20)
+    line_edit.setFocusedBorderWidth(6)
+    notch_rect = line_edit._AnimatedLineEdit__notch_rect
+
+    # The notch covers the whole focused border but stays clear of the rounded corners
+    assert notch_rect.height() == 6
+    assert notch_rect.left() >= 20
+    assert notch_rect.right() <= line_edit.width() - 1 - 20
+
+
+def test_suppressed_frames(qtbot, animated):
+    """Test skipping repaints of frames that look like the previously painted frame"""
+
+    line_edit = AnimatedLineEdit('Test')
+    line_edit.resize(200, 40)
+    qtbot.addWidget(line_edit)
+
+    line_edit._AnimatedLineEdit__start_transition(True, line_edit.getPlaceholderColor())
+
+    assert line_edit._AnimatedLineEdit__transition_value_changed(0.5) is not None
+    assert line_edit._AnimatedLineEdit__transition_value_changed(0.5) is None
+    assert line_edit._AnimatedLineEdit__transition_value_changed(1.0) is not None
+    assert line_edit.getTransitionFramesEmitted() == 2
+    assert line_edit.getTransitionFramesSuppressed() == 1
+
+
+def test_set_animation_frame_rate(qtbot):
+    """Test setting the animation frame rate"""
+
+    line_edit = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit)
+
+    assert line_edit.getAnimationFrameRate() == AnimatedLineEdit.getDefaultAnimationFrameRate()
+
+    line_edit.setAnimationFrameRate(60)
+
+    assert line_edit.getAnimationFrameRate() == 60
+
+    for frame_rate in (0, -25):
+        with pytest.raises(ValueError):
+            line_edit.setAnimationFrameRate(frame_rate)
+
+    assert line_edit.getAnimationFrameRate() == 60
+
+    line_edit.setAnimationFrameRateFromScreen(True)
+
+    assert line_edit.isAnimationFrameRateFromScreen() == True
+    assert line_edit.getAnimationFrameRate() == line_edit.screen().refreshRate()
+
+
+def test_set_default_animation_frame_rate(qtbot):
+    """Test setting the default animation frame rate for all widgets"""
+
+    default_frame_rate = AnimatedLineEdit.getDefaultAnimationFrameRate()
+    line_edit = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit)
+
+    AnimatedLineEdit.setDefaultAnimationFrameRate(10)
+
+    try:
+        assert line_edit.getAnimationFrameRate() == 10
+
+        for frame_rate in (0, -25, None):
+            with pytest.raises(ValueError):
+                AnimatedLineEdit.setDefaultAnimationFrameRate(frame_rate)
+
+        assert line_edit.getAnimationFrameRate() == 10
+    finally:
+        AnimatedLineEdit.setDefaultAnimationFrameRate(default_frame_rate)
+
+
+def test_frame_pacing(qtbot, animated):
+    """Test that a low frame rate emits fewer frames without stretching the transition"""
+
+    line_edit = AnimatedLineEdit('Test')
+    line_edit.resize(200, 40)
+    line_edit.setTransitionDuration(200)
+    line_edit.setAnimationFrameRate(10)
+    qtbot.addWidget(line_edit)
+
+    focus_event_in = QFocusEvent(QFocusEvent.Type.FocusIn)
+    qt_api.QtWidgets.QApplication.instance().sendEvent(line_edit, focus_event_in)
+
+    # Wait for animation to complete
+    QTest.qWait(300)
+
+    assert line_edit.isPlaceholderInside() == False
+    assert line_edit.getTransitionFramesEmitted() + line_edit.getTransitionFramesSuppressed() <= 3
+
+
+def test_reduced_motion(qtbot):
+    """Test snapping the placeholder to its end state without starting a transition"""
+
+    AnimatedLineEdit.setReducedMotion(True)
+
+    try:
+        line_edit = AnimatedLineEdit('Test')
+        qtbot.addWidget(line_edit)
+
+        assert AnimatedLineEdit.isReducedMotion() == True
+
+        focus_event_in = QFocusEvent(QFocusEvent.Type.FocusIn)
+        qt_api.QtWidgets.QApplication.instance().sendEvent(line_edit, focus_event_in)
+
+        # Placeholder text should be in the outside position immediately
+        assert line_edit.isPlaceholderInside() == False
+        assert line_edit.hasTransition() == False
+
+        focus_event_out = QFocusEvent(QFocusEvent.Type.FocusOut)
+        qt_api.QtWidgets.QApplication.instance().sendEvent(line_edit, focus_event_out)
+
+        assert line_edit.isPlaceholderInside() == True
+    finally:
+        AnimatedLineEdit.setReducedMotion(None)
+
+
+def test_reduced_motion_detection(qtbot, monkeypatch):
+    """Test detecting reduced motion from the environment variable"""
+
+    monkeypatch.setenv('PYQT_ANIMATED_LINE_EDIT_REDUCED_MOTION', '1')
+    assert AnimatedLineEdit.isReducedMotion() == True
+
+    monkeypatch.setenv('PYQT_ANIMATED_LINE_EDIT_REDUCED_MOTION', '0')
+    assert AnimatedLineEdit.isReducedMotion() == False
+
+
+def test_instrumentation(qtbot, animated):
+    """Test recording the frame timings of a transition"""
+
+    line_edit = AnimatedLineEdit('Test')
+    line_edit.setObjectName('InstrumentedLineEdit')
+    line_edit.resize(200, 40)
+    line_edit.setTransitionDuration(100)
+    qtbot.addWidget(line_edit)
+    line_edit.show()
+    qtbot.waitExposed(line_edit)
+
+    assert line_edit.isInstrumentationEnabled() == False
+    assert line_edit.getTimingStatistics() is None
+
+    line_edit.setInstrumentationEnabled(True)
+
+    with qtbot.waitSignal(line_edit.transitionTimed, timeout=1000) as blocker:
+        focus_event_in = QFocusEvent(QFocusEvent.Type.FocusIn)
+        qt_api.QtWidgets.QApplication.instance().sendEvent(line_edit, focus_event_in)
+
+    timings = blocker.args[0]
+
+    assert timings is line_edit.getLastTransitionTimings()
+    assert timings.name == 'InstrumentedLineEdit'
+    assert timings.frame_count > 0
+    assert len(timings.slot_durations) == timings.frame_count
+    assert len(timings.frame_intervals) == timings.frame_count - 1
+    assert len(timings.paint_durations) > 0
+
+    statistics = line_edit.getTimingStatistics()
+
+    assert statistics['transition_count'] == 1
+    assert statistics['paint_duration']['p95'] is not None
+    assert 'InstrumentedLineEdit' in InstrumentationCollector.instance().getWidgetStatistics()
+
+
+def test_trace_recorder(qtbot, animated):
+    """Test recording the events of a transition"""
+
+    line_edit = AnimatedLineEdit('Test')
+    line_edit.setObjectName('TracedLineEdit')
+    line_edit.resize(200, 40)
+    line_edit.setTransitionDuration(100)
+    qtbot.addWidget(line_edit)
+    line_edit.show()
+    qtbot.waitExposed(line_edit)
+
+    recorder = TraceRecorder.instance()
+    recorder.clear()
+    recorder.setEnabled(True)
+
+    try:
+        focus_event_in = QFocusEvent(QFocusEvent.Type.FocusIn)
+        qt_api.QtWidgets.QApplication.instance().sendEvent(line_edit, focus_event_in)
+
+        # Wait for animation to complete
+        QTest.qWait(200)
+    finally:
+        recorder.setEnabled(False)
+
+    names = {(name, phase) for timestamp, phase, name, widget_name, args in recorder.getEvents()
+             if widget_name == 'TracedLineEdit'}
+
+    assert ('focusIn', 'i') in names
+    assert ('transitionValueChanged', 'i') in names
+    assert ('update', 'i') in names
+    assert ('paintEvent', 'B') in names
+    assert ('paintEvent', 'E') in names
+
+    # Nothing is recorded while the recorder is disabled
+    count = recorder.getEventCount()
+    line_edit.repaint()
+
+    assert recorder.getEventCount() == count
+    recorder.clear()
+
+
+def test_create_many(qtbot):
+    """Test creating many styled widgets in one pass"""
+
+    parent = qt_api.QtWidgets.QWidget()
+    qtbot.addWidget(parent)
+
+    style = {'border_width': 2, 'border_radius': 4, 'placeholder_font_size_outer': 7,
+             'focused_border_color': QColor(0, 0, 255)}
+    widgets = AnimatedLineEdit.createMany(
+        ['First', 'Second', {'placeholder_text': 'Third', 'border_width': 3, 'placeholder_font_bold': True}],
+        parent, style=style)
+
+    assert [widget.getPlaceholderText() for widget in widgets] == ['First', 'Second', 'Third']
+    assert all(widget.parent() is parent for widget in widgets)
+    assert widgets[0].getBorderWidth() == 2
+    assert widgets[1].getFocusedBorderColor() == QColor(0, 0, 255)
+    assert widgets[2].getBorderWidth() == 3
+    assert widgets[2].getBorderRadius() == 4
+    assert widgets[2].getPlaceholderFontInner().bold() == True
+
+    # Fonts are resolved once and shared by identically styled widgets
+    assert widgets[0]._AnimatedLineEdit__placeholder_font_outer is widgets[1]._AnimatedLineEdit__placeholder_font_outer
+    assert widgets[1].getPlaceholderFontOuter().pointSize() == 7
+
+    # Widgets look exactly like widgets styled setter by setter
+    line_edit = AnimatedLineEdit('Second', parent)
+    line_edit.applyStyle(**style)
+
+    assert widgets[1].styleSheet() == line_edit.styleSheet()
+    assert widgets[1].contentsMargins() == line_edit.contentsMargins()
+    assert widgets[1]._AnimatedLineEdit__notch_rect == line_edit._AnimatedLineEdit__notch_rect
+    assert widgets[1]._AnimatedLineEdit__position_inner == line_edit._AnimatedLineEdit__position_inner
+
+    with pytest.raises(TypeError):
+        AnimatedLineEdit.createMany(['Test'], parent, style={'unknown': 1})
+
+
+def test_create_many_geometry(qtbot, monkeypatch):
+    """Test that createMany() calculates the geometry of every widget exactly once"""
+
+    calls = []
+    calculate_geometry = AnimatedLineEdit._AnimatedLineEdit__calculate_geometry
+
+    def count_calls(self):
+        calls.append(self)
+        calculate_geometry(self)
+
+    monkeypatch.setattr(AnimatedLineEdit, '_AnimatedLineEdit__calculate_geometry', count_calls)
+
+    widgets = AnimatedLineEdit.createMany(['First', 'Second'], style={
+        'border_width': 2, 'border_radius': 4, 'placeholder_font_size_inner': 12, 'padding': QMargins(4, 0, 4, 0)})
+    for widget in widgets:
+        qtbot.addWidget(widget)
+
+    assert calls == widgets
+
+
+def test_create_many_helper_widgets(qtbot):
+    """Test that widgets constructed by a subclass are not left in the deferred state of createMany()"""
+
+    class HelperLineEdit(AnimatedLineEdit):
+
+        def __init__(self, placeholder_text, parent=None):
+            self.helper_before = AnimatedLineEdit('Before')
+            super().__init__(placeholder_text, parent)
+            self.helper_after = AnimatedLineEdit('After')
+
+    widgets = HelperLineEdit.createMany(['First', 'Second'], style={'border_width': 2})
+
+    for widget in widgets:
+        qtbot.addWidget(widget)
+        assert widget._AnimatedLineEdit__style_batch_depth == 0
+        assert widget.styleSheet() != ''
+        assert widget.getBorderWidth() == 2
+
+        for helper in (widget.helper_before, widget.helper_after):
+            qtbot.addWidget(helper)
+            assert helper._AnimatedLineEdit__style_batch_depth == 0
+            assert helper.styleSheet() != ''
+            assert helper.getBorderWidth() == 1
+
+def test_line_edit_style(qtbot):
+    """Test sharing a style between widgets"""
+
+    style = AnimatedLineEditStyle(border_radius=4)
+    widgets = AnimatedLineEdit.createMany(['First', 'Second'], style=style)
+    for widget in widgets:
+        qtbot.addWidget(widget)
+
+    assert style.getWidgetCount() == 2
+    assert all(widget.getLineEditStyle() is style for widget in widgets)
+    assert widgets[0].getBorderRadius() == 4
+    assert widgets[0].getStyleOverrides() == {}
+    assert widgets[0].styleSheet() == widgets[1].styleSheet() == style.getStyleSheet()
+
+    # Values set on a widget override the shared style
+    widgets[1].setBackgroundColor(QColor(255, 0, 0))
+
+    assert widgets[1].getStyleOverrides() == {'background_color': QColor(255, 0, 0)}
+
+    # Changing the style regenerates its stylesheet once and updates all widgets
+    misses = StyleSheetCache.instance().getMisses()
+    style.applyStyle(background_color=QColor(0, 255, 0), border_radius=10)
+
+    assert StyleSheetCache.instance().getMisses() - misses <= 2
+    assert widgets[0].styleSheet() == style.getStyleSheet()
+    assert 'background-color: #00ff00;' in widgets[0].styleSheet()
+    assert 'background-color: #ff0000;' in widgets[1].styleSheet()
+    assert 'border-radius: 10px;' in widgets[1].styleSheet()
+    assert widgets[1]._AnimatedLineEdit__placeholder_text_start == 20
+
+    widgets[1].clearStyleOverrides()
+
+    assert widgets[1].styleSheet() == style.getStyleSheet()
+
+    # Widgets without a style of their own follow the default style
+    widgets[0].setLineEditStyle(None)
+
+    assert widgets[0].getLineEditStyle() is AnimatedLineEditStyle.instance()
+    assert widgets[0].getBorderRadius() == 0
+    assert widgets[0]._AnimatedLineEdit__placeholder_text_start == 15
+    assert style.getWidgetCount() == 1
+
+
+def test_set_text(qtbot, animated):
+    """Test snapping the placeholder text to the outside position when text is set programmatically"""
+
+    line_edit = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit)
+
+    line_edit.setText('Text')
+
+    assert line_edit.isPlaceholderInside() == False
+    assert line_edit.hasTransition() == False
+
+    line_edit.setText('')
+
+    assert line_edit.isPlaceholderInside() == True
+
+    # clear() is not routed through setText()
+    line_edit.setText('abc')
+    line_edit.clear()
+
+    assert line_edit.isPlaceholderInside() == True
+
+    # Neither are calls from C++
+    qt_api.QtWidgets.QLineEdit.setText(line_edit, 'abc')
+
+    assert line_edit.isPlaceholderInside() == False
+
+
+def test_incremental_geometry(qtbot):
+    """Test recalculating only the geometry stages depending on a changed input"""
+
+    line_edit = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit)
+    line_edit.resize(200, 40)
+    line_edit.show()
+    font_cache = FontCache.instance()
+
+    def lookups() -> int:
+        return font_cache.getHits() + font_cache.getMisses()
+
+    # A new height only moves the inside position, no text has to be measured
+    position_inner = line_edit._AnimatedLineEdit__position_inner
+    count = lookups()
+    line_edit.resize(200, 60)
+
+    assert lookups() == count
+    assert line_edit._AnimatedLineEdit__position_inner.y() > position_inner.y()
+
+    # A new outer font size only elides and lays out the outside placeholder text
+    count = lookups()
+    line_edit.setPlaceholderFontSizeOuter(7)
+
+    assert lookups() - count == 2
+
+    # Recalculating without any change measures nothing
+    count = lookups()
+    line_edit._AnimatedLineEdit__calculate_geometry()
+
+    assert lookups() == count
+
+
+def test_geometry_keeps_placeholder_outside(qtbot):
+    """Test that resizing keeps the placeholder text in the outside position"""
+
+    line_edit = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit)
+    line_edit.show()
+    line_edit.setText('Text')
+    line_edit.resize(300, 40)
+
+    assert line_edit.isPlaceholderInside() == False
+    assert line_edit._AnimatedLineEdit__position_current == line_edit._AnimatedLineEdit__position_outer
+
+
+def test_state_color_transition(qtbot, animated):
+    """Test interpolating border and background colors after a state change in painter rendering mode"""
+
+    line_edit = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit)
+    line_edit.setBackgroundColor(QColor(255, 255, 255))
+    line_edit.setDisabledBackgroundColor(QColor(0, 0, 0))
+    line_edit.setPainterRenderingEnabled(True)
+    line_edit.show()
+
+    line_edit.setEnabled(False)
+    transition = line_edit._AnimatedLineEdit__state_transition
+    AnimationScheduler.instance().stop(transition)
+
+    # Frames look up the colors of a ramp shared by all widgets
+    transition.callback(0.5)
+    background_color = line_edit._AnimatedLineEdit__frame_colors[0]
+    assert background_color == QColor(128, 128, 128)
+    assert transition.callback(0.5) is None
+
+    transition.callback(1.0)
+    assert line_edit._AnimatedLineEdit__frame_colors[0] == QColor(0, 0, 0)
+
+    other = AnimatedLineEdit('Other')
+    qtbot.addWidget(other)
+    other.setBackgroundColor(QColor(255, 255, 255))
+    other.setDisabledBackgroundColor(QColor(0, 0, 0))
+    other.setPainterRenderingEnabled(True)
+    other.show()
+    other.setEnabled(False)
+    other_transition = other._AnimatedLineEdit__state_transition
+    AnimationScheduler.instance().stop(other_transition)
+    other_transition.callback(0.5)
+
+    assert other._AnimatedLineEdit__frame_colors[0] is background_color
+
+def test_state_color_transition_paint(qtbot, animated, monkeypatch):
+    """Test that fading frames are drawn directly and only the frame at rest is cached as a pixmap"""
+
+    pixmaps = []
+    get_frame_pixmap = animated_line_edit.get_frame_pixmap
+
+    def count_pixmaps(*args):
+        pixmaps.append(args)
+        return get_frame_pixmap(*args)
+
+    line_edit = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit)
+    line_edit.setDisabledBackgroundColor(QColor(0, 0, 0))
+    line_edit.setPainterRenderingEnabled(True)
+    line_edit.show()
+    qtbot.waitExposed(line_edit)
+    monkeypatch.setattr(animated_line_edit, 'get_frame_pixmap', count_pixmaps)
+
+    line_edit.setEnabled(False)
+    transition = line_edit._AnimatedLineEdit__state_transition
+    assert AnimationScheduler.instance().isRunning(transition) == True
+
+    transition.callback(0.5)
+    line_edit.grab()
+    assert pixmaps == []
+
+    AnimationScheduler.instance().stop(transition)
+    transition.callback(1.0)
+    line_edit.grab()
+    assert len(pixmaps) == 1
+    assert pixmaps[0][-1] == QColor(0, 0, 0)
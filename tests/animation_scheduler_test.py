@@ -0,0 +1,46 @@
+from PyQt6.QtGui import QFocusEvent
+from PyQt6.QtCore import QEasingCurve
+from pytestqt.qt_compat import qt_api
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+from src.pyqt_animated_line_edit.animation_scheduler import AnimationScheduler, Transition
+
+
+def test_shared_instance(qtbot):
+    """Test that all widgets share one scheduler"""
+
+    assert AnimationScheduler.instance() is AnimationScheduler.instance()
+
+
+def test_transition_advance(qtbot):
+    """Test advancing a transition manually"""
+
+    values = []
+    transition = Transition(None, values.append, 100, QEasingCurve.Type.Linear)
+    transition.start_time = 0
+
+    assert transition.advance(50) == (False, None)
+    assert transition.advance(150) == (True, None)
+    assert values == [0.5, 1.0]
+
+
+def test_concurrent_transitions(qtbot, animated):
+    """Test running the transitions of several widgets from the shared scheduler"""
+
+    scheduler = AnimationScheduler.instance()
+    active_count = scheduler.getActiveTransitionCount()
+    line_edits = []
+
+    for i in range(3):
+        line_edit = AnimatedLineEdit('Test')
+        line_edit.setTransitionDuration(100)
+        qtbot.addWidget(line_edit)
+        line_edits.append(line_edit)
+
+        focus_event_in = QFocusEvent(QFocusEvent.Type.FocusIn)
+        qt_api.QtWidgets.QApplication.instance().sendEvent(line_edit, focus_event_in)
+
+    assert scheduler.getActiveTransitionCount() == active_count + 3
+
+    # Wait for animations to complete
+    qtbot.waitUntil(lambda: scheduler.getActiveTransitionCount() == 0, timeout=1000)
+    assert all(not line_edit.isPlaceholderInside() for line_edit in line_edits)
@@ -0,0 +1,24 @@
+from benchmarks.suite import compare, run
+
+
+def test_compare():
+    """Test detecting regressed measurements"""
+
+    baseline = {'paint_event': 50.0, 'construction': 200.0, 'setter.setEasingCurve': 0.2}
+    results = {'paint_event': 80.0, 'construction': 250.0, 'setter.setEasingCurve': 0.6, 'transition': 1000.0}
+
+    # Small absolute differences and measurements without a baseline are ignored
+    assert compare(results, baseline, 1.5) == [('paint_event', 50.0, 80.0)]
+    assert compare(results, baseline, 2.0) == []
+    assert compare(results, {}, 1.5) == []
+
+
+def test_run(qtbot):
+    """Test running every benchmark of the suite once with small counts"""
+
+    results = run(count=2, calls=2, repeat=1, rounds=1)
+
+    assert 'construction' in results
+    assert 'setter.setBorderColor' in results
+    assert 'transition' in results
+    assert all(value > 0 for value in results.values())
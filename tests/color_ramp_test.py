@@ -0,0 +1,46 @@
+from PyQt6.QtGui import QColor
+from src.pyqt_animated_line_edit.color_ramp import COLOR_RAMP_STEPS, ColorRampCache, get_ramp_color
+
+
+def test_ramp(qtbot):
+    """Test computing a ramp between two colors once and sharing it"""
+
+    cache = ColorRampCache()
+    start = QColor(0, 0, 0)
+    end = QColor(255, 128, 64)
+    ramp = cache.getRamp(start, end)
+
+    assert len(ramp) == COLOR_RAMP_STEPS + 1
+    assert ramp[0] == start
+    assert ramp[-1] == end
+    assert cache.getRamp(QColor(0, 0, 0), QColor(255, 128, 64)) is ramp
+    assert cache.getHits() == 1
+    assert cache.getMisses() == 1
+
+
+def test_ramp_color(qtbot):
+    """Test looking up colors of a ramp, clamping values outside the ramp"""
+
+    ramp = ColorRampCache().getRamp(QColor(0, 0, 0), QColor(255, 255, 255))
+
+    assert get_ramp_color(ramp, 0.0) is ramp[0]
+    assert get_ramp_color(ramp, 0.5) == QColor(128, 128, 128)
+    assert get_ramp_color(ramp, 1.0) is ramp[-1]
+    assert get_ramp_color(ramp, -0.2) is ramp[0]
+    assert get_ramp_color(ramp, 1.2) is ramp[-1]
+
+
+def test_maximum_size(qtbot):
+    """Test evicting the least recently used ramps once the cache is full"""
+
+    cache = ColorRampCache(maximum_size=2)
+    first = cache.getRamp(QColor(0, 0, 0), QColor(1, 1, 1))
+    cache.getRamp(QColor(0, 0, 0), QColor(2, 2, 2))
+    cache.getRamp(QColor(0, 0, 0), QColor(1, 1, 1))
+    cache.getRamp(QColor(0, 0, 0), QColor(3, 3, 3))
+
+    assert cache.getSize() == 2
+    assert cache.getRamp(QColor(0, 0, 0), QColor(1, 1, 1)) is first
+
+    cache.clear()
+    assert cache.getSize() == 0
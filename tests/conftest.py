@@ -0,0 +1,11 @@
+import pytest
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+
+
+@pytest.fixture
+def animated():
+    """Disable reduced motion (enabled automatically on the offscreen platform) for a test"""
+
+    AnimatedLineEdit.setReducedMotion(False)
+    yield
+    AnimatedLineEdit.setReducedMotion(None)
@@ -0,0 +1,95 @@
+from PyQt6.QtGui import QFont
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+from src.pyqt_animated_line_edit.font_cache import FontCache
+
+
+def test_intern_font(qtbot):
+    """Test that equal fonts are interned to one shared instance"""
+
+    cache = FontCache()
+    font = cache.internFont(QFont('Arial', 12))
+
+    assert cache.internFont(QFont('Arial', 12)) is font
+    assert cache.internFont(QFont('Arial', 14)) is not font
+
+
+def test_elided_text(qtbot):
+    """Test caching elided texts and their bounding rects"""
+
+    cache = FontCache(maximum_size=2)
+    font = QFont('Arial', 12)
+
+    elided_text, bounds = cache.getElidedText(font, 'Placeholder', 1000)
+
+    assert elided_text == 'Placeholder'
+    assert bounds.width() > 0
+    assert cache.getElidedText(font, 'Placeholder', 1000)[0] is elided_text
+    assert cache.getHits() == 1
+    assert cache.getMisses() == 1
+
+    # Least recently used entries are evicted once the cache is full
+    cache.getElidedText(font, 'Placeholder', 20)
+    cache.getElidedText(font, 'Placeholder', 30)
+
+    assert cache.getSize() == 2
+    cache.getElidedText(font, 'Placeholder', 1000)
+    assert cache.getMisses() == 4
+
+
+def test_shared_fonts(qtbot):
+    """Test that widgets with the same placeholder font share their fonts"""
+
+    line_edit_1 = AnimatedLineEdit('Test')
+    line_edit_2 = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit_1)
+    qtbot.addWidget(line_edit_2)
+
+    line_edit_1.setPlaceholderFontSizeInner(20)
+    line_edit_2.setPlaceholderFontSizeInner(20)
+
+    assert line_edit_1.getPlaceholderFontInner() == line_edit_2.getPlaceholderFontInner()
+    assert line_edit_1._AnimatedLineEdit__placeholder_font_inner is \
+           line_edit_2._AnimatedLineEdit__placeholder_font_inner
+    assert line_edit_1.getPlaceholderFontOuter().pointSize() != 20
+
+
+def test_scaled_placeholder_frames(qtbot):
+    """Test that animated frames reuse the cached placeholder layout instead of resolving new fonts"""
+
+    cache = FontCache.instance()
+    line_edit = AnimatedLineEdit('Test')
+    line_edit.resize(200, 40)
+    line_edit.setPlaceholderFontSizeInner(20)
+    line_edit.setPlaceholderFontSizeOuter(10)
+    qtbot.addWidget(line_edit)
+
+    line_edit._AnimatedLineEdit__start_transition(True, line_edit.getPlaceholderColor())
+    line_edit._AnimatedLineEdit__transition_value_changed(0.1)
+    line_edit.repaint()
+    misses = cache.getMisses()
+
+    for value in (0.2, 0.3, 0.4, 0.5, 0.6, 0.7):
+        line_edit._AnimatedLineEdit__transition_value_changed(value)
+        line_edit.repaint()
+
+    assert cache.getMisses() == misses
+
+
+def test_static_text(qtbot):
+    """Test that placeholder layouts are prepared once and shared between widgets"""
+
+    line_edit_1 = AnimatedLineEdit('Placeholder')
+    line_edit_2 = AnimatedLineEdit('Placeholder')
+    qtbot.addWidget(line_edit_1)
+    qtbot.addWidget(line_edit_2)
+
+    static_text = line_edit_1._AnimatedLineEdit__placeholder_static_text_inner
+
+    assert static_text.text() == 'Placeholder'
+    assert static_text is line_edit_2._AnimatedLineEdit__placeholder_static_text_inner
+
+    # Recalculating the geometry without changes keeps the prepared layout
+    line_edit_1.resize(line_edit_1.size())
+    line_edit_1._AnimatedLineEdit__calculate_geometry()
+
+    assert line_edit_1._AnimatedLineEdit__placeholder_static_text_inner is static_text
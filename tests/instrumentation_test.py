@@ -0,0 +1,70 @@
+from src.pyqt_animated_line_edit.instrumentation import (InstrumentationCollector, TimingAggregate,
+                                                         TransitionTimings, percentile)
+
+
+def test_percentile():
+    """Test calculating percentiles with the nearest-rank method"""
+
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 100) == 100
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) is None
+
+
+def test_transition_timings():
+    """Test recording the frames and paints of a transition"""
+
+    timings = TransitionTimings('Name')
+    timings.addFrame(0.0, 0.1)
+    timings.addFrame(40.0, 0.2)
+    timings.addFrame(90.0, 0.3)
+    timings.addPaint(1.0)
+
+    statistics = timings.getStatistics()
+
+    assert statistics['frame_count'] == 3
+    assert timings.frame_intervals == [40.0, 50.0]
+    assert statistics['frame_interval']['max'] == 50.0
+    assert statistics['slot_duration']['p50'] == 0.2
+    assert statistics['paint_duration'] == {'p50': 1.0, 'p95': 1.0, 'max': 1.0}
+
+
+def test_timing_aggregate():
+    """Test combining the timings of several transitions with a bounded number of samples"""
+
+    aggregate = TimingAggregate(maximum_samples=2)
+
+    for i in range(3):
+        timings = TransitionTimings('Name')
+        timings.addFrame(0.0, float(i))
+        aggregate.add(timings)
+
+    statistics = aggregate.getStatistics()
+
+    assert statistics['transition_count'] == 3
+    assert statistics['frame_count'] == 3
+    assert statistics['slot_duration']['p50'] == 1.0
+    assert statistics['frame_interval']['max'] is None
+
+
+def test_collector():
+    """Test collecting timings per widget and finding the slowest widgets"""
+
+    collector = InstrumentationCollector()
+
+    for name, duration in (('Fast', 1.0), ('Slow', 5.0), ('Fast', 2.0)):
+        timings = TransitionTimings(name)
+        timings.addPaint(duration)
+        collector.add(timings)
+
+    assert collector.getStatistics()['transition_count'] == 3
+    assert collector.getWidgetStatistics()['Fast']['paint_duration']['max'] == 2.0
+    assert collector.getSlowestWidgets(1) == [('Slow', 5.0)]
+
+    collector.clear()
+
+    assert collector.getWidgetStatistics() == {}
+    assert InstrumentationCollector.instance() is InstrumentationCollector.instance()
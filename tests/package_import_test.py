@@ -0,0 +1,37 @@
+import pytest
+import src.pyqt_animated_line_edit as package
+from benchmarks.import_time import PACKAGE, measure_imports
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+from src.pyqt_animated_line_edit.animated_line_edit_delegate import AnimatedLineEditDelegate
+from src.pyqt_animated_line_edit.animated_line_edit_pool import AnimatedLineEditPool
+from src.pyqt_animated_line_edit.animated_line_edit_style import AnimatedLineEditStyle
+
+# Upper bound for importing the package alone (well above the actual cost, which is a few milliseconds)
+IMPORT_TIME_BUDGET = 50000
+
+
+def test_lazy_exports():
+    """Test accessing the public classes through the package"""
+
+    assert package.AnimatedLineEdit is AnimatedLineEdit
+    assert package.AnimatedLineEditStyle is AnimatedLineEditStyle
+    assert package.AnimatedLineEditDelegate is AnimatedLineEditDelegate
+    assert package.AnimatedLineEditPool is AnimatedLineEditPool
+    assert 'AnimatedLineEdit' in dir(package)
+
+    with pytest.raises(AttributeError):
+        package.Unknown
+
+
+def test_import_time():
+    """Test that importing the package neither imports Qt nor exceeds the import time budget"""
+
+    modules = measure_imports('import %s' % PACKAGE)
+
+    assert not [name for name in modules if name.split('.')[0] in ('qtpy', 'PyQt5', 'PyQt6', 'PySide2', 'PySide6')]
+    assert modules[PACKAGE] < IMPORT_TIME_BUDGET
+
+    # The first access of a public class imports the module defining it
+    modules = measure_imports('import %s; %s.AnimatedLineEdit' % (PACKAGE, PACKAGE))
+
+    assert 'qtpy' in modules
@@ -0,0 +1,39 @@
+from PyQt6.QtGui import QColor
+from src.pyqt_animated_line_edit.animated_line_edit import AnimatedLineEdit
+from src.pyqt_animated_line_edit.style_sheet_cache import StyleSheetCache
+
+
+def test_shared_style_sheet(qtbot):
+    """Test that identically styled widgets share one cached stylesheet"""
+
+    cache = StyleSheetCache.instance()
+    cache.clear()
+
+    line_edit_1 = AnimatedLineEdit('Test')
+    line_edit_2 = AnimatedLineEdit('Test')
+    qtbot.addWidget(line_edit_1)
+    qtbot.addWidget(line_edit_2)
+
+    # Widgets following the same shared style get its stylesheet without building it again
+    assert cache.getMisses() <= 1
+    assert line_edit_1.styleSheet() == line_edit_2.styleSheet()
+    misses = cache.getMisses()
+
+    line_edit_1.setColor(QColor(255, 0, 0))
+    line_edit_2.setColor(QColor(255, 0, 0))
+
+    assert cache.getMisses() == misses + 1
+    assert cache.getHits() >= 1
+    assert 'color: #ff0000;' in line_edit_1.styleSheet()
+
+
+def test_clear(qtbot):
+    """Test clearing the cache"""
+
+    cache = StyleSheetCache()
+    cache.getStyleSheet(('#000000', '#ffffff', 1, '#000000', 0, 0, 0, 0, 0) + ('#000000', '#ffffff', 1, '#000000') * 3)
+    cache.clear()
+
+    assert cache.getSize() == 0
+    assert cache.getHits() == 0
+    assert cache.getMisses() == 0
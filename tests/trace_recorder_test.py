@@ -0,0 +1,76 @@
+import json
+from PyQt6.QtWidgets import QWidget
+from src.pyqt_animated_line_edit.trace_recorder import TraceRecorder
+
+
+def test_shared_instance():
+    """Test getting the shared recorder and enabling it"""
+
+    recorder = TraceRecorder.instance()
+
+    assert recorder is TraceRecorder.instance()
+    assert recorder.isEnabled() == False
+    assert TraceRecorder.recording == False
+
+    recorder.setEnabled(True)
+    assert TraceRecorder.recording == True
+
+    recorder.setEnabled(False)
+    assert TraceRecorder.recording == False
+
+    # Only the shared recorder controls the instrumented code paths
+    TraceRecorder().setEnabled(True)
+    assert TraceRecorder.recording == False
+
+
+def test_ring_buffer(qtbot):
+    """Test that only the most recent events are kept"""
+
+    widget = QWidget()
+    widget.setObjectName('Widget')
+    qtbot.addWidget(widget)
+
+    recorder = TraceRecorder(capacity=3)
+
+    for i in range(5):
+        recorder.record('event', 'i', widget, {'index': i})
+
+    assert recorder.getEventCount() == 3
+    assert [event[4]['index'] for event in recorder.getEvents()] == [2, 3, 4]
+
+    recorder.setCapacity(2)
+    assert recorder.getCapacity() == 2
+    assert [event[4]['index'] for event in recorder.getEvents()] == [3, 4]
+
+    recorder.clear()
+    assert recorder.getEventCount() == 0
+
+
+def test_chrome_trace(qtbot, tmp_path):
+    """Test exporting events in the Chrome trace event format"""
+
+    first = QWidget()
+    first.setObjectName('First')
+    second = QWidget()
+    qtbot.addWidget(first)
+    qtbot.addWidget(second)
+
+    recorder = TraceRecorder()
+    recorder.record('paintEvent', 'B', first)
+    recorder.record('paintEvent', 'E', first)
+    recorder.record('focusIn', 'i', second)
+
+    path = tmp_path / 'trace.json'
+    recorder.export(str(path))
+
+    with open(path) as file:
+        trace = json.load(file)
+
+    events = [event for event in trace['traceEvents'] if event['ph'] != 'M']
+    tracks = {event['tid']: event['args']['name'] for event in trace['traceEvents'] if event['ph'] == 'M'}
+
+    assert [event['ph'] for event in events] == ['B', 'E', 'i']
+    assert events[0]['ts'] <= events[1]['ts'] <= events[2]['ts']
+    assert events[2]['s'] == 't'
+    assert tracks[events[0]['tid']] == 'First'
+    assert tracks[events[2]['tid']].startswith('QWidget@')